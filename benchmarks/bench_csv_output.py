@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Rows per second of CSV output modes, 'dict', 'tuples' and 'columns', with and without schema."""
+
+import argparse
+import logging
+import tempfile
+
+from bench_server import csv_body, serve, timed
+from pyfortified_requests import RequestsFortifiedDownload
+from pyfortified_requests.support import (
+    CSV_OUTPUT_COLUMNS,
+    CSV_OUTPUT_DICT,
+    CSV_OUTPUT_TUPLES,
+)
+
+CSV_SCHEMA = {'id': 'int', 'amount': 'float'}
+
+
+def _count(outputs, csv_output):
+    rows = 0
+    for output in outputs:
+        if csv_output == CSV_OUTPUT_DICT:
+            rows += 1
+            continue
+        rows += len(output)
+        if csv_output == CSV_OUTPUT_COLUMNS:
+            output.columns
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=300000)
+    parser.add_argument('--tmp-directory', default=tempfile.gettempdir())
+    args = parser.parse_args()
+
+    url = serve({'/report.csv': ('text/csv', csv_body(args.rows))}) + '/report.csv'
+    download = RequestsFortifiedDownload(logger_level=logging.WARNING)
+
+    for csv_output in (CSV_OUTPUT_DICT, CSV_OUTPUT_TUPLES, CSV_OUTPUT_COLUMNS):
+        for csv_schema in (None, CSV_SCHEMA):
+            readers = (
+                ('stream_csv', lambda: download.stream_csv(
+                    url, None, csv_output=csv_output, csv_schema=csv_schema
+                )),
+                ('request_csv_download', lambda: download.request_csv_download(
+                    'GET', url, 'bench.csv', args.tmp_directory, csv_output=csv_output, csv_schema=csv_schema
+                )),
+            )
+            for name, reader in readers:
+                seconds, rows = timed(lambda: _count(reader(), csv_output))
+                print("{0:<22} {1:<8} schema={2:<5} {3:>9} rows {4:>7.2f}s {5:>10.0f} rows/s".format(
+                    name, csv_output, bool(csv_schema), rows, seconds, rows / seconds
+                ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Scaling of 'csv_parse_file_parallel' across processes, against 'csv.DictReader'."""
+
+import argparse
+import csv
+import os
+import tempfile
+
+from bench_server import timed
+from pyfortified_requests.support import (
+    CSV_OUTPUT_DICT,
+    CSV_OUTPUT_TUPLES,
+    csv_parse_file_parallel,
+)
+
+CSV_HEADER = ['id', 'name', 'amount', 'note']
+
+
+def _write_csv(file_path, rows):
+    with open(file_path, 'w', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(CSV_HEADER)
+        for i in range(rows):
+            # Quoted delimiters and newlines, which range splitting must not break.
+            writer.writerow([i, 'name {0}'.format(i), '{0}.5'.format(i), 'x,y' if i % 7 else 'multi\nline'])
+    with open(file_path, 'rb') as csv_file:
+        return len(csv_file.readline())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--processes', type=int, nargs='*', default=None,
+                        help='Process counts, default 1, 2, 4, ... up to CPU count.')
+    args = parser.parse_args()
+
+    cpu_count = os.cpu_count() or 1
+    processes_list = args.processes
+    if not processes_list:
+        processes_list = [1]
+        while processes_list[-1] * 2 <= max(cpu_count, 2):
+            processes_list.append(processes_list[-1] * 2)
+
+    with tempfile.TemporaryDirectory() as tmp_directory:
+        file_path = os.path.join(tmp_directory, 'bench.csv')
+        start = _write_csv(file_path, args.rows)
+        print("{0} rows, {1} MB, {2} CPUs".format(args.rows, os.path.getsize(file_path) >> 20, cpu_count))
+
+        def dict_reader():
+            with open(file_path, newline='') as csv_file:
+                return sum(1 for _ in csv.DictReader(csv_file))
+
+        seconds, rows = timed(dict_reader, repeat=1)
+        print("{0:<30} {1:>7.2f}s {2:>10.0f} rows/s".format('csv.DictReader', seconds, rows / seconds))
+
+        for csv_output in (CSV_OUTPUT_DICT, CSV_OUTPUT_TUPLES):
+            baseline = None
+            for processes in processes_list:
+                def parse():
+                    outputs = csv_parse_file_parallel(
+                        file_path, CSV_HEADER, start=start, encoding='utf-8', csv_output=csv_output, processes=processes
+                    )
+                    return sum(1 if csv_output == CSV_OUTPUT_DICT else len(output) for output in outputs)
+
+                seconds, rows = timed(parse, repeat=1)
+                baseline = baseline or seconds
+                print("{0:<30} {1:>7.2f}s {2:>10.0f} rows/s  x{3:.2f}".format(
+                    "parallel {0} processes={1}".format(csv_output, processes), seconds, rows / seconds, baseline / seconds
+                ))
+
+
+if __name__ == '__main__':
+    main()
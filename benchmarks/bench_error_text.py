@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Text extraction of large HTML and XML error pages, against BeautifulSoup and xmltodict."""
+
+import argparse
+
+from bench_server import timed
+from pyfortified_requests.support import (
+    html_text_lines,
+    xml_text_lines,
+)
+
+
+def _html_page(paragraphs):
+    return (
+        '<html><head><title>502 Bad Gateway</title><style>p { color: red; }</style>'
+        '<script>var trace = "' + 'x' * 1000 + '";</script></head><body>'
+        + ''.join('<div><p>Upstream error {0}:  <b>timeout</b>\n</p></div>'.format(i) for i in range(paragraphs))
+        + '</body></html>'
+    )
+
+
+def _xml_page(elements):
+    return (
+        '<?xml version="1.0"?><Error><Code>ServiceUnavailable</Code>'
+        + ''.join('<Detail><Id>{0}</Id><Message>Slow down</Message></Detail>'.format(i) for i in range(elements))
+        + '</Error>'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--elements', type=int, default=50000)
+    args = parser.parse_args()
+
+    html = _html_page(args.elements)
+    xml = _xml_page(args.elements)
+    print("HTML {0} KB, XML {1} KB".format(len(html) >> 10, len(xml) >> 10))
+
+    cases = [
+        ('html_text_lines', lambda: html_text_lines(html)),
+        ('xml_text_lines', lambda: xml_text_lines(xml)),
+    ]
+    try:
+        from bs4 import BeautifulSoup
+        cases.append(('BeautifulSoup.get_text', lambda: BeautifulSoup(html, 'html.parser').get_text()))
+    except ImportError:
+        print("BeautifulSoup: not installed")
+    try:
+        import xmltodict
+        cases.append(('xmltodict.parse', lambda: xmltodict.parse(xml)))
+    except ImportError:
+        print("xmltodict: not installed")
+
+    for name, func in cases:
+        seconds, _ = timed(func)
+        print("{0:<24} {1:>7.3f}s".format(name, seconds))
+
+
+if __name__ == '__main__':
+    main()
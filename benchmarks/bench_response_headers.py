@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Per-response CPU of 'response_headers_snapshot' against a JSON round trip of headers."""
+
+import argparse
+import timeit
+
+import requests
+import ujson as json
+from requests.structures import CaseInsensitiveDict
+
+from pyfortified_requests.support import response_headers_snapshot
+
+HEADERS = {
+    'Content-Type': 'application/json',
+    'Content-Length': '1234',
+    'Date': 'Mon, 19 Oct 2026 00:00:00 GMT',
+    'Server': 'nginx',
+    'Set-Cookie': 'session=secret; Path=/',
+    'Cache-Control': 'no-cache',
+    'X-Request-Id': 'abc-123',
+    'ETag': '"deadbeef"',
+    'Vary': 'Accept-Encoding',
+    'Connection': 'keep-alive',
+}
+
+
+def _response():
+    response = requests.Response()
+    response.status_code = 200
+    response.headers = CaseInsensitiveDict(HEADERS)
+    return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=100000)
+    args = parser.parse_args()
+
+    response = _response()
+    try:
+        from safe_cast import safe_dict
+    except ImportError:
+        safe_dict = dict
+
+    # Snapshot is cached per response: first snapshot of each is timed on fresh responses.
+    responses = iter([_response() for _ in range(args.number)])
+
+    cases = (
+        ('json round trip + safe_dict', 3, lambda: safe_dict(json.loads(json.dumps(dict(response.headers))))),
+        ('snapshot, first', 1, lambda: response_headers_snapshot(next(responses))),
+        ('snapshot, cached', 3, lambda: response_headers_snapshot(response)),
+    )
+    for name, repeat, func in cases:
+        usecs = min(timeit.repeat(func, number=args.number, repeat=repeat)) / args.number * 1e6
+        print("{0:<28} {1:>7.2f} us".format(name, usecs))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Local HTTP server and timer shared by benchmarks."""
+
+import http.server
+import threading
+import time
+
+
+class _BodyHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        content_type, body = self.server.routes[self.path.split('?')[0]]
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(routes):
+    """Serve fixed bodies in a background thread.
+
+    Args:
+        routes: Dictionary of path to (content type, body bytes).
+
+    Returns:
+        Base URL, e.g. 'http://127.0.0.1:8080'.
+    """
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _BodyHandler)
+    server.routes = routes
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return 'http://127.0.0.1:{0}'.format(server.server_address[1])
+
+
+def timed(func, repeat=3):
+    """Best of 'repeat' runs of 'func'.
+
+    Returns:
+        Tuple of seconds, and result of last run.
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def csv_body(rows):
+    """CSV report of 'rows' rows, with quoted values."""
+    return b'id,name,amount,date\n' + b''.join(
+        b'%d,"name %d",%d.5,2020-01-01\n' % (i, i, i) for i in range(rows)
+    )
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Throughput of 'stream_csv' against 'csv.DictReader' over the same bytes in memory."""
+
+import argparse
+import csv
+import io
+import logging
+
+from bench_server import csv_body, serve, timed
+from pyfortified_requests import RequestsFortifiedDownload
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=300000)
+    args = parser.parse_args()
+
+    body = csv_body(args.rows)
+    url = serve({'/report.csv': ('text/csv', body)})
+    download = RequestsFortifiedDownload(logger_level=logging.WARNING)
+
+    def dict_reader():
+        return sum(1 for _ in csv.DictReader(io.StringIO(body.decode('utf-8'), newline='')))
+
+    def stream_csv():
+        return sum(1 for _ in download.stream_csv(url + '/report.csv', None))
+
+    for name, func in (('csv.DictReader (in memory)', dict_reader), ('stream_csv', stream_csv)):
+        seconds, rows = timed(func)
+        print("{0:<28} {1:>9} rows {2:>7.2f}s {3:>10.0f} rows/s".format(name, rows, seconds, rows / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -49,4 +49,10 @@ class RequestsFortifiedErrorCodes(HttpStatusCode):
 
     REQ_ERR_CONNECT = 615  # Connection Error originating from a python builtins.py exception
 
+    REQ_ERR_UPLOAD_CHECKSUM = 616  # Upload checksum does not match checksum returned by server
+
+    REQ_ERR_BODY_NOT_REPLAYABLE = 617  # Request body cannot be sent again by retry
+
+    REQ_ERR_DEADLINE_EXCEEDED = 618  # Total time budget of request exhausted
+
     REQ_ERR_UNEXPECTED = 699  # Unexpected Error
@@ -23,6 +23,9 @@ REQUESTS_FORTIFIED_ERROR_NAME_DICT = {
     612: 'Auth JSON Error',
     613: 'Auth Response Error',
     614: 'JSON Decoding Error',
+    616: 'Upload Checksum Error',
+    617: 'Request Body Not Replayable',
+    618: 'Request Deadline Exceeded',
     699: 'Unexpected Error'
 }
 
@@ -44,6 +47,9 @@ REQUESTS_FORTIFIED_ERROR_DESC_DICT = {
     612: 'Auth JSON Error',
     613: 'Auth Response Error',
     614: 'JSON Decoding Error',
+    616: 'Upload checksum does not match server',
+    617: 'Request body cannot be sent again by retry',
+    618: 'Total time budget of request exhausted',
     699: 'Unexpected Error'
 }
 
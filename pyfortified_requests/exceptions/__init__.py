@@ -11,4 +11,6 @@ from .custom import (
     RequestsFortifiedModuleError,
     RequestsFortifiedValueError,
     RequestsFortifiedAuthenticationError,
+    RequestsFortifiedBodyNotReplayableError,
+    RequestsFortifiedDeadlineExceededError,
 )
@@ -7,7 +7,6 @@ from pyfortified_requests import (__title__)
 from pyfortified_requests.errors import (RequestsFortifiedErrorCodes)
 from pyfortified_requests.errors import error_desc as requests_fortified_error_desc
 from pyfortified_requests.errors import error_name as requests_fortified_error_name
-from safe_cast import safe_str
 
 # from pprintpp import pprint
 
@@ -121,6 +120,8 @@ class RequestsFortifiedBaseError(Exception):
 
         error_message_prefix_ = "{0}: {1}".format(error_code, exit_code_description_)
 
+        # 'safe_cast' imports NumPy, so it is only imported once an error is raised.
+        from safe_cast import safe_str
         error_message = safe_str(error_message).strip()
 
         if error_message:
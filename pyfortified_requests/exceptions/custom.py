@@ -47,3 +47,21 @@ class RequestsFortifiedAuthenticationError(RequestsFortifiedModuleError):
         error_code = kwargs.pop('error_code', None) or \
                      RequestsFortifiedErrorCodes.REQ_ERR_AUTH_ERROR
         super(RequestsFortifiedAuthenticationError, self).__init__(error_code=error_code, **kwargs)
+
+
+class RequestsFortifiedBodyNotReplayableError(RequestsFortifiedModuleError):
+    """Request Mv Integration: Request body cannot be sent again by retry"""
+
+    def __init__(self, **kwargs):
+        error_code = kwargs.pop('error_code', None) or \
+                     RequestsFortifiedErrorCodes.REQ_ERR_BODY_NOT_REPLAYABLE
+        super(RequestsFortifiedBodyNotReplayableError, self).__init__(error_code=error_code, **kwargs)
+
+
+class RequestsFortifiedDeadlineExceededError(RequestsFortifiedModuleError):
+    """Request Mv Integration: Total time budget of request exhausted"""
+
+    def __init__(self, **kwargs):
+        error_code = kwargs.pop('error_code', None) or \
+                     RequestsFortifiedErrorCodes.REQ_ERR_DEADLINE_EXCEEDED
+        super(RequestsFortifiedDeadlineExceededError, self).__init__(error_code=error_code, **kwargs)
@@ -4,7 +4,6 @@
 
 import copy
 import datetime as dt
-import ujson as json
 import logging
 import os
 import time
@@ -16,13 +15,6 @@ from pyfortified_logging import (
     LoggingFormat,
     LoggingOutput
 )
-from pyhttpstatus_utils import (
-    HttpStatusType,
-    get_http_status_desc,
-    get_http_status_type,
-    is_http_status_type,
-)
-from pyhttpstatus_utils import HttpStatusCode
 from urllib3.exceptions import (
     InsecureRequestWarning,
 )
@@ -38,25 +30,40 @@ from pyfortified_requests.errors import (
 )
 from pyfortified_requests.exceptions import (
     RequestsFortifiedBaseError,
-    RequestsFortifiedClientError,
     RequestsFortifiedServiceError,
     RequestsFortifiedModuleError,
     RequestsFortifiedValueError,
 )
 from pyfortified_requests.support import (
     REQUEST_RETRY_EXCPS,
+    REQUEST_BODY_REPLAY_SIZE,
     REQUEST_RETRY_HTTP_STATUS_CODES,
+    REQUEST_TIMEOUT_TYPES,
+    request_timeout,
+    RequestBodyRewind,
     RequestsSessionClient,
     __USER_AGENT__,
+    response_content_length,
+    response_headers_snapshot,
     base_class_name,
     build_response_error_details,
     command_line_request_curl,
+    Deadline,
+    HEDGE_BUDGET,
+    hedge_delay,
+    hedged_call,
+    HedgeBudget,
+    http_status_class,
+    is_hedge_body,
+    is_connect_phase_exception,
+    is_idempotent_method,
+    set_idempotency_key,
+    ERROR_BODY_LIMIT,
     env_usage,
     python_check_version,
     Metrics,
 )
-
-from safe_cast import (
+from pyfortified_requests.support.lazy_import import (
     safe_dict,
     safe_str,
 )
@@ -95,6 +102,7 @@ class RequestsFortified(object):
     __logger = None
 
     _metrics = Metrics()
+    _hedge_budget = HedgeBudget()
 
     def export_metrics_in_statsd_format(self):
         return self._metrics.dict()
@@ -187,6 +195,22 @@ class RequestsFortified(object):
         self.retry_max_delay = None
         self.retry_backoff = 0
         self.retry_jitter = 0
+        self.retry_body_replay_size = REQUEST_BODY_REPLAY_SIZE
+        self.retry_idempotent = None
+        self.retry_idempotency_key = None
+        self.retry_hedge_percentile = None
+        self.retry_hedge_delay = None
+        self.retry_hedge_budget = HEDGE_BUDGET
+
+        # Total time budget of current request, see request_retry 'total_timeout'.
+        self.retry_deadline = None
+
+        # Whether current request may be sent again after it was sent,
+        # see request_retry 'idempotent'.
+        self.request_idempotent = True
+
+        # Maximum bytes of an error response body captured in error details.
+        self.error_body_limit = ERROR_BODY_LIMIT
 
     def _prep_request_retry(self, request_retry=None, request_retry_http_status_codes=None):
         self.timeout = self._REQUEST_CONFIG['timeout']
@@ -194,12 +218,22 @@ class RequestsFortified(object):
         self.retry_delay = self._REQUEST_CONFIG['delay']
 
         if request_retry:
-            self.timeout = request_retry.get('timeout', self._REQUEST_CONFIG['timeout'])
+            self.timeout = request_timeout(
+                request_retry.get('timeout', self._REQUEST_CONFIG['timeout']),
+                connect_timeout=request_retry.get('connect_timeout', None),
+                read_timeout=request_retry.get('read_timeout', None),
+            )
             self.retry_tries = request_retry.get('tries', self._REQUEST_CONFIG['tries'])
             self.retry_delay = request_retry.get('delay', self._REQUEST_CONFIG['delay'])
             self.retry_max_delay = request_retry.get('max_delay', None)
             self.retry_backoff = request_retry.get('backoff', 0)
             self.retry_jitter = request_retry.get('jitter', 0)
+            self.retry_body_replay_size = request_retry.get('body_replay_size', REQUEST_BODY_REPLAY_SIZE)
+            self.retry_idempotent = request_retry.get('idempotent', None)
+            self.retry_idempotency_key = request_retry.get('idempotency_key', None)
+            self.retry_hedge_percentile = request_retry.get('hedge_percentile', None)
+            self.retry_hedge_delay = request_retry.get('hedge_delay', None)
+            self.retry_hedge_budget = request_retry.get('hedge_budget', HEDGE_BUDGET)
 
         self.request_retry_http_status_codes = \
             request_retry_http_status_codes or REQUEST_RETRY_HTTP_STATUS_CODES
@@ -261,6 +295,12 @@ class RequestsFortified(object):
             Exception: Upon error within this request_method.
 
         Notes:
+            * timeout: seconds to connect, and then between bytes read,
+                or (connect, read) tuple. default: 60.
+            * connect_timeout: seconds to connect, instead of timeout.
+                default: None (timeout).
+            * read_timeout: seconds between bytes read, instead of
+                timeout. default: None (timeout).
             * tries: the maximum number of attempts. default: 1.
             * delay: initial delay between attempts. default: 1.
             * max_delay: the maximum value of delay. default: None (no limit).
@@ -268,6 +308,41 @@ class RequestsFortified(object):
                 default: 1 (no backoff).
             * jitter: extra seconds added to delay between attempts.
                 default: 0.
+            * body_replay_size: bytes of a non-seekable body (iterable,
+                generator, stream) kept to send it again upon retry.
+                Seekable file-like bodies are rewound instead.
+                default: 8 MiB.
+            * idempotent: whether request may be sent again once it was
+                sent, e.g. after a read timeout or an error response.
+                If not, it is only retried upon failures to connect.
+                default: None (by method: GET, HEAD, OPTIONS, TRACE, PUT
+                and DELETE are; POST and PATCH are not; True with
+                idempotency_key).
+            * idempotency_key: True to send a generated 'Idempotency-Key'
+                header, or key to send; the same for all attempts.
+                default: None (no header).
+            * hedge_percentile: hedge idempotent requests: if no response
+                arrived within this percentile of recent request latency,
+                send the request again, and take the first successful
+                response. default: None (no hedging).
+            * hedge_delay: seconds before hedging, used until there are
+                enough latency samples, or without hedge_percentile.
+                default: None.
+            * hedge_budget: hedges allowed per request sent, shared by
+                all clients. default: 0.1.
+            * total_timeout: seconds for the request overall, across
+                attempts and delays; the timeout of each attempt shrinks
+                to fit. Once exhausted, or if a delay would exhaust it,
+                RequestsFortifiedDeadlineExceededError (618) is raised.
+                default: None (no limit).
+            * deadline: :class:`Deadline` shared with a caller, instead
+                of total_timeout.
+            * idle_timeout: downloads of :class:`RequestsFortifiedDownload`
+                only: seconds throughput of a streamed response may stay
+                below idle_min_rate, before it is aborted and the download
+                restarted from its start (not resumed), see
+                :class:`StreamWatchdog`. default: None.
+            * idle_min_rate: bytes per second. default: 1.
         """
         if request_label is None:
             request_label = 'Request'
@@ -298,12 +373,14 @@ class RequestsFortified(object):
             request_retry['delay'] = self._REQUEST_CONFIG['delay']
 
         self._prep_request_retry(request_retry, request_retry_http_status_codes)
+        self.retry_deadline = Deadline.from_request_retry(request_retry)
 
         if not self.requests_session_client:
             self.requests_session_client = RequestsSessionClient(
                 retry_tries=self.retry_tries,
                 retry_backoff=self.retry_backoff,
-                retry_codes=self.request_retry_http_status_codes
+                retry_codes=self.request_retry_http_status_codes,
+                timeout=self.timeout
             )
 
         key_user_agent = 'User-Agent'
@@ -315,6 +392,17 @@ class RequestsFortified(object):
         else:
             request_headers = header_user_agent
 
+        # Copied, so a headers dictionary reused by the caller does not carry
+        # the key on to its next logical request.
+        if self.retry_idempotency_key:
+            request_headers = dict(request_headers)
+            set_idempotency_key(request_headers, self.retry_idempotency_key)
+
+        if self.retry_idempotent is not None:
+            self.request_idempotent = self.retry_idempotent
+        else:
+            self.request_idempotent = bool(self.retry_idempotency_key) or is_idempotent_method(request_method)
+
         kwargs = {
             'request_method': request_method,
             'request_url': request_url,
@@ -476,7 +564,9 @@ class RequestsFortified(object):
                 status_codes = [int(s) for s in response_err.args[0].split() if s.isdigit()]
                 if len(status_codes) == 1:
                     http_status_code = status_codes[0]
-                    http_status_type = get_http_status_type(http_status_code)
+                    http_status = http_status_class(
+                        http_status_code, self.requests_session_client.http_status_classes
+                    )
                     error_kwargs = {
                         'errors': ex_req_adapter_retry,
                         'error_code': http_status_code,
@@ -489,10 +579,9 @@ class RequestsFortified(object):
                         "{0}: Exception: Requests: RetryError: Max".format(request_label),
                         extra=error_kwargs
                     )
-                    if http_status_type == HttpStatusType.CLIENT_ERROR:
-                        raise RequestsFortifiedClientError(**error_kwargs)
-                    elif http_status_type == HttpStatusType.SERVER_ERROR:
-                        raise RequestsFortifiedServiceError(**error_kwargs)
+                    # Retries exhausted of a status the session retries.
+                    if http_status.retryable and http_status.error_class_type is not None:
+                        raise http_status.error_class_type(**error_kwargs)
 
             # THIS BLOCK SHOULD NOT BE ACTUALLY ACCESSED. IF IT DOES LOOK INTO IT:
             self.logger.error(
@@ -561,7 +650,7 @@ class RequestsFortified(object):
             fargs: the positional arguments of the function to execute.
             fkwargs: the named arguments of the function to execute.
             timeout: (optional) How long to wait for the server to send
-                data before giving up.
+                data before giving up, or (connect, read) tuple.
             request_retry_func: (optional) Retry alternative to request_retry_excps.
 
             retry_tries: the maximum number of attempts.
@@ -607,12 +696,23 @@ class RequestsFortified(object):
 
         request_url = kwargs['request_url'] if kwargs and 'request_url' in kwargs else ''
 
+        # Body is rewound, or replayed from buffer, before each retry;
+        # with a single attempt it is sent as is, not buffered.
+        request_body = None
+        if kwargs.get('request_data') is not None and self.retry_tries != 1:
+            request_body = RequestBodyRewind(kwargs['request_data'], self.retry_body_replay_size)
+            kwargs['request_data'] = request_body.body
+
         _attempts = 0
         _tries, _delay, _timeout = self.retry_tries, self.retry_delay, self.timeout
         while _tries:
             _attempts += 1
 
-            kwargs['timeout'] = _timeout
+            if self.retry_deadline is not None:
+                self._check_deadline(request_url, request_label=request_label)
+                kwargs['timeout'] = self.retry_deadline.timeout(_timeout)
+            else:
+                kwargs['timeout'] = _timeout
             request_func = partial(call_func, *args, **kwargs)
 
             self.logger.debug(
@@ -653,10 +753,29 @@ class RequestsFortified(object):
                 raise to_raise_exception
 
             if to_return_response:
-                #self._metrics.add_sample('api_request.response_size', len(to_return_response.content))
+                response_size = response_content_length(to_return_response)
+                if response_size is not None:
+                    self._metrics.add_sample('api_request.response_size', response_size)
                 self._metrics.inc('api_request.success')
                 return to_return_response
 
+            if request_body is not None:
+                try:
+                    kwargs['request_data'] = request_body.rewind()
+                except RequestsFortifiedBaseError as tmv_ex:
+                    self.logger.error(
+                        "{0}: Request Retry: Body Not Replayable".format(request_label),
+                        extra={
+                            'body_replay_size': self.retry_body_replay_size,
+                            'request_url': request_url
+                        }
+                    )
+                    self._metrics.inc('api_request.failure')
+                    raise tmv_ex
+
+            if self.retry_deadline is not None:
+                self._check_deadline(request_url, delay=_delay, request_label=request_label)
+
             self.logger.info(
                 "%s: Request Retry: Performing" % request_label,
                 extra={
@@ -678,6 +797,23 @@ class RequestsFortified(object):
             if self.retry_max_delay is not None:
                 _delay = min(_delay, self.retry_max_delay)
 
+    def _check_deadline(self, request_url, delay=0, request_label=None):
+        """Raise if total time budget of request is exhausted, or would be after delay.
+        """
+        try:
+            self.retry_deadline.check(request_label, delay=delay)
+        except RequestsFortifiedBaseError as tmv_ex:
+            self.logger.error(
+                "{0}: Request Retry: Deadline Exceeded".format(request_label),
+                extra={
+                    'total_timeout': self.retry_deadline.total_timeout,
+                    'delay': delay,
+                    'request_url': request_url
+                }
+            )
+            self._metrics.inc('api_request.failure')
+            raise tmv_ex
+
     def try_send_request(self, attempts, tries, request_func, request_retry_func, request_url, request_label=None):
         """Try Send Request
 
@@ -715,20 +851,25 @@ class RequestsFortified(object):
                 )
 
         except tuple(self.request_retry_excps) as retry_ex:
-            if not self.is_retry_retry_ex(tries, request_url, retry_ex, request_label=request_label):
+            if not self.is_retry_idempotent(retry_ex, request_url, request_label=request_label) or \
+                    not self.is_retry_retry_ex(tries, request_url, retry_ex, request_label=request_label):
                 to_raise_exception = retry_ex
 
         except RequestsFortifiedBaseError as tmv_ex:
-            if not self.is_retry_non_retry_ex(tries, tmv_ex, request_label=request_label):
+            if not self.is_retry_idempotent(tmv_ex, request_url, request_label=request_label) or \
+                    not self.is_retry_non_retry_ex(tries, tmv_ex, request_label=request_label):
                 to_raise_exception = tmv_ex
 
         except Exception as ex:
-            is_retry, raised_exception = self.is_retry_not_reqs_fortified_ex(tries, ex, request_url, request_label=request_label)
-            if not is_retry:
-                to_raise_exception = raised_exception
+            if not self.is_retry_idempotent(ex, request_url, request_label=request_label):
+                to_raise_exception = ex
+            else:
+                is_retry, raised_exception = self.is_retry_not_reqs_fortified_ex(tries, ex, request_url, request_label=request_label)
+                if not is_retry:
+                    to_raise_exception = raised_exception
 
         # A final check, whether we need to raise an exception, is in case the number of retries has exhausted.
-        if not to_raise_exception and self.is_exhausted_retries(
+        if not to_raise_exception and to_return_response is None and self.is_exhausted_retries(
             tries,
             partial(
                 self.logger.error,
@@ -749,6 +890,86 @@ class RequestsFortified(object):
 
         return to_raise_exception, to_return_response
 
+    def _hedge_delay(self):
+        """Delay before hedging current request, None if it is not hedged.
+        """
+        if self.retry_hedge_percentile is None and self.retry_hedge_delay is None:
+            return None
+
+        delay = None
+        if self.retry_hedge_percentile is not None:
+            delay = hedge_delay(self._metrics, 'api_request.latency', percentile=self.retry_hedge_percentile)
+        if delay is None:
+            delay = self.retry_hedge_delay
+        return delay
+
+    def _send_request(self, kwargs, request_data, request_label):
+        """Send request by session, hedged if enabled, see request_retry 'hedge_percentile'.
+
+        Only idempotent requests, whose body can be sent twice, are hedged.
+        """
+        hedge_delay_ = None
+        if self.request_idempotent and is_hedge_body(request_data):
+            hedge_delay_ = self._hedge_delay()
+
+        if hedge_delay_ is None:
+            return self.requests_session_client.request(**kwargs)
+
+        self._hedge_budget.deposit(self.retry_hedge_budget)
+
+        # Response of a retried status, e.g. 503, does not win over the other call.
+        retry_http_status_codes = self.request_retry_http_status_codes
+        response, hedged, hedge_won = hedged_call(
+            partial(self.requests_session_client.request, **kwargs),
+            delay=hedge_delay_,
+            budget=self._hedge_budget,
+            discard=lambda response_loser: response_loser.close(),
+            is_final=lambda response_: response_.status_code not in retry_http_status_codes,
+        )
+
+        if hedged:
+            self._metrics.inc('api_request.hedge')
+            if hedge_won:
+                self._metrics.inc('api_request.hedge_won')
+
+            self.logger.debug(
+                "{0}: Hedged".format(request_label),
+                extra={
+                    'hedge_delay': hedge_delay_,
+                    'hedge_won': hedge_won,
+                    'request_url': kwargs['request_url'],
+                }
+            )
+
+        return response
+
+    def is_retry_idempotent(self, ex, request_url, request_label=None):
+        """Is Retry Idempotent: May request be sent again after failure.
+
+        A non-idempotent request, see request_retry 'idempotent', is only
+        sent again when it failed to connect, so it was not sent.
+
+        :param ex:
+        :param request_url:
+        :param request_label:
+        :return:
+        """
+        if self.request_idempotent or is_connect_phase_exception(ex):
+            return True
+
+        _request_label = "Is Retry Idempotent"
+        request_label = "{0}: {1}".format(request_label, _request_label) if request_label is not None else _request_label
+
+        self.logger.error(
+            "{0}: Not Idempotent: {1}: Not Retry Candidate".format(request_label, base_class_name(ex)),
+            extra={
+                'error_details': get_exception_message(ex),
+                'request_url': request_url,
+                'request_label': request_label
+            }
+        )
+        return False
+
     def is_retry_not_reqs_fortified_ex(self, tries, ex, request_url, request_label=None):
         """Is Retry Requests Fortified Exception
 
@@ -958,7 +1179,7 @@ class RequestsFortified(object):
             request_auth: (optional) Auth tuple to enable Basic/Digest/Custom HTTP Auth.
             request_cert: (optional) Cert tuple to enable Client side certificates.
             timeout: (optional) How long to wait for the server to send data
-                before giving up.
+                before giving up, or (connect, read) tuple.
             allow_redirects: (optional) Boolean. Set to True if POST/PUT/DELETE
                 redirect following is allowed.
             verify: (optional) whether the SSL cert will be verified. A
@@ -1028,7 +1249,7 @@ class RequestsFortified(object):
         if request_cert:
             kwargs.update({'cert': request_cert})
 
-        if timeout and isinstance(timeout, int):
+        if timeout and isinstance(timeout, REQUEST_TIMEOUT_TYPES):
             kwargs.update({'timeout': timeout})
 
         if allow_redirects:
@@ -1090,7 +1311,7 @@ class RequestsFortified(object):
 
             kwargs.update({'request_method': request_method, 'request_url': request_url})
 
-            response = self.requests_session_client.request(**kwargs)
+            response = self._send_request(kwargs, request_data, request_label)
 
         except Exception as ex:
             self.logger.error(
@@ -1118,34 +1339,24 @@ class RequestsFortified(object):
             )
 
         http_status_code = response.status_code
-        response_headers = json.loads(json.dumps(dict(response.headers)))
-
-        http_status_type = \
-            get_http_status_type(http_status_code)
-        http_status_desc = \
-            get_http_status_desc(http_status_code)
+        http_status = http_status_class(http_status_code, self.requests_session_client.http_status_classes)
 
         response_extra = {
             'http_status_code': http_status_code,
-            'http_status_type': http_status_type,
-            'http_status_desc': http_status_desc,
-            'response_headers': safe_dict(response_headers),
+            'http_status_type': http_status.http_status_type,
+            'http_status_desc': http_status.http_status_desc,
         }
 
+        # Headers snapshot is only built when logged.
+        if self.logger.isEnabledFor(logging.DEBUG) or not http_status.ok:
+            response_extra.update({'response_headers': response_headers_snapshot(response)})
+
         self.logger.debug(
             "{0}: Response: Details".format(request_label),
             extra=response_extra,
         )
 
-        http_status_successful = is_http_status_type(
-            http_status_code=http_status_code, http_status_type=HttpStatusType.SUCCESSFUL
-        )
-
-        http_status_redirection = is_http_status_type(
-            http_status_code=http_status_code, http_status_type=HttpStatusType.REDIRECTION
-        )
-
-        if http_status_successful or http_status_redirection:
+        if http_status.ok:
             if hasattr(response, 'url') and \
                     response.url and \
                     len(response.url) > 0:
@@ -1169,7 +1380,8 @@ class RequestsFortified(object):
                 build_response_error_details(
                     response=response,
                     request_label=request_label,
-                    request_url=request_url
+                    request_url=request_url,
+                    error_body_limit=self.error_body_limit
                 )
 
             extra_error = copy.deepcopy(json_response_error)
@@ -1196,31 +1408,11 @@ class RequestsFortified(object):
                 'error_request_curl': self.built_request_curl
             }
 
-            if http_status_code in [
-                HttpStatusCode.BAD_REQUEST,
-                HttpStatusCode.UNAUTHORIZED,
-                HttpStatusCode.FORBIDDEN,
-                HttpStatusCode.NOT_FOUND,
-                HttpStatusCode.METHOD_NOT_ALLOWED,
-                HttpStatusCode.NOT_ACCEPTABLE,
-                HttpStatusCode.REQUEST_TIMEOUT,
-                HttpStatusCode.CONFLICT,
-                HttpStatusCode.GONE,
-                HttpStatusCode.UNPROCESSABLE_ENTITY,
-                HttpStatusCode.TOO_MANY_REQUESTS,
-            ]:
-                kwargs.update({'error_code': http_status_code})
-                raise RequestsFortifiedClientError(**kwargs)
-
-            if http_status_code in [
-                HttpStatusCode.INTERNAL_SERVER_ERROR,
-                HttpStatusCode.NOT_IMPLEMENTED,
-                HttpStatusCode.BAD_GATEWAY,
-                HttpStatusCode.SERVICE_UNAVAILABLE,
-                HttpStatusCode.NETWORK_AUTHENTICATION_REQUIRED,
-            ]:
+            # RequestsFortifiedClientError or RequestsFortifiedServiceError, see HTTP_STATUS_CLIENT_ERROR_CODES
+            # and HTTP_STATUS_SERVICE_ERROR_CODES.
+            if http_status.error_class is not None:
                 kwargs.update({'error_code': http_status_code})
-                raise RequestsFortifiedServiceError(**kwargs)
+                raise http_status.error_class(**kwargs)
 
             kwargs.update({'error_code': json_response_error['response_status_code']})
 
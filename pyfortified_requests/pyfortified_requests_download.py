@@ -5,9 +5,9 @@
 import logging
 import csv
 import datetime as dt
-import gzip
 import http.client as http_client
 import io
+import locale
 import ujson as json
 import os
 import re
@@ -15,27 +15,55 @@ import time
 
 import requests
 from pyfortified_logging import (LoggingFormat, LoggingOutput)
-from pprintpp import pprint
 
 from pyfortified_requests import (__python_required_version__)
 from pyfortified_requests.errors import (get_exception_message, RequestsFortifiedErrorCodes)
 from pyfortified_requests.exceptions.custom import (
+    RequestsFortifiedDeadlineExceededError,
     RequestsFortifiedModuleError,
 )
 from pyfortified_requests.support import (
     base_class_name,
+    bom_text_encoding,
+    BomStream,
+    BOM_SNIFF_SIZE,
     bytes_to_human,
+    chunk_size_bytes,
+    CSV_BATCH_SIZE,
+    CSV_OUTPUT_DICT,
+    csv_rows_output,
+    csv_parse_file_parallel,
     csv_skip_last_row,
+    csv_split_supported,
+    Deadline,
     detect_bom,
+    DownloadProgress,
     env_usage,
+    error_content_text,
+    get_bom_encoding,
+    get_bom_offset,
     handle_json_decode_error,
+    is_retry_exception,
+    iter_json_items,
+    iter_response_chunks,
+    JSON_ITEM,
+    JsonStreamDecodeError,
+    mmap_decode,
+    mmap_open,
+    mmap_text_reader,
+    MmapReader,
+    ndjson_loads,
     python_check_version,
-    remove_bom,
+    response_headers_snapshot,
+    response_wire_bytes,
+    ResponseRawReader,
+    STREAM_COMPRESSIONS,
+    StreamDecompressor,
+    StreamWatchdog,
     validate_response,
 )
 from pyfortified_requests.support.curl import command_line_request_curl
 from .pyfortified_requests import (RequestsFortified)
-from safe_cast import safe_dict
 
 log = logging.getLogger(__name__)
 
@@ -45,6 +73,7 @@ python_check_version(__python_required_version__)
 class RequestsFortifiedDownload(object):
 
     __requests_client = None
+    __download_progress = None
 
     def __init__(
         self,
@@ -87,6 +116,34 @@ class RequestsFortifiedDownload(object):
     def built_request_curl(self):
         return self.requests_client.built_request_curl
 
+    @property
+    def download_progress(self):
+        """Get Property: Progress of most recent download.
+        """
+        return self.__download_progress
+
+    @download_progress.setter
+    def download_progress(self, value):
+        self.__download_progress = value
+
+    def _download_progress_start(
+        self,
+        response,
+        request_label=None,
+        progress_callback=None,
+        progress_log_interval=None,
+        progress_callback_interval=None,
+    ):
+        self.download_progress = DownloadProgress.from_response(
+            response,
+            request_label=request_label,
+            progress_callback=progress_callback,
+            log_interval_secs=progress_log_interval,
+            callback_interval_secs=progress_callback_interval,
+            metrics=self.requests_client._metrics,
+        )
+        return self.download_progress
+
     def request_csv_download(
         self,
         request_method,
@@ -114,6 +171,14 @@ class RequestsFortifiedDownload(object):
         encoding_write=None,
         encoding_read=None,
         decode_unicode=False,
+        progress_callback=None,
+        progress_log_interval=None,
+        progress_callback_interval=None,
+        csv_output=CSV_OUTPUT_DICT,
+        csv_batch_size=CSV_BATCH_SIZE,
+        csv_schema=None,
+        csv_parse_processes=None,
+        csv_parse_ordered=True,
     ):
         """Download and Read CSV file.
 
@@ -145,9 +210,26 @@ class RequestsFortifiedDownload(object):
             encoding_write:
             encoding_read:
             decode_unicode:
+            progress_callback: (optional) Callable receiving
+                :class:`DownloadProgress` upon each downloaded chunk.
+            progress_log_interval: (optional) Seconds between progress log events.
+            progress_callback_interval: (optional) Minimum seconds between
+                'progress_callback' calls, default every chunk.
+            csv_output: (optional) 'dict' yields a dictionary per row (default),
+                'tuples' yields :class:`CsvBatch` of rows as tuples sharing the header,
+                'columns' yields :class:`CsvBatch` of column arrays.
+            csv_batch_size: (optional) Rows per batch for 'tuples' and 'columns'.
+            csv_schema: (optional) :class:`CsvSchema`, or dictionary of column name to type,
+                e.g. 'int', 'float?' (nullable), 'bool', 'date:%m/%d/%Y' or a cast callable.
+                Cast errors are counted per column in 'CsvSchema.errors', not raised.
+            csv_parse_processes: (optional) Parse downloaded file in this many processes,
+                0 for CPU count; by default parsed within this process.
+            csv_parse_ordered: (optional) With 'csv_parse_processes', yield in file order;
+                when False, yield parsed ranges as soon as ready.
 
         Returns:
-            Generator containing CSV data by rows in JSON dictionary format.
+            Generator containing CSV data by rows in JSON dictionary format,
+            or by batches of rows.
 
         """
         _request_label = 'Request Download CSV File'
@@ -164,6 +246,11 @@ class RequestsFortifiedDownload(object):
 
         timer_start = dt.datetime.now()
 
+        # Attempts share total time budget, as request_retry 'deadline'.
+        deadline = Deadline.from_request_retry(request_retry)
+        if deadline is not None:
+            request_retry = dict(request_retry, deadline=deadline)
+
         _attempts = 0
         _tries = 60
         _delay = 10
@@ -215,25 +302,17 @@ class RequestsFortifiedDownload(object):
             timer_end = dt.datetime.now()
             timer_delta = timer_end - timer_start
             response_time_secs = timer_delta.seconds
-            response_headers = None
-
-            if hasattr(response, 'headers'):
-                response_headers = \
-                    json.loads(
-                        json.dumps(
-                            dict(response.headers)
-                        )
-                    )
 
-            log.debug(
-                "{0}: Response Status".format(request_label),
-                extra={
-                    'http_status_code': http_status_code,
-                    'response_time_secs': response_time_secs,
-                    'response_url': response.url,
-                    'response_headers': safe_dict(response_headers),
-                }
-            )
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    "{0}: Response Status".format(request_label),
+                    extra={
+                        'http_status_code': http_status_code,
+                        'response_time_secs': response_time_secs,
+                        'response_url': response.url,
+                        'response_headers': response_headers_snapshot(response),
+                    }
+                )
 
             (tmp_csv_file_path, tmp_csv_file_size) = self.download_csv(
                 response,
@@ -241,7 +320,11 @@ class RequestsFortifiedDownload(object):
                 tmp_csv_file_name,
                 request_label=request_label,
                 encoding_write=encoding_write,
-                decode_unicode=decode_unicode
+                decode_unicode=decode_unicode,
+                progress_callback=progress_callback,
+                progress_log_interval=progress_log_interval,
+                progress_callback_interval=progress_callback_interval,
+                request_retry=request_retry,
             )
 
             if tmp_csv_file_path is not None:
@@ -271,6 +354,9 @@ class RequestsFortifiedDownload(object):
                 }
             )
 
+            if deadline is not None:
+                deadline.check(request_label, delay=_delay)
+
             time.sleep(_delay)
 
         log.info(
@@ -287,43 +373,139 @@ class RequestsFortifiedDownload(object):
             extra=env_usage(tmp_directory),
         )
 
-        with open(file=tmp_csv_file_path, mode='r', encoding=encoding_read) as csv_file_r:
-            if read_first_row:
-                csv_report_name = csv_file_r.readline()
-                csv_report_name = re.sub('\"', '', csv_report_name)
-                csv_report_name = re.sub('\n', '', csv_report_name)
+        with mmap_open(tmp_csv_file_path) as csv_file_mmap:
+            csv_bom_enc, csv_bom_offset = get_bom_offset(csv_file_mmap[:BOM_SNIFF_SIZE])
+            csv_encoding = bom_text_encoding(csv_bom_enc, encoding_read)
 
-                log.info(
-                    "{0}: Report".format(request_label),
-                    extra={'csv_report_name': csv_report_name},
+            log.debug(
+                "{0}: Encoding".format(request_label),
+                extra={
+                    'bom_enc': csv_bom_enc,
+                    'bom_len': csv_bom_offset,
+                    'encoding': csv_encoding,
+                }
+            )
+
+            if csv_parse_processes is not None and csv_parse_processes != 1:
+                if csv_split_supported(csv_encoding):
+                    csv_encoding = csv_encoding or locale.getpreferredencoding(False)
+
+                    csv_file_rb = MmapReader(csv_file_mmap, start=csv_bom_offset)
+                    csv_header_actual = self._read_csv_file_header(
+                        lambda: csv_file_rb.readline().decode(csv_encoding).replace('\r\n', '\n'),
+                        read_first_row=read_first_row,
+                        skip_first_row=skip_first_row,
+                        csv_delimiter=csv_delimiter,
+                        request_label=request_label,
+                    )
+                    csv_data_start = csv_file_rb.tell()
+
+                    for output in csv_parse_file_parallel(
+                        tmp_csv_file_path,
+                        csv_header if csv_header else csv_header_actual,
+                        start=csv_data_start,
+                        encoding=csv_encoding,
+                        csv_delimiter=csv_delimiter,
+                        csv_output=csv_output,
+                        csv_batch_size=csv_batch_size,
+                        csv_schema=csv_schema,
+                        skip_last_row=skip_last_row,
+                        processes=csv_parse_processes or None,
+                        ordered=csv_parse_ordered,
+                    ):
+                        yield output
+                    return
+
+                log.warning(
+                    "{0}: Parallel Parse Unsupported Encoding".format(request_label),
+                    extra={'encoding': csv_encoding},
+                )
+
+            with mmap_text_reader(csv_file_mmap, start=csv_bom_offset, encoding=csv_encoding) as csv_file_r:
+                csv_header_actual = self._read_csv_file_header(
+                    csv_file_r.readline,
+                    read_first_row=read_first_row,
+                    skip_first_row=skip_first_row,
+                    csv_delimiter=csv_delimiter,
+                    request_label=request_label,
                 )
-            elif skip_first_row:
-                next(csv_file_r)
 
-            csv_file_header = next(csv_file_r)
-            csv_header_actual = \
-                [h.strip() for h in csv_file_header.split(csv_delimiter)]
+                csv_fieldnames = csv_header if csv_header else csv_header_actual
 
-            csv_header_hr = []
-            index = 0
-            for column_name in csv_header_actual:
-                csv_header_hr.append({'index': index, 'name': column_name})
-                index += 1
+                if csv_output == CSV_OUTPUT_DICT and not csv_schema:
+                    csv_dict_reader = csv.DictReader(csv_file_r, fieldnames=csv_fieldnames, delimiter=csv_delimiter)
 
-            log.debug(
-                "{0}: Content Header".format(request_label),
-                extra={'csv_header': csv_header_hr},
+                    if skip_last_row:
+                        for row in csv_skip_last_row(csv_dict_reader):
+                            yield row
+                    else:
+                        for row in csv_dict_reader:
+                            yield row
+                    return
+
+                csv_rows = csv.reader(csv_file_r, delimiter=csv_delimiter)
+                csv_rows = (row for row in csv_rows if row)
+
+                if skip_last_row:
+                    csv_rows = csv_skip_last_row(csv_rows)
+
+                for output in csv_rows_output(
+                    csv_rows,
+                    csv_fieldnames,
+                    csv_output=csv_output,
+                    csv_batch_size=csv_batch_size,
+                    csv_schema=csv_schema,
+                ):
+                    yield output
+
+    def _read_csv_file_header(
+        self,
+        readline,
+        read_first_row,
+        skip_first_row,
+        csv_delimiter,
+        request_label,
+    ):
+        """Read CSV file header, after optional report name or skipped first row.
+
+        Args:
+            readline: Callable returning next line of file as str.
+            read_first_row: Read first row as report name.
+            skip_first_row: Skip first row.
+            csv_delimiter: Delimiter character.
+            request_label: Label for logging.
+
+        Returns:
+            List of column names.
+        """
+        if read_first_row:
+            csv_report_name = readline()
+            csv_report_name = re.sub('\"', '', csv_report_name)
+            csv_report_name = re.sub('\n', '', csv_report_name)
+
+            log.info(
+                "{0}: Report".format(request_label),
+                extra={'csv_report_name': csv_report_name},
             )
+        elif skip_first_row:
+            readline()
 
-            csv_fieldnames = csv_header if csv_header else csv_header_actual
-            csv_dict_reader = csv.DictReader(csv_file_r, fieldnames=csv_fieldnames, delimiter=csv_delimiter)
+        csv_file_header = readline()
+        csv_header_actual = \
+            [h.strip() for h in csv_file_header.split(csv_delimiter)]
 
-            if skip_last_row:
-                for row in csv_skip_last_row(csv_dict_reader):
-                    yield row
-            else:
-                for row in csv_dict_reader:
-                    yield row
+        csv_header_hr = []
+        index = 0
+        for column_name in csv_header_actual:
+            csv_header_hr.append({'index': index, 'name': column_name})
+            index += 1
+
+        log.debug(
+            "{0}: Content Header".format(request_label),
+            extra={'csv_header': csv_header_hr},
+        )
+
+        return csv_header_actual
 
     def request_json_download(
         self,
@@ -345,6 +527,9 @@ class RequestsFortifiedDownload(object):
         verify=True,
         encoding_write=None,
         encoding_read=None,
+        progress_callback=None,
+        progress_log_interval=None,
+        progress_callback_interval=None,
     ):
         """Download and Read JSON file.
 
@@ -370,7 +555,11 @@ class RequestsFortifiedDownload(object):
                 CA_BUNDLE path can also be provided. Defaults to ``True``.
             encoding_write:
             encoding_read:
-            decode_unicode:
+            progress_callback: (optional) Callable receiving
+                :class:`DownloadProgress` upon each downloaded chunk.
+            progress_log_interval: (optional) Seconds between progress log events.
+            progress_callback_interval: (optional) Minimum seconds between
+                'progress_callback' calls, default every chunk.
 
         Returns:
             Generator containing JSON data by rows in JSON dictionary format.
@@ -388,8 +577,265 @@ class RequestsFortifiedDownload(object):
             }
         )
 
+        (tmp_json_file_path, tmp_json_file_size, response) = self.download_json(
+            request_method=request_method,
+            request_url=request_url,
+            tmp_json_file_name=tmp_json_file_name,
+            tmp_directory=tmp_directory,
+            request_params=request_params,
+            request_data=request_data,
+            request_retry=request_retry,
+            request_retry_func=request_retry_func,
+            request_retry_excps=request_retry_excps,
+            request_retry_excps_func=request_retry_excps_func,
+            request_headers=request_headers,
+            request_auth=request_auth,
+            request_label=request_label,
+            build_request_curl=build_request_curl,
+            allow_redirects=allow_redirects,
+            verify=verify,
+            encoding_write=encoding_write,
+            progress_callback=progress_callback,
+            progress_log_interval=progress_log_interval,
+            progress_callback_interval=progress_callback_interval,
+        )
+
+        response_extra = {
+            'file_path': tmp_json_file_path,
+            'file_size': bytes_to_human(tmp_json_file_size),
+        }
+
+        log.info(
+            "{0}: Read Downloaded".format(request_label),
+            extra=response_extra
+        )
+
+        json_download = None
+        with open(tmp_json_file_path, mode='rb') as json_file_rb:
+            json_bom_enc, json_bom_offset = get_bom_offset(json_file_rb.read(BOM_SNIFF_SIZE))
+            json_encoding = bom_text_encoding(json_bom_enc, 'utf-8')
+            if json_encoding == 'utf-8':
+                # Parser takes bytes or str, not a view of a mapping, and copies
+                # str back to UTF-8: bytes past BOM are read once, unmapped.
+                json_file_rb.seek(json_bom_offset)
+                json_file_content = json_file_rb.read()
+            else:
+                with mmap_open(tmp_json_file_path) as json_file_mmap:
+                    json_file_content = mmap_decode(json_file_mmap, json_bom_offset, encoding=json_encoding)
+
+        try:
+            json_download = json.loads(json_file_content)
+        except ValueError as json_decode_ex:
+            json_file_content_text, json_file_content_truncated = error_content_text(json_file_content)
+            response_extra.update({
+                'json_file_content': json_file_content_text,
+                'json_file_content_len': len(json_file_content),
+                'json_file_content_truncated': json_file_content_truncated,
+            })
+
+            handle_json_decode_error(
+                response_decode_ex=json_decode_ex,
+                response=response,
+                response_extra=response_extra,
+                request_label=request_label,
+                request_curl=self.built_request_curl
+            )
+
+        except Exception as ex:
+            json_file_content_text, json_file_content_truncated = error_content_text(json_file_content)
+            response_extra.update({
+                'json_file_content': json_file_content_text,
+                'json_file_content_len': len(json_file_content),
+                'json_file_content_truncated': json_file_content_truncated,
+            })
+
+            log.error(
+                "{0}: Failed: Exception".format(request_label),
+                extra=response_extra,
+            )
+
+            handle_json_decode_error(
+                response_decode_ex=ex,
+                response=response,
+                response_extra=response_extra,
+                request_label=request_label,
+                request_curl=self.built_request_curl
+            )
+
+        response_extra.update({'json_file_content_len': len(json_download)})
+
+        log.info(
+            "{0}: Finished".format(request_label),
+            extra=response_extra
+        )
+
+        return json_download
+
+    def request_json_download_items(
+        self,
+        request_method,
+        request_url,
+        tmp_json_file_name,
+        tmp_directory,
+        json_item_path=JSON_ITEM,
+        request_params=None,
+        request_data=None,
+        request_retry=None,
+        request_retry_func=None,
+        request_retry_excps=None,
+        request_retry_excps_func=None,
+        request_headers=None,
+        request_auth=None,
+        request_label=None,
+        build_request_curl=False,
+        allow_redirects=True,
+        verify=True,
+        encoding_write=None,
+        encoding_read=None,
+        progress_callback=None,
+        progress_log_interval=None,
+        progress_callback_interval=None,
+        chunk_size=65536,
+    ):
+        """Download JSON file and incrementally Read items.
+
+        Unlike :meth:`request_json_download`, the downloaded file is never
+        loaded whole into memory: items found at 'json_item_path' are
+        parsed and yielded one at a time.
+
+        Args:
+            request_method: request_method for the new :class:`Request` object.
+            request_url: URL for the new :class:`Request` object.
+            tmp_json_file_name: Provide temporary name for downloaded JSON
+            tmp_directory: Provide temporary directory to hold downloaded JSON
+            json_item_path: (optional) Dot-separated path of items to yield,
+                where 'item' selects each array element, e.g. 'item' for
+                top-level array elements (default), 'data.item' for
+                elements of array under key 'data'.
+            chunk_size: (optional) Characters read at a time while parsing.
+            Other arguments: See :meth:`request_json_download`.
+
+        Returns:
+            Generator containing JSON items.
+
+        """
+        _request_label = "Request Download JSON Items"
+        request_label = "{0}: {1}".format(request_label, _request_label) if request_label is not None else _request_label
+
+        log.info(
+            "{0}: Start".format(request_label),
+            extra={
+                'request_url': request_url,
+                'json_item_path': json_item_path,
+                'encoding_write': encoding_write,
+                'encoding_read': encoding_read,
+            }
+        )
+
+        (tmp_json_file_path, tmp_json_file_size, response) = self.download_json(
+            request_method=request_method,
+            request_url=request_url,
+            tmp_json_file_name=tmp_json_file_name,
+            tmp_directory=tmp_directory,
+            request_params=request_params,
+            request_data=request_data,
+            request_retry=request_retry,
+            request_retry_func=request_retry_func,
+            request_retry_excps=request_retry_excps,
+            request_retry_excps_func=request_retry_excps_func,
+            request_headers=request_headers,
+            request_auth=request_auth,
+            request_label=request_label,
+            build_request_curl=build_request_curl,
+            allow_redirects=allow_redirects,
+            verify=verify,
+            encoding_write=encoding_write,
+            progress_callback=progress_callback,
+            progress_log_interval=progress_log_interval,
+            progress_callback_interval=progress_callback_interval,
+        )
+
+        response_extra = {
+            'file_path': tmp_json_file_path,
+            'file_size': bytes_to_human(tmp_json_file_size),
+            'json_item_path': json_item_path,
+        }
+
+        log.info(
+            "{0}: Read Downloaded".format(request_label),
+            extra=response_extra
+        )
+
+        json_item_count = 0
+        with open(tmp_json_file_path, mode='rb') as json_file_rb, \
+                BomStream(json_file_rb, encoding=encoding_read).text_reader() as json_file_r:
+            try:
+                for json_item in iter_json_items(json_file_r, item_path=json_item_path, chunk_size=chunk_size):
+                    json_item_count += 1
+                    yield json_item
+
+            except JsonStreamDecodeError as json_decode_ex:
+                response_extra.update({
+                    'json_item_count': json_item_count,
+                    'json_error_offset': json_decode_ex.offset,
+                })
+
+                handle_json_decode_error(
+                    response_decode_ex=json_decode_ex,
+                    response=response,
+                    response_extra=response_extra,
+                    request_label=request_label,
+                    request_curl=self.built_request_curl
+                )
+
+        response_extra.update({'json_item_count': json_item_count})
+
+        log.info(
+            "{0}: Finished".format(request_label),
+            extra=response_extra
+        )
+
+    def download_json(
+        self,
+        request_method,
+        request_url,
+        tmp_json_file_name,
+        tmp_directory,
+        request_params=None,
+        request_data=None,
+        request_retry=None,
+        request_retry_func=None,
+        request_retry_excps=None,
+        request_retry_excps_func=None,
+        request_headers=None,
+        request_auth=None,
+        request_label=None,
+        build_request_curl=False,
+        allow_redirects=True,
+        verify=True,
+        encoding_write=None,
+        progress_callback=None,
+        progress_log_interval=None,
+        progress_callback_interval=None,
+    ):
+        """Download JSON file, with retries upon incomplete download.
+
+        Compressed payloads (gzip, bzip2, zip) are decompressed while streaming.
+
+        Args:
+            See :meth:`request_json_download`.
+
+        Returns:
+            Tuple of downloaded JSON file path, its size, and response.
+
+        """
         timer_start = dt.datetime.now()
 
+        # Attempts share total time budget, as request_retry 'deadline'.
+        deadline = Deadline.from_request_retry(request_retry)
+        if deadline is not None:
+            request_retry = dict(request_retry, deadline=deadline)
+
         _attempts = 0
         _tries = 60
         _delay = 10
@@ -441,25 +887,17 @@ class RequestsFortifiedDownload(object):
             timer_end = dt.datetime.now()
             timer_delta = timer_end - timer_start
             response_time_secs = timer_delta.seconds
-            response_headers = None
 
-            if hasattr(response, 'headers'):
-                response_headers = \
-                    json.loads(
-                        json.dumps(
-                            dict(response.headers)
-                        )
-                    )
-
-            log.debug(
-                "{0}: Response Status".format(request_label),
-                extra={
-                    'http_status_code': http_status_code,
-                    'response_time_secs': response_time_secs,
-                    'response_url': response.url,
-                    'response_headers': safe_dict(response_headers),
-                }
-            )
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    "{0}: Response Status".format(request_label),
+                    extra={
+                        'http_status_code': http_status_code,
+                        'response_time_secs': response_time_secs,
+                        'response_url': response.url,
+                        'response_headers': response_headers_snapshot(response),
+                    }
+                )
 
             if not os.path.exists(tmp_directory):
                 os.mkdir(tmp_directory)
@@ -489,7 +927,13 @@ class RequestsFortifiedDownload(object):
                 extra=env_usage(tmp_directory)
             )
 
-            chunk_total_sum = 0
+            progress = self._download_progress_start(
+                response,
+                request_label=request_label,
+                progress_callback=progress_callback,
+                progress_log_interval=progress_log_interval,
+                progress_callback_interval=progress_callback_interval,
+            )
 
             with open(file=tmp_json_file_path, mode=mode_write, encoding=encoding_write) as json_raw_file_w:
                 log.debug(
@@ -503,19 +947,49 @@ class RequestsFortifiedDownload(object):
                 error_exception = None
                 error_details = None
                 chunk_size = 8192
-                try:
+                bom_enc = None
+                decompressor = None
+                watchdog = StreamWatchdog.from_request_retry(response, request_retry, request_label=request_label)
+                if watchdog is not None or deadline is not None:
+                    chunks = iter_response_chunks(
+                        response, chunk_size, watchdog=watchdog, deadline=deadline, request_label=request_label
+                    )
+                else:
                     raw_response = response.raw
-                    while True:
-                        chunk = raw_response.read(chunk_size, decode_content=True)
-                        if not chunk:
-                            break
+                    chunks = iter(lambda: raw_response.read(chunk_size, decode_content=True), b'')
 
-                        chunk_total_sum += chunk_size
+                try:
+                    for chunk in chunks:
+
+                        if bom_enc is None:
+                            # Compressed payload is decompressed as it streams
+                            # instead of being spooled and re-read.
+                            bom_enc, _ = get_bom_encoding(chunk)
+                            if bom_enc in STREAM_COMPRESSIONS:
+                                decompressor = StreamDecompressor(bom_enc, max_length=chunk_size)
+
+                        if decompressor is not None:
+                            chunk_decoded_size = 0
+                            for chunk_decoded in decompressor.decompress(chunk):
+                                chunk_decoded_size += len(chunk_decoded)
+                                json_raw_file_w.write(chunk_decoded)
+                        else:
+                            chunk_decoded_size = chunk_size_bytes(chunk, encoding_write)
+                            json_raw_file_w.write(chunk)
+
+                        progress.update(chunk_decoded_size, response_wire_bytes(response))
 
-                        json_raw_file_w.write(chunk)
                         json_raw_file_w.flush()
                         os.fsync(json_raw_file_w.fileno())
 
+                    if decompressor is not None:
+                        chunk_decoded = decompressor.flush()
+                        if chunk_decoded:
+                            json_raw_file_w.write(chunk_decoded)
+                            progress.update(len(chunk_decoded), response_wire_bytes(response))
+
+                    progress.finish()
+
                     log.debug(
                         "{0}: By Chunk: Completed".format(request_label),
                         extra={
@@ -533,7 +1007,7 @@ class RequestsFortifiedDownload(object):
                         "{0}: Error: {1}".format(request_label, error_exception),
                         extra={
                             'error_details': error_details,
-                            'chunk_total_sum': chunk_total_sum,
+                            'chunk_total_sum': progress.bytes_decoded,
                         }
                     )
 
@@ -543,6 +1017,11 @@ class RequestsFortifiedDownload(object):
                         )
                         raise
 
+                    if not self.requests_client.is_retry_idempotent(
+                        chunked_encoding_ex, request_url, request_label=request_label
+                    ):
+                        raise
+
                 except http_client.IncompleteRead as incomplete_read_ex:
                     error_exception = base_class_name(incomplete_read_ex)
                     error_details = get_exception_message(incomplete_read_ex)
@@ -552,7 +1031,7 @@ class RequestsFortifiedDownload(object):
                         extra={
                             'error_exception': error_exception,
                             'error_details': error_details,
-                            'chunk_total_sum': chunk_total_sum,
+                            'chunk_total_sum': progress.bytes_decoded,
                         }
                     )
 
@@ -562,15 +1041,36 @@ class RequestsFortifiedDownload(object):
                         )
                         raise
 
+                    if not self.requests_client.is_retry_idempotent(
+                        incomplete_read_ex, request_url, request_label=request_label
+                    ):
+                        raise
+
                 except requests.exceptions.RequestException as request_ex:
-                    log.error(
-                        "{0}: Request Exception".format(request_label),
-                        extra={
-                            'error_exception': base_class_name(request_ex),
-                            'error_details': get_exception_message(request_ex),
-                            'chunk_total_sum': chunk_total_sum,
-                        }
-                    )
+                    # Connection dropped mid-stream, e.g. reset by peer, is retried.
+                    if _tries and is_retry_exception(request_ex) and self.requests_client.is_retry_idempotent(
+                        request_ex, request_url, request_label=request_label
+                    ):
+                        log.warning(
+                            "{0}: Request Exception: Retry".format(request_label),
+                            extra={
+                                'error_exception': base_class_name(request_ex),
+                                'error_details': get_exception_message(request_ex),
+                                'chunk_total_sum': progress.bytes_decoded,
+                            }
+                        )
+                    else:
+                        log.error(
+                            "{0}: Request Exception".format(request_label),
+                            extra={
+                                'error_exception': base_class_name(request_ex),
+                                'error_details': get_exception_message(request_ex),
+                                'chunk_total_sum': progress.bytes_decoded,
+                            }
+                        )
+                        raise
+
+                except RequestsFortifiedDeadlineExceededError:
                     raise
 
                 except Exception as ex:
@@ -579,7 +1079,7 @@ class RequestsFortifiedDownload(object):
                         extra={
                             'error_exception': base_class_name(ex),
                             'error_details': get_exception_message(ex),
-                            'chunk_total_sum': chunk_total_sum,
+                            'chunk_total_sum': progress.bytes_decoded,
                         }
                     )
                     raise
@@ -608,97 +1108,25 @@ class RequestsFortifiedDownload(object):
                     }
                 )
 
+                if deadline is not None:
+                    deadline.check(request_label, delay=_delay)
+
                 time.sleep(_delay)
 
         tmp_json_file_size = os.path.getsize(tmp_json_file_path)
-        bom_enc, bom_len, bom_header = detect_bom(tmp_json_file_path)
 
         log.info(
             "{0}: By Chunk: Completed: Details".format(request_label),
             extra={
                 'file_path': tmp_json_file_path,
                 'file_size': bytes_to_human(tmp_json_file_size),
-                'chunk_total_sum': chunk_total_sum,
+                'chunk_total_sum': progress.bytes_decoded,
+                'download_progress': progress.to_dict(),
                 'bom_encoding': bom_enc,
             }
         )
 
-        if bom_enc == 'gzip':
-            tmp_json_gz_file_path = "%s.gz" % tmp_json_file_path
-
-            os.rename(src=tmp_json_file_path, dst=tmp_json_gz_file_path)
-
-            with open(file=tmp_json_file_path, mode=mode_write, encoding=encoding_write) as json_file_w:
-                log.debug(
-                    "{0}: GZip: Started".format(request_label),
-                    extra={
-                        'file_path': tmp_json_file_path,
-                    }
-                )
-
-                with gzip.open(tmp_json_gz_file_path, 'r') as gzip_file_r:
-                    json_file_w.write(gzip_file_r.read())
-
-        response_extra = {
-            'file_path': tmp_json_file_path,
-            'file_size': bytes_to_human(tmp_json_file_size),
-        }
-
-        log.info(
-            "{0}: Read Downloaded".format(request_label),
-            extra=response_extra
-        )
-
-        json_download = None
-        with open(tmp_json_file_path, mode='r') as json_file_r:
-            json_file_content = json_file_r.read()
-            try:
-                json_download = json.loads(json_file_content)
-            except ValueError as json_decode_ex:
-                pprint(json_file_content)
-
-                response_extra.update({
-                    'json_file_content': json_file_content,
-                    'json_file_content_len': len(json_file_content)
-                })
-
-                handle_json_decode_error(
-                    response_decode_ex=json_decode_ex,
-                    response=response,
-                    response_extra=response_extra,
-                    request_label=request_label,
-                    request_curl=self.built_request_curl
-                )
-
-            except Exception as ex:
-                pprint(json_file_content)
-
-                response_extra.update({
-                    'json_file_content': json_file_content,
-                    'json_file_content_len': len(json_file_content)
-                })
-
-                log.error(
-                    "{0}: Failed: Exception".format(request_label),
-                    extra=response_extra,
-                )
-
-                handle_json_decode_error(
-                    response_decode_ex=ex,
-                    response=response,
-                    response_extra=response_extra,
-                    request_label=request_label,
-                    request_curl=self.built_request_curl
-                )
-
-        response_extra.update({'json_file_content_len': len(json_download)})
-
-        log.info(
-            "{0}: Finished".format(request_label),
-            extra=response_extra
-        )
-
-        return json_download
+        return (tmp_json_file_path, tmp_json_file_size, response)
 
     def download_csv(
         self,
@@ -708,6 +1136,10 @@ class RequestsFortifiedDownload(object):
         request_label=None,
         encoding_write=None,
         decode_unicode=False,
+        progress_callback=None,
+        progress_log_interval=None,
+        progress_callback_interval=None,
+        request_retry=None,
     ):
         _request_label = "Download CSV"
         request_label = "{0}: {1}".format(request_label, _request_label)  if request_label is not None else _request_label
@@ -739,7 +1171,13 @@ class RequestsFortifiedDownload(object):
             }
         )
 
-        chunk_total_sum = 0
+        progress = self._download_progress_start(
+            response,
+            request_label=request_label,
+            progress_callback=progress_callback,
+            progress_log_interval=progress_log_interval,
+            progress_callback_interval=progress_callback_interval,
+        )
 
         with open(file=tmp_csv_file_path, mode=mode_write, encoding=encoding_write) as csv_file_wb:
             log.debug(
@@ -753,17 +1191,33 @@ class RequestsFortifiedDownload(object):
             error_exception = None
             error_details = None
 
+            watchdog = StreamWatchdog.from_request_retry(response, request_retry, request_label=request_label)
+            deadline = Deadline.from_request_retry(request_retry)
+            if watchdog is not None or deadline is not None:
+                chunks = iter_response_chunks(
+                    response,
+                    8192,
+                    decode_unicode=decode_unicode,
+                    watchdog=watchdog,
+                    deadline=deadline,
+                    request_label=request_label,
+                )
+            else:
+                chunks = response.iter_content(chunk_size=8192, decode_unicode=decode_unicode)
+
             try:
-                for chunk in response.iter_content(chunk_size=8192, decode_unicode=decode_unicode):
+                for chunk in chunks:
                     if not chunk:
-                        break
+                        continue
 
-                    chunk_total_sum += 8192
+                    progress.update(chunk_size_bytes(chunk, encoding_write), response_wire_bytes(response))
 
                     csv_file_wb.write(chunk)
                     csv_file_wb.flush()
                     os.fsync(csv_file_wb.fileno())
 
+                progress.finish()
+
                 log.debug(
                     "{0}: By Chunk: Completed".format(request_label),
                     extra={
@@ -780,10 +1234,15 @@ class RequestsFortifiedDownload(object):
                     extra={
                         'error_exception': error_exception,
                         'error_details': error_details,
-                        'chunk_total_sum': bytes_to_human(chunk_total_sum),
+                        'chunk_total_sum': bytes_to_human(progress.bytes_decoded),
                     }
                 )
 
+                if not self.requests_client.is_retry_idempotent(
+                    chunked_encoding_ex, response.url, request_label=request_label
+                ):
+                    raise
+
                 return (None, 0)
 
             except http_client.IncompleteRead as incomplete_read_ex:
@@ -795,30 +1254,52 @@ class RequestsFortifiedDownload(object):
                     extra={
                         'error_exception': error_exception,
                         'error_details': error_details,
-                        'chunk_total_sum': bytes_to_human(chunk_total_sum),
+                        'chunk_total_sum': bytes_to_human(progress.bytes_decoded),
                     }
                 )
 
+                if not self.requests_client.is_retry_idempotent(
+                    incomplete_read_ex, response.url, request_label=request_label
+                ):
+                    raise
+
                 return (None, 0)
 
             except requests.exceptions.RequestException as request_ex:
+                # Connection dropped mid-stream, e.g. reset by peer, fails as chunked encoding errors do.
+                if is_retry_exception(request_ex) and self.requests_client.is_retry_idempotent(
+                    request_ex, response.url, request_label=request_label
+                ):
+                    log.warning(
+                        "{0}: Request Exception: Retry".format(request_label),
+                        extra={
+                            'error_exception': base_class_name(request_ex),
+                            'error_details': get_exception_message(request_ex),
+                            'chunk_total_sum': bytes_to_human(progress.bytes_decoded),
+                        }
+                    )
+                    return (None, 0)
+
                 log.error(
                     "{0}: Request Exception".format(request_label),
                     extra={
                         'error_exception': base_class_name(request_ex),
                         'error_details': get_exception_message(request_ex),
-                        'chunk_total_sum': bytes_to_human(chunk_total_sum),
+                        'chunk_total_sum': bytes_to_human(progress.bytes_decoded),
                     }
                 )
                 raise
 
+            except RequestsFortifiedDeadlineExceededError:
+                raise
+
             except Exception as ex:
                 log.error(
                     "{0}: Unexpected Exception".format(request_label),
                     extra={
                         'error_exception': base_class_name(ex),
                         'error_details': get_exception_message(ex),
-                        'chunk_total_sum': bytes_to_human(chunk_total_sum),
+                        'chunk_total_sum': bytes_to_human(progress.bytes_decoded),
                     }
                 )
                 raise
@@ -831,7 +1312,8 @@ class RequestsFortifiedDownload(object):
             extra={
                 'file_path': tmp_csv_file_path,
                 'file_size': bytes_to_human(tmp_csv_file_size),
-                'chunk_total_sum': bytes_to_human(chunk_total_sum),
+                'chunk_total_sum': bytes_to_human(progress.bytes_decoded),
+                'download_progress': progress.to_dict(),
                 'bom_encoding': bom_enc
             }
         )
@@ -841,29 +1323,7 @@ class RequestsFortifiedDownload(object):
             extra=env_usage(tmp_directory)
         )
 
-        tmp_csv_file_name_wo_ext = \
-            os.path.splitext(
-                os.path.basename(tmp_csv_file_name)
-            )[0]
-
-        tmp_csv_file_path_wo_bom = "{0}/{1}_wo_bom.csv".format(tmp_directory, tmp_csv_file_name_wo_ext)
-
-        if os.path.exists(tmp_csv_file_path_wo_bom):
-            os.remove(tmp_csv_file_path_wo_bom)
-
-        bom_enc, bom_len = remove_bom(tmp_csv_file_path, tmp_csv_file_path_wo_bom)
-
-        log.debug(
-            "{0}: Encoding".format(request_label),
-            extra={
-                'bom_enc': bom_enc,
-                'bom_len': bom_len
-            }
-        )
-
-        if bom_len > 0:
-            tmp_csv_file_path = tmp_csv_file_path_wo_bom
-
+        # BOM, if any, is kept: readers start at its offset, see get_bom_offset().
         return (tmp_csv_file_path, tmp_csv_file_size)
 
     def stream_csv(
@@ -876,7 +1336,11 @@ class RequestsFortifiedDownload(object):
         request_label=None,
         chunk_size=1024,
         decode_unicode=False,
-        remove_bom_length=0
+        remove_bom_length=0,
+        encoding_read=None,
+        csv_output=CSV_OUTPUT_DICT,
+        csv_batch_size=CSV_BATCH_SIZE,
+        csv_schema=None,
     ):
         """Stream CSV and Yield JSON
 
@@ -886,9 +1350,16 @@ class RequestsFortifiedDownload(object):
             csv_delimiter:
             request_retry:
             request_headers:
-            chunk_size:
-            decode_unicode:
-            remove_bom_length:
+            chunk_size: Read buffer size in bytes.
+            decode_unicode: Ignored, content is always decoded using 'encoding_read'.
+            remove_bom_length: Ignored, a leading BOM is detected and removed while streaming.
+            encoding_read: (optional) Content encoding when no BOM is detected, default 'utf-8'.
+            csv_output: (optional) 'dict', 'tuples' or 'columns';
+                see :meth:`request_csv_download`.
+            csv_batch_size: (optional) Rows per batch for 'tuples' and 'columns'.
+            csv_schema: (optional) :class:`CsvSchema`, or dictionary of column name to type,
+                e.g. 'int', 'float?' (nullable), 'bool', 'date:%m/%d/%Y' or a cast callable.
+                Cast errors are counted per column in 'CsvSchema.errors', not raised.
 
         Returns:
 
@@ -901,6 +1372,11 @@ class RequestsFortifiedDownload(object):
             extra={'report_url': request_url}
         )
 
+        # Request and stream share total time budget, as request_retry 'deadline'.
+        deadline = Deadline.from_request_retry(request_retry)
+        if deadline is not None:
+            request_retry = dict(request_retry, deadline=deadline)
+
         response = self.requests_client.request(
             request_method='GET',
             request_url=request_url,
@@ -915,7 +1391,7 @@ class RequestsFortifiedDownload(object):
             "{0}: Response".format(request_label),
             extra={
                 'response_status_code': response.status_code,
-                'response_headers': response.headers,
+                'response_headers': response_headers_snapshot(response),
                 'report_url': request_url
             }
         )
@@ -944,64 +1420,253 @@ class RequestsFortifiedDownload(object):
 
         log.debug("{0}: Usage".format(request_label), extra=env_usage())
 
-        line_count = 0
-        csv_keys_str = None
-        csv_keys_list = None
-        csv_keys_list_len = None
-        pre_str_line = None
+        # Single incremental CSV reader over decoded text stream, so quoted
+        # values containing delimiters or newlines are parsed correctly.
+        response.raw.decode_content = True
+        response.raw.auto_close = False
+        response_raw = response.raw
+        if deadline is not None:
+            response_raw = ResponseRawReader(response, deadline=deadline, request_label=request_label)
+
+        try:
+            csv_byte_stream = BomStream(
+                io.BufferedReader(response_raw, buffer_size=max(chunk_size, io.DEFAULT_BUFFER_SIZE)),
+                encoding=encoding_read
+            )
 
-        for bytes_line in response.iter_lines(chunk_size=chunk_size, decode_unicode=decode_unicode):
-            if bytes_line:  # filter out keep-alive new chunks
-                line_count += 1
+            log.debug(
+                "{0}: Encoding".format(request_label),
+                extra={
+                    'bom_enc': csv_byte_stream.bom_encoding,
+                    'bom_len': csv_byte_stream.bom_len,
+                    'encoding': csv_byte_stream.encoding,
+                }
+            )
 
-                str_line = bytes_line.decode("utf-8")
-                if line_count == 1:
-                    if remove_bom_length > 0:
-                        str_line = str_line[remove_bom_length:]
-                    csv_keys_list = str_line.split(csv_delimiter)
-                    csv_keys_list = [csv_key.strip() for csv_key in csv_keys_list]
-                    csv_keys_list_len = len(csv_keys_list)
-                    continue
+            csv_reader = csv.reader(csv_byte_stream.text_reader(newline=''), delimiter=csv_delimiter)
+
+            csv_keys_list = None
+            for csv_keys_list in csv_reader:
+                if csv_keys_list:
+                    break
+
+            if not csv_keys_list:
+                log.warning("{0}: No Content".format(request_label))
+                return
+
+            csv_keys_list = [csv_key.strip() for csv_key in csv_keys_list]
+            for output in csv_rows_output(
+                self._stream_csv_rows(csv_reader, csv_keys_list, csv_delimiter, request_label),
+                csv_keys_list,
+                csv_output=csv_output,
+                csv_batch_size=csv_batch_size,
+                csv_schema=csv_schema,
+            ):
+                yield output
+        finally:
+            response.close()
+
+    def _stream_csv_rows(self, csv_reader, csv_keys_list, csv_delimiter, request_label):
+        """Yield CSV rows, verifying each has a value per CSV key.
+        """
+        csv_keys_list_len = len(csv_keys_list)
+
+        for csv_values_list in csv_reader:
+            if not csv_values_list:  # filter out blank lines
+                continue
 
-                if pre_str_line is not None:
-                    str_line = pre_str_line + str_line
-                    pre_str_line = None
+            if len(csv_values_list) != csv_keys_list_len:
+                csv_keys_str = csv_delimiter.join(csv_keys_list)
+                csv_values_str = csv_delimiter.join(csv_values_list)
+                log.error(
+                    "{0}: Mismatch: CSV Key".format(request_label),
+                    extra={
+                        'line': csv_reader.line_num,
+                        'csv_keys_list_len': csv_keys_list_len,
+                        'csv_keys_str': csv_keys_str,
+                        'csv_keys_list': csv_keys_list,
+                        'csv_values_list_len': len(csv_values_list),
+                        'csv_values_str': csv_values_str,
+                        'csv_values_list': csv_values_list,
+                    }
+                )
+                raise RequestsFortifiedModuleError(
+                    error_message="{0}: Mismatch: CSV Key '{1}': Values '{2}'".format(request_label, csv_keys_str, csv_values_str),
+                    error_code=RequestsFortifiedErrorCodes.REQ_ERR_UNEXPECTED_VALUE
+                )
 
-                csv_values_str = str_line.replace('\n', ' ').replace('\r', ' ')
+            yield csv_values_list
 
-                csv_values_str_io = io.StringIO(csv_values_str)
-                reader = csv.reader(csv_values_str_io, delimiter=csv_delimiter)
-                csv_values_list = None
-                for row in reader:
-                    csv_values_list = row
+    def request_ndjson_download(
+        self,
+        request_method,
+        request_url,
+        request_params=None,
+        request_data=None,
+        request_retry=None,
+        request_retry_func=None,
+        request_retry_excps=None,
+        request_retry_http_status_codes=None,
+        request_retry_excps_func=None,
+        request_headers=None,
+        request_auth=None,
+        request_label=None,
+        build_request_curl=True,
+        allow_redirects=True,
+        verify=True,
+        chunk_size=8192,
+    ):
+        """Stream NDJSON (newline-delimited JSON) and Yield JSON by line.
 
-                csv_values_list_len = len(csv_values_list)
+        Response is parsed line-by-line as it arrives, so memory is
+        bounded by the longest line.
 
-                if csv_values_list_len < csv_keys_list_len:
-                    pre_str_line = str_line
+        Args:
+            request_method: request_method for the new :class:`Request` object.
+            request_url: URL for the new :class:`Request` object.
+            request_params: (optional) Dictionary or bytes to be sent in the query
+                string for the :class:`Request`.
+            request_data: (optional) Dictionary, bytes, or file-like object to
+                send in the body of the :class:`Request`.
+            request_retry: (optional) Retry configuration.
+            request_headers: (optional) Dictionary of HTTP Headers to
+                send with the :class:`Request`.
+            request_auth: (optional) Auth tuple to enable
+                Basic/Digest/Custom HTTP Auth.
+            allow_redirects: (optional) Boolean. Set to True if
+                POST/PUT/DELETE redirect following is allowed.
+            verify: (optional) whether the SSL cert will be verified. A
+                CA_BUNDLE path can also be provided. Defaults to ``True``.
+            chunk_size: (optional) Bytes read at a time from response.
+
+        Returns:
+            Generator containing JSON values by line.
+
+        """
+        _request_label = "Request Download NDJSON"
+        request_label = "{0}: {1}".format(request_label, _request_label) if request_label is not None else _request_label
+
+        log.info(
+            "{0}: Start".format(request_label),
+            extra={'request_url': request_url}
+        )
+
+        # Request and stream share total time budget, as request_retry 'deadline'.
+        deadline = Deadline.from_request_retry(request_retry)
+        if deadline is not None:
+            request_retry = dict(request_retry, deadline=deadline)
+
+        response = self.requests_client.request(
+            request_method=request_method,
+            request_url=request_url,
+            request_params=request_params,
+            request_data=request_data,
+            request_retry=request_retry,
+            request_retry_func=request_retry_func,
+            request_retry_excps=request_retry_excps,
+            request_retry_http_status_codes=request_retry_http_status_codes,
+            request_retry_excps_func=request_retry_excps_func,
+            request_headers=request_headers,
+            request_auth=request_auth,
+            build_request_curl=build_request_curl,
+            allow_redirects=allow_redirects,
+            verify=verify,
+            stream=True,
+            request_label=request_label
+        )
+
+        validate_response(response=response, request_curl=self.built_request_curl, request_label=request_label)
+
+        log.debug(
+            "{0}: Status: Details".format(request_label),
+            extra={
+                'response_content_type': response.headers.get('Content-Type', None),
+                'response_transfer_encoding': response.headers.get('Transfer-Encoding', None),
+                'response_http_status_code': response.status_code
+            }
+        )
+
+        line_count = 0
+        json_line_count = 0
+
+        response.raw.decode_content = True
+        response.raw.auto_close = False
+        response_raw = response.raw
+        if deadline is not None:
+            response_raw = ResponseRawReader(response, deadline=deadline, request_label=request_label)
+
+        try:
+            ndjson_byte_stream = BomStream(
+                io.BufferedReader(response_raw, buffer_size=max(chunk_size, io.DEFAULT_BUFFER_SIZE))
+            )
+
+            for text_line in ndjson_byte_stream.text_reader():
+                line_count += 1
+                if not text_line.strip():
                     continue
 
-                if csv_keys_list_len != csv_values_list_len:
-                    log.error(
-                        "{0}: Mismatch: CSV Key".format(request_label),
-                        extra={
-                            'line': line_count,
-                            'csv_keys_list_len': csv_keys_list_len,
-                            'csv_keys_str': csv_keys_str,
-                            'csv_keys_list': csv_keys_list,
-                            'csv_values_list_len': csv_values_list_len,
-                            'csv_values_str': csv_values_str,
-                            'csv_values_list': csv_values_list,
-                        }
-                    )
-                    raise RequestsFortifiedModuleError(
-                        error_message="{0}: Mismatch: CSV Key '{1}': Values '{2}'".format(request_label, csv_keys_str, csv_values_str),
-                        error_code=RequestsFortifiedErrorCodes.REQ_ERR_UNEXPECTED_VALUE
+                try:
+                    json_line = ndjson_loads(text_line, line_count)
+                except ValueError as json_decode_ex:
+                    # Response is not passed: reading its text would pull the
+                    # remainder of the stream into memory.
+                    handle_json_decode_error(
+                        response_decode_ex=json_decode_ex,
+                        response=None,
+                        response_extra={
+                            'json_line': line_count,
+                            'json_line_count': json_line_count,
+                            'response_details': text_line[:256],
+                            'error_exception': base_class_name(json_decode_ex),
+                            'error_details': get_exception_message(json_decode_ex),
+                        },
+                        request_label=request_label,
+                        request_curl=self.built_request_curl
                     )
 
-                json_data_row = {}
-                for idx, csv_key in enumerate(csv_keys_list):
-                    csv_value = csv_values_list[idx]
-                    json_data_row.update({csv_key: csv_value.strip('"')})
+                json_line_count += 1
+                yield json_line
+        finally:
+            response.close()
+
+        log.info(
+            "{0}: Finished".format(request_label),
+            extra={
+                'line_count': line_count,
+                'json_line_count': json_line_count,
+            }
+        )
+
+    def stream_ndjson(
+        self,
+        request_url,
+        request_params,
+        request_retry=None,
+        request_headers=None,
+        request_label=None,
+        chunk_size=8192,
+    ):
+        """Stream NDJSON and Yield JSON
 
-                yield json_data_row
+        Args:
+            request_url:
+            request_params:
+            request_retry:
+            request_headers:
+            chunk_size:
+
+        Returns:
+
+        """
+        _request_label = "Stream NDJSON"
+        request_label = "{0}: {1}".format(request_label, _request_label) if request_label is not None else _request_label
+
+        return self.request_ndjson_download(
+            request_method='GET',
+            request_url=request_url,
+            request_params=request_params,
+            request_retry=request_retry,
+            request_headers=request_headers,
+            request_label=request_label,
+            chunk_size=chunk_size,
+        )
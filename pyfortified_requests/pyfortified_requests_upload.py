@@ -3,6 +3,13 @@
 # @namespace pyfortified_requests
 
 import logging
+import threading
+import time
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    as_completed,
+)
+
 from pyfortified_logging import (LoggingFormat, LoggingOutput)
 
 from pyfortified_requests import (
@@ -16,14 +23,28 @@ from pyfortified_requests.errors import (
 )
 from pyfortified_requests.exceptions.custom import (
     RequestsFortifiedBaseError,
+    RequestsFortifiedDeadlineExceededError,
     RequestsFortifiedModuleError,
+    RequestsFortifiedValueError,
 )
 from pyfortified_requests.support import (
     base_class_name,
+    ChecksumReader,
+    Deadline,
+    get_upload_protocol,
+    iter_ndjson_chunks,
     mv_request_retry_excps_func,
+    NDJSON_CONTENT_TYPE,
     python_check_version,
     REQUEST_RETRY_EXCPS,
     REQUEST_RETRY_HTTP_STATUS_CODES,
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_CHECKSUM_MD5,
+    UploadChecksums,
+    UploadChunks,
+    UPLOAD_PART_SIZE,
+    UPLOAD_PROTOCOL_S3,
+    UploadManifest,
 )
 
 log = logging.getLogger(__name__)
@@ -32,6 +53,7 @@ python_check_version(__python_required_version__)
 
 class RequestsFortifiedUpload(object):
     __mv_request = None
+    __upload_local = None
 
     def __init__(
         self,
@@ -44,6 +66,7 @@ class RequestsFortifiedUpload(object):
             logger_level=logger_level,
             logger_output=logger_output
         )
+        self.__upload_local = threading.local()
 
     @property
     def logger(self):
@@ -71,25 +94,63 @@ class RequestsFortifiedUpload(object):
         upload_data_file_size,
         is_upload_gzip,
         request_label=None,
-        upload_timeout=None
+        upload_timeout=None,
+        upload_compression=None,
+        upload_compression_level=None,
+        upload_checksums=None,
+        upload_total_timeout=None
     ):
         """Upload File to requested URL.
 
         :param upload_request_url:
         :param upload_data_file_path:
         :param upload_data_file_size:
-        :param is_upload_gzip:
+        :param is_upload_gzip: File is already gzip compressed.
         :param request_label:
         :param upload_timeout:
+        :param upload_compression: (optional) Compress uncompressed file while sending,
+            'gzip' or 'zstd'; sent using chunked transfer encoding, so
+            'upload_data_file_size' is not used, see :meth:`request_upload_stream`.
+            Not with 'is_upload_gzip'.
+        :param upload_compression_level: (optional) Compression level.
+        :param upload_checksums: (optional) Checksums computed while file is sent,
+            see :meth:`_upload_checksums_verify`.
+        :param upload_total_timeout: (optional) Seconds for upload overall, across retries,
+            see request_retry 'total_timeout' of :meth:`RequestsFortified.request`.
         :return:
         """
         _request_label = "Request Upload JSON File"
         request_label = "{0}: {1}".format(request_label, _request_label)  if request_label is not None else _request_label
 
+        upload_request_retry = {"timeout": 60, "tries": -1, "delay": 60}
+
+        if upload_compression:
+            if is_upload_gzip:
+                raise RequestsFortifiedValueError(
+                    error_message="{0}: File is already gzip compressed: Upload compression '{1}'".format(
+                        request_label, upload_compression
+                    ),
+                )
+
+            # File is seekable, so each retry sends it again from its start.
+            with open(upload_data_file_path, 'rb') as upload_fp:
+                return self.request_upload_stream(
+                    upload_request_url=upload_request_url,
+                    upload_source=upload_fp,
+                    upload_content_type='application/json; charset=utf8',
+                    request_label=request_label,
+                    upload_timeout=upload_timeout,
+                    upload_compression=upload_compression,
+                    upload_compression_level=upload_compression_level,
+                    upload_checksums=upload_checksums,
+                    upload_request_retry=upload_request_retry,
+                    upload_total_timeout=upload_total_timeout,
+                )
+
+        checksums = self._upload_checksums(upload_checksums, request_label)
+
         request_retry_excps = REQUEST_RETRY_EXCPS
         request_retry_http_status_codes = REQUEST_RETRY_HTTP_STATUS_CODES
-
-        upload_request_retry = {"timeout": 60, "tries": -1, "delay": 60}
         upload_request_headers = {'Content-Length': "{0}".format(upload_data_file_size)}
 
         if is_upload_gzip:
@@ -99,6 +160,8 @@ class RequestsFortifiedUpload(object):
 
         if upload_timeout:
             upload_request_retry["timeout"] = int(upload_timeout)
+        if upload_total_timeout:
+            upload_request_retry["total_timeout"] = upload_total_timeout
 
         upload_extra = {
             'upload_request_url': upload_request_url,
@@ -119,7 +182,7 @@ class RequestsFortifiedUpload(object):
                     request_method='PUT',
                     request_url=upload_request_url,
                     request_params=None,
-                    request_data=upload_fp,
+                    request_data=ChecksumReader(upload_fp, checksums) if checksums else upload_fp,
                     request_retry=upload_request_retry,
                     request_headers=upload_request_headers,
                     request_retry_excps=request_retry_excps,
@@ -153,6 +216,8 @@ class RequestsFortifiedUpload(object):
                 error_code=RequestsFortifiedErrorCodes.REQ_ERR_UPLOAD_DATA
             )
 
+        self._upload_checksums_verify(response, checksums, request_label)
+
         log.info(
             "{0}: Finished".format(request_label)
         )
@@ -165,7 +230,9 @@ class RequestsFortifiedUpload(object):
         upload_data_size,
         request_label=None,
         upload_timeout=None,
-        build_request_curl=False
+        build_request_curl=False,
+        upload_checksums=None,
+        upload_total_timeout=None
     ):
         """Upload Data to requested URL.
 
@@ -173,6 +240,10 @@ class RequestsFortifiedUpload(object):
         :param upload_data:
         :param upload_data_size:
         :param upload_timeout:
+        :param upload_checksums: (optional) Checksums of bytes or str data,
+            sent as checksum headers, see :meth:`_upload_checksums_verify`.
+        :param upload_total_timeout: (optional) Seconds for upload overall, across retries,
+            see request_retry 'total_timeout' of :meth:`RequestsFortified.request`.
         :return:
         """
         _request_label = 'Request Upload Data'
@@ -199,6 +270,21 @@ class RequestsFortifiedUpload(object):
 
         if upload_timeout:
             upload_request_retry["timeout"] = int(upload_timeout)
+        if upload_total_timeout:
+            upload_request_retry["total_timeout"] = upload_total_timeout
+
+        checksums = self._upload_checksums(upload_checksums, request_label)
+        if checksums:
+            if isinstance(upload_data, str):
+                upload_data = upload_data.encode('utf-8')
+            if not isinstance(upload_data, (bytes, bytearray)):
+                raise RequestsFortifiedValueError(
+                    error_message="{0}: Checksums require bytes or str data: '{1}'".format(
+                        request_label, base_class_name(upload_data)
+                    ),
+                )
+            checksums.update(upload_data)
+            request_headers.update(checksums.headers())
 
         try:
             response = self.mv_request.request(
@@ -239,5 +325,537 @@ class RequestsFortifiedUpload(object):
                 error_code=RequestsFortifiedErrorCodes.REQ_ERR_UPLOAD_DATA
             )
 
+        self._upload_checksums_verify(response, checksums, request_label)
+
         log.info("{0}: Finished".format(request_label))
         return response
+
+    def request_upload_stream(
+        self,
+        upload_request_url,
+        upload_source,
+        upload_content_type='application/octet-stream',
+        request_label=None,
+        upload_timeout=None,
+        upload_request_method='PUT',
+        upload_chunk_size=UPLOAD_CHUNK_SIZE,
+        upload_request_headers=None,
+        build_request_curl=False,
+        upload_compression=None,
+        upload_compression_level=None,
+        upload_checksums=None,
+        upload_request_retry=None,
+        upload_total_timeout=None
+    ):
+        """Upload source of unknown size to requested URL.
+
+        Source is read in chunks of 'upload_chunk_size' bytes and sent using
+        chunked transfer encoding, so memory stays constant regardless of
+        payload size, and no size needs to be known in advance.
+
+        By default the upload is attempted once. With 'upload_request_retry'
+        tries, retries replay the body from a buffer of up to request_retry
+        'body_replay_size' bytes, see :meth:`RequestsFortified.request`;
+        a body streamed beyond it fails with
+        :class:`RequestsFortifiedBodyNotReplayableError`.
+
+        :param upload_request_url:
+        :param upload_source: bytes, str, file-like object, or iterable/generator of bytes or str.
+        :param upload_content_type: (optional) Content-Type header.
+        :param request_label:
+        :param upload_timeout:
+        :param upload_request_method: (optional) 'PUT' or 'POST'.
+        :param upload_chunk_size: (optional) Bytes per sent chunk.
+        :param upload_request_headers: (optional) Additional HTTP headers.
+        :param build_request_curl:
+        :param upload_compression: (optional) Compress while sending, 'gzip' or 'zstd';
+            sets 'Content-Encoding' header.
+        :param upload_compression_level: (optional) Compression level.
+        :param upload_checksums: (optional) Checksums of sent (compressed) bytes,
+            computed while streaming, see :meth:`_upload_checksums_verify`.
+        :param upload_request_retry: (optional) Retry configuration, see :meth:`RequestsFortified.request`.
+        :param upload_total_timeout: (optional) Seconds for upload overall, across retries.
+        :return:
+        """
+        _request_label = 'Request Upload Stream'
+        request_label = "{0}: {1}".format(request_label, _request_label) if request_label is not None else _request_label
+
+        log.info(
+            "{0}: Start".format(request_label),
+            extra={
+                'upload_request_url': upload_request_url,
+                'upload_chunk_size': upload_chunk_size,
+                'upload_compression': upload_compression,
+            }
+        )
+
+        upload_request_retry = dict({"timeout": 60, "tries": 1, "delay": 60}, **(upload_request_retry or {}))
+
+        request_headers = {
+            'Content-Type': upload_content_type,
+            'Accept': 'text/plain',
+        }
+        if upload_compression:
+            request_headers['Content-Encoding'] = upload_compression
+        if upload_request_headers:
+            request_headers.update(upload_request_headers)
+
+        if upload_timeout:
+            upload_request_retry["timeout"] = int(upload_timeout)
+        if upload_total_timeout:
+            upload_request_retry["total_timeout"] = upload_total_timeout
+
+        checksums = self._upload_checksums(upload_checksums, request_label)
+
+        try:
+            upload_chunks = UploadChunks(
+                upload_source,
+                chunk_size=upload_chunk_size,
+                compression=upload_compression,
+                compression_level=upload_compression_level,
+                checksums=checksums,
+            )
+        except ValueError as ex:
+            raise RequestsFortifiedValueError(
+                error_message="{0}: {1}".format(request_label, ex),
+                errors=ex,
+            )
+
+        try:
+            response = self.mv_request.request(
+                request_method=upload_request_method,
+                request_url=upload_request_url,
+                request_params=None,
+                request_data=upload_chunks,
+                request_retry=upload_request_retry,
+                request_retry_excps=REQUEST_RETRY_EXCPS,
+                request_retry_http_status_codes=REQUEST_RETRY_HTTP_STATUS_CODES,
+                request_retry_excps_func=mv_request_retry_excps_func,
+                request_headers=request_headers,
+                allow_redirects=False,
+                build_request_curl=build_request_curl,
+                request_label=request_label
+            )
+        except RequestsFortifiedBaseError as tmv_ex:
+            tmv_ex_extra = tmv_ex.to_dict()
+            tmv_ex_extra.update({'error_exception': base_class_name(tmv_ex)})
+
+            log.error(
+                "{0}: Failed".format(request_label),
+                extra=tmv_ex_extra
+            )
+            raise
+
+        except Exception as ex:
+            print_traceback(ex)
+
+            log.error(
+                "{0}: Failed: Unexpected".format(request_label),
+                extra={'error_exception': base_class_name(ex),
+                       'error_details': get_exception_message(ex)}
+            )
+            raise RequestsFortifiedModuleError(
+                error_message="{0}: Failed: Unexpected: {1}: {2}".format(request_label, base_class_name(ex), get_exception_message(ex)),
+                errors=ex,
+                error_code=RequestsFortifiedErrorCodes.REQ_ERR_UPLOAD_DATA
+            )
+
+        self._upload_checksums_verify(response, checksums, request_label)
+        self._upload_finished(upload_chunks, request_label)
+        return response
+
+    def _upload_checksums(self, upload_checksums, request_label):
+        """:class:`UploadChecksums` of requested algorithms, None if none requested.
+        """
+        if not upload_checksums:
+            return None
+        try:
+            return UploadChecksums(upload_checksums)
+        except ValueError as ex:
+            raise RequestsFortifiedValueError(
+                error_message="{0}: {1}".format(request_label, ex),
+                errors=ex,
+            )
+
+    def _upload_checksums_verify(self, response, checksums, request_label):
+        """Provide upload checksums on response, and verify them against server ETag.
+
+        Sets 'response.upload_checksums', dictionary of algorithm
+        ('md5', 'sha256', 'crc32c') to base64 digest of sent body.
+        An ETag in MD5 hex form which does not match the MD5 of the
+        sent body raises error 'REQ_ERR_UPLOAD_CHECKSUM'.
+        """
+        if not checksums:
+            return
+
+        response.upload_checksums = checksums.digests
+
+        etag = response.headers.get('ETag')
+        etag_matches = checksums.verify_etag(etag)
+
+        log.debug(
+            "{0}: Checksums".format(request_label),
+            extra={
+                'upload_checksums': response.upload_checksums,
+                'upload_checksums_size': checksums.size,
+                'upload_etag': etag,
+                'upload_etag_matches': etag_matches,
+            }
+        )
+
+        if etag_matches is False:
+            log.error(
+                "{0}: Failed: Checksum".format(request_label),
+                extra={
+                    'upload_etag': etag,
+                    'upload_md5': checksums.hexdigests[UPLOAD_CHECKSUM_MD5],
+                }
+            )
+            raise RequestsFortifiedModuleError(
+                error_message="{0}: Failed: Checksum: ETag {1} does not match MD5 '{2}'".format(
+                    request_label, etag, checksums.hexdigests[UPLOAD_CHECKSUM_MD5]
+                ),
+                error_code=RequestsFortifiedErrorCodes.REQ_ERR_UPLOAD_CHECKSUM
+            )
+
+    def _upload_finished(self, upload_chunks, request_label):
+        """Log and record raw vs sent byte counters of streamed upload.
+        """
+        metrics = self.mv_request._metrics
+        metrics.inc('api_upload.count')
+        metrics.inc('api_upload.bytes_raw', upload_chunks.bytes_read)
+        metrics.inc('api_upload.bytes_sent', upload_chunks.bytes_sent)
+
+        log.info(
+            "{0}: Finished".format(request_label),
+            extra={
+                'upload_bytes_raw': upload_chunks.bytes_read,
+                'upload_bytes_sent': upload_chunks.bytes_sent,
+                'upload_chunk_count': upload_chunks.chunk_count,
+                'upload_compression': upload_chunks.compression,
+                'upload_compression_ratio': upload_chunks.compression_ratio,
+            }
+        )
+
+    def request_upload_ndjson(
+        self,
+        upload_request_url,
+        upload_records,
+        request_label=None,
+        upload_timeout=None,
+        upload_request_method='PUT',
+        upload_chunk_size=65536,
+        build_request_curl=False,
+        upload_compression=None,
+        upload_compression_level=None,
+        upload_total_timeout=None
+    ):
+        """Upload records as NDJSON (newline-delimited JSON) to requested URL.
+
+        Records are serialized lazily and sent using chunked transfer encoding,
+        so the request body is never materialized in memory.
+
+        A generator body cannot be replayed, so the upload is attempted once.
+
+        :param upload_request_url:
+        :param upload_records: Iterable or generator of JSON serializable records.
+        :param request_label:
+        :param upload_timeout:
+        :param upload_request_method: (optional) 'PUT' or 'POST'.
+        :param upload_chunk_size: (optional) Approximate size in bytes of sent chunks.
+        :param build_request_curl:
+        :param upload_compression: (optional) Compress while sending, 'gzip' or 'zstd'.
+        :param upload_compression_level: (optional) Compression level.
+        :param upload_total_timeout: (optional) Seconds for upload overall.
+        :return:
+        """
+        _request_label = 'Request Upload NDJSON'
+        request_label = "{0}: {1}".format(request_label, _request_label) if request_label is not None else _request_label
+
+        return self.request_upload_stream(
+            upload_request_url=upload_request_url,
+            upload_source=iter_ndjson_chunks(upload_records, chunk_size=upload_chunk_size),
+            upload_content_type=NDJSON_CONTENT_TYPE,
+            request_label=request_label,
+            upload_timeout=upload_timeout,
+            upload_request_method=upload_request_method,
+            upload_chunk_size=upload_chunk_size,
+            build_request_curl=build_request_curl,
+            upload_compression=upload_compression,
+            upload_compression_level=upload_compression_level,
+            upload_total_timeout=upload_total_timeout,
+        )
+
+    def _upload_request_client(self):
+        """RequestsFortified of current thread, as its retry state is per instance.
+        """
+        if not hasattr(self.__upload_local, 'mv_request'):
+            self.__upload_local.mv_request = RequestsFortified(
+                logger_format=self.mv_request.logger_format,
+                logger_level=self.mv_request.logger_level,
+                logger_output=self.mv_request.logger_output
+            )
+        return self.__upload_local.mv_request
+
+    def request_upload_resumable(
+        self,
+        upload_request_url,
+        upload_data_file_path,
+        upload_protocol=UPLOAD_PROTOCOL_S3,
+        upload_part_size=UPLOAD_PART_SIZE,
+        upload_max_workers=4,
+        upload_manifest_path=None,
+        upload_part_retry=None,
+        upload_request_headers=None,
+        request_label=None,
+        upload_timeout=None,
+        upload_total_timeout=None,
+        upload_abort_on_failure=True
+    ):
+        """Upload File in parts, resumable after interruption.
+
+        File is split into parts of 'upload_part_size', sent concurrently
+        when the protocol allows it, each with its own retries and MD5
+        checksum, and streamed from the file. Completed parts are recorded
+        in a manifest file, so calling again after an interruption, e.g.
+        process exit or 'upload_total_timeout' exhausted, only sends the
+        remaining parts. The manifest is removed once the upload completes.
+
+        :param upload_request_url: Target URL: S3 object URL, or tus creation URL.
+        :param upload_data_file_path:
+        :param upload_protocol: (optional) 's3', 'tus', or :class:`UploadProtocol` instance.
+        :param upload_part_size: (optional) Bytes per part.
+        :param upload_max_workers: (optional) Parts sent concurrently.
+        :param upload_manifest_path: (optional) Manifest path,
+            default upload file path with suffix '.upload.json'.
+        :param upload_part_retry: (optional) Retry configuration per part:
+            'tries' (default 5), 'delay' (default 1), 'backoff' (default 2), 'max_delay' (default 60).
+        :param upload_request_headers: (optional) HTTP headers sent with every request.
+        :param request_label:
+        :param upload_timeout:
+        :param upload_total_timeout: (optional) Seconds for upload overall, shared by
+            all requests, parts and their retries; once exhausted, parts not yet
+            sent are left in the manifest for resuming.
+        :param upload_abort_on_failure: (optional) Once part retries are exhausted,
+            or upon any other failure than 'upload_total_timeout', abort upload on
+            server, e.g. S3 abort multipart upload or tus termination, and remove
+            manifest; if False, manifest is kept for resuming.
+        :return: Response of completing request, if any.
+        """
+        _request_label = 'Request Upload Resumable'
+        request_label = "{0}: {1}".format(request_label, _request_label) if request_label is not None else _request_label
+
+        try:
+            protocol = get_upload_protocol(upload_protocol)
+        except ValueError as ex:
+            raise RequestsFortifiedValueError(
+                error_message="{0}: {1}".format(request_label, ex),
+                errors=ex,
+            )
+
+        part_retry = {'tries': 5, 'delay': 1, 'backoff': 2, 'max_delay': 60}
+        part_retry.update(upload_part_retry or {})
+
+        upload_request_retry = {"timeout": int(upload_timeout) if upload_timeout else 60, "tries": 1, "delay": 1}
+
+        deadline = Deadline(upload_total_timeout) if upload_total_timeout else None
+        if deadline is not None:
+            upload_request_retry["deadline"] = deadline
+
+        def request(request_label_part, request_headers=None, **kwargs):
+            headers = dict(upload_request_headers or {})
+            headers.update(request_headers or {})
+            return self._upload_request_client().request(
+                request_retry=dict(upload_request_retry),
+                request_retry_excps=REQUEST_RETRY_EXCPS,
+                request_retry_http_status_codes=REQUEST_RETRY_HTTP_STATUS_CODES,
+                request_retry_excps_func=mv_request_retry_excps_func,
+                request_headers=headers,
+                allow_redirects=False,
+                build_request_curl=False,
+                request_label="{0}: {1}".format(request_label, request_label_part),
+                **kwargs
+            )
+
+        manifest_path = upload_manifest_path or "{0}.upload.json".format(upload_data_file_path)
+        manifest = UploadManifest.load(manifest_path)
+
+        if manifest is not None and not manifest.matches(
+            protocol.name, upload_request_url, upload_data_file_path, upload_part_size
+        ):
+            log.warning(
+                "{0}: Manifest: Mismatch: Restart".format(request_label),
+                extra={'upload_manifest_path': manifest_path}
+            )
+            manifest = None
+
+        upload_extra = {
+            'upload_request_url': upload_request_url,
+            'upload_data_file_path': upload_data_file_path,
+            'upload_protocol': protocol.name,
+            'upload_part_size': upload_part_size,
+            'upload_manifest_path': manifest_path,
+        }
+
+        try:
+            if manifest is None:
+                manifest = UploadManifest(
+                    manifest_path=manifest_path,
+                    protocol=protocol.name,
+                    upload_url=upload_request_url,
+                    source_path=upload_data_file_path,
+                    part_size=upload_part_size,
+                )
+                protocol.create(request, manifest)
+                manifest.save()
+                upload_extra.update({'upload_resumed': False})
+            else:
+                protocol.resume(request, manifest)
+                upload_extra.update({'upload_resumed': True})
+
+            part_numbers = manifest.pending_parts()
+            upload_extra.update({
+                'upload_part_count': manifest.part_count,
+                'upload_parts_pending': len(part_numbers),
+            })
+            log.info("{0}: Start".format(request_label), extra=upload_extra)
+
+            max_workers = max(1, upload_max_workers) if protocol.concurrent else 1
+            upload_failed = threading.Event()
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._upload_part,
+                        request, protocol, manifest, part_number, part_retry, upload_failed, request_label,
+                        deadline
+                    )
+                    for part_number in part_numbers
+                ]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+            response = protocol.complete(request, manifest)
+
+        except RequestsFortifiedBaseError as tmv_ex:
+            tmv_ex_extra = tmv_ex.to_dict()
+            tmv_ex_extra.update({'error_exception': base_class_name(tmv_ex)})
+            tmv_ex_extra.update(upload_extra)
+            log.error("{0}: Failed: Resumable".format(request_label), extra=tmv_ex_extra)
+
+            if upload_abort_on_failure and not isinstance(tmv_ex, RequestsFortifiedDeadlineExceededError):
+                # Abort is not bound by exhausted total timeout.
+                upload_request_retry.pop('deadline', None)
+                self._upload_resumable_abort(request, protocol, manifest, request_label)
+            raise
+
+        except Exception as ex:
+            log.error(
+                "{0}: Failed: Resumable".format(request_label),
+                extra=dict(
+                    upload_extra,
+                    error_exception=base_class_name(ex),
+                    error_details=get_exception_message(ex)
+                )
+            )
+
+            if upload_abort_on_failure:
+                upload_request_retry.pop('deadline', None)
+                self._upload_resumable_abort(request, protocol, manifest, request_label)
+            raise RequestsFortifiedModuleError(
+                error_message="{0}: Failed: Resumable from '{1}': {2}: {3}".format(
+                    request_label, manifest_path, base_class_name(ex), get_exception_message(ex)
+                ),
+                errors=ex,
+                error_code=RequestsFortifiedErrorCodes.REQ_ERR_UPLOAD_DATA
+            )
+
+        manifest.remove()
+
+        log.info("{0}: Finished".format(request_label), extra=upload_extra)
+        return response
+
+    def _upload_resumable_abort(self, request, protocol, manifest, request_label):
+        """Abort failed upload on server, and remove its manifest.
+
+        Failure to abort is logged, not raised, so the upload failure is;
+        the manifest is then kept, as the upload still exists on server.
+        """
+        if manifest is None:
+            return
+
+        try:
+            protocol.abort(request, manifest)
+        except Exception as ex:
+            log.error(
+                "{0}: Abort: Failed".format(request_label),
+                extra={
+                    'upload_manifest_path': manifest.manifest_path,
+                    'error_exception': base_class_name(ex),
+                    'error_details': get_exception_message(ex),
+                }
+            )
+            return
+
+        manifest.remove()
+        log.warning(
+            "{0}: Aborted".format(request_label),
+            extra={'upload_manifest_path': manifest.manifest_path}
+        )
+
+    def _upload_part(
+        self, request, protocol, manifest, part_number, part_retry, upload_failed, request_label, deadline=None
+    ):
+        """Send part with retries, recording it in manifest once sent.
+
+        Parts not yet started are skipped once any part failed,
+        or once 'deadline' is exhausted.
+        """
+        if upload_failed.is_set():
+            return
+
+        data = manifest.read_part(part_number)
+        data_md5 = data.md5()
+
+        _tries, _delay = part_retry['tries'], part_retry['delay']
+        while True:
+            _tries -= 1
+            try:
+                part_details = protocol.upload_part(request, manifest, part_number, data, data_md5)
+                break
+            except (RequestsFortifiedBaseError, ValueError) as ex:
+                if _tries <= 0 or upload_failed.is_set() or isinstance(ex, RequestsFortifiedDeadlineExceededError):
+                    upload_failed.set()
+                    raise
+                if deadline is not None:
+                    try:
+                        deadline.check("{0}: Part {1}".format(request_label, part_number), delay=_delay)
+                    except RequestsFortifiedDeadlineExceededError:
+                        upload_failed.set()
+                        raise
+                log.warning(
+                    "{0}: Part {1}: Retry".format(request_label, part_number),
+                    extra={
+                        'tries': _tries,
+                        'delay': _delay,
+                        'error_exception': base_class_name(ex),
+                        'error_details': get_exception_message(ex),
+                    }
+                )
+                time.sleep(_delay)
+                _delay = min(_delay * part_retry['backoff'], part_retry['max_delay'])
+
+        manifest.complete_part(part_number, **part_details)
+
+        log.debug(
+            "{0}: Part {1}: Completed".format(request_label, part_number),
+            extra={
+                'upload_parts_completed': len(manifest.parts),
+                'upload_part_count': manifest.part_count,
+            }
+        )
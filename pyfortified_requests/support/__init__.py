@@ -3,8 +3,12 @@
 # @namespace pyfortified_requests
 
 from .bom_encoding import (
+    BOM_SNIFF_SIZE,
+    bom_text_encoding,
+    BomStream,
     detect_bom,
     get_bom_encoding,
+    get_bom_offset,
     remove_bom,
 )
 from .constants import (
@@ -24,17 +28,135 @@ from .curl import (
     command_line_request_curl,
     parse_curl,
 )
+from .deadline import Deadline
+from .decompress import (
+    STREAM_COMPRESSIONS,
+    StreamDecompressor,
+)
+from .http_status import (
+    HTTP_STATUS_CLASSES,
+    HTTP_STATUS_CLIENT_ERROR_CODES,
+    HTTP_STATUS_SERVICE_ERROR_CODES,
+    http_status_class,
+    http_status_classes,
+    HttpStatusClass,
+)
+from .hedge import (
+    HEDGE_BUDGET,
+    HEDGE_MAX_WORKERS,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_PERCENTILE,
+    HEDGE_WINDOW,
+    HEDGE_WORKERS,
+    hedge_delay,
+    hedged_call,
+    HedgeBudget,
+    HedgeWorkers,
+    is_hedge_body,
+)
+from .idempotency import (
+    IDEMPOTENCY_KEY_HEADER,
+    IDEMPOTENT_METHODS,
+    idempotency_key,
+    is_idempotent_method,
+    set_idempotency_key,
+)
+from .json_stream import (
+    iter_json_items,
+    JSON_ITEM,
+    JsonStreamDecodeError,
+)
+from .mmap_file import (
+    mmap_decode,
+    mmap_open,
+    mmap_text_reader,
+    MmapReader,
+)
+from .multipart_upload import (
+    get_upload_protocol,
+    part_md5,
+    S3MultipartUploadProtocol,
+    TusUploadProtocol,
+    UPLOAD_PART_SIZE,
+    UPLOAD_PROTOCOL_S3,
+    UPLOAD_PROTOCOL_TUS,
+    UPLOAD_PROTOCOLS,
+    UploadManifest,
+    UploadPart,
+    UploadProtocol,
+)
+from .ndjson import (
+    iter_ndjson_chunks,
+    ndjson_loads,
+    NDJSON_CONTENT_TYPE,
+)
 from .response import (
     build_response_error_details,
+    capture_response_error_details,
+    CSV_BATCH_SIZE,
+    CSV_OUTPUT_COLUMNS,
+    CSV_OUTPUT_DICT,
+    CSV_OUTPUT_TUPLES,
+    CsvBatch,
+    CSV_PARSE_RANGE_SIZE,
+    csv_parse_file_parallel,
+    csv_row_dict,
+    csv_rows_output,
     csv_skip_last_row,
+    csv_split_ranges,
+    csv_split_supported,
+    CSV_TYPE_BOOL,
+    CSV_TYPE_DATE,
+    CSV_TYPE_FLOAT,
+    CSV_TYPE_INT,
+    CSV_TYPE_STR,
+    CsvColumnType,
+    CsvSchema,
+    ERROR_BODY_LIMIT,
+    error_content_text,
     handle_json_decode_error,
+    html_text_lines,
+    HtmlTextExtractor,
     requests_response_json,
     requests_response_text_html,
     requests_response_text_xml,
+    response_error_body,
+    RESPONSE_HEADER_REDACTED_VALUE,
+    RESPONSE_HEADERS_REDACTED,
+    response_headers_snapshot,
+    TEXT_EXTRACT_CHUNK_SIZE,
     validate_json_response,
     validate_response,
+    xml_dict,
+    xml_text_lines,
+)
+from .request_body import (
+    REQUEST_BODY_REPLAY_SIZE,
+    ReplayBufferedBody,
+    RequestBodyRewind,
+)
+from .retry_exception import (
+    classify_retry_exception,
+    CONNECT_PHASE_EXCEPTIONS,
+    exception_chain,
+    is_connect_phase_exception,
+    is_retry_exception,
+    mv_request_retry_excps_func,
+    register_retry_exception,
+    RETRY_EXCEPTIONS,
+)
+from .stream_watchdog import (
+    iter_response_chunks,
+    ResponseRawReader,
+    STREAM_IDLE_MIN_RATE,
+    StreamIdleTimeout,
+    StreamWatchdog,
+)
+from .timeout import (
+    REQUEST_TIMEOUT_TYPES,
+    request_timeout,
+    timeout_min,
 )
-from .retry_exception import mv_request_retry_excps_func
 from .requests_session_client import RequestsSessionClient
 from .utils import (
     base_class_name,
@@ -49,3 +171,26 @@ from .usage import (
     mem_usage,
 )
 from .metrics import Metrics
+from .progress import (
+    DownloadProgress,
+    chunk_size_bytes,
+    response_content_length,
+    response_wire_bytes,
+)
+from .upload_checksum import (
+    ChecksumReader,
+    UPLOAD_CHECKSUM_CRC32C,
+    UPLOAD_CHECKSUM_HEADERS,
+    UPLOAD_CHECKSUM_MD5,
+    UPLOAD_CHECKSUM_SHA256,
+    UPLOAD_CHECKSUMS,
+    UploadChecksums,
+)
+from .upload_stream import (
+    StreamCompressor,
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_COMPRESSION_GZIP,
+    UPLOAD_COMPRESSION_ZSTD,
+    UPLOAD_COMPRESSIONS,
+    UploadChunks,
+)
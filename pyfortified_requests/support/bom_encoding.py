@@ -3,9 +3,34 @@
 # @namespace pyfortified_requests
 
 import codecs
+import io
+import shutil
+
+from .decompress import STREAM_COMPRESSIONS
 
 # from pprintpp import pprint
 
+BOM_SNIFF_SIZE = 6
+
+# Codec decoding content following BOM; cp125x signatures are a UTF-8 BOM
+# mis-decoded as that code page and re-encoded as UTF-8.
+_BOM_TEXT_ENCODINGS = {
+    'UTF-8': 'utf-8',
+    'UTF-16BE': 'utf-16-be',
+    'UTF-16LE': 'utf-16-le',
+    'UTF-32BE': 'utf-32-be',
+    'UTF-32LE': 'utf-32-le',
+    'cp1250': 'utf-8',
+    'cp1251': 'utf-8',
+    'cp1252': 'utf-8',
+    'cp1253': 'utf-8',
+    'cp1254': 'utf-8',
+    'cp1255': 'utf-8',
+    'cp1256': 'utf-8',
+    'cp1257': 'utf-8',
+    'cp1258': 'utf-8',
+}
+
 
 def get_bom_encoding(file_header):
     """Check file header if it contains byte order mark (BOM)
@@ -61,9 +86,29 @@ def detect_bom(filename):
     return bom_enc, bom_len, bom_header
 
 
+def get_bom_offset(file_header):
+    """Byte offset of content following a text byte order mark (BOM).
+
+    Signatures of compressed content are not skipped.
+
+    Args:
+        file_header: Leading bytes, at least 6.
+
+    Returns:
+        Tuple of BOM encoding and offset, 0 if no text BOM.
+    """
+    bom_enc, bom_len = get_bom_encoding(bytes(file_header[:BOM_SNIFF_SIZE]))
+    if bom_enc in STREAM_COMPRESSIONS:
+        return bom_enc, 0
+    return bom_enc, bom_len
+
+
 def remove_bom(filename, newfilename):
     """Remove byte order mark (BOM) from File
 
+    Prefer reading from the :func:`get_bom_offset` offset of the
+    original file, which avoids the copy.
+
     Args:
         filename:
         newfilename:
@@ -77,12 +122,83 @@ def remove_bom(filename, newfilename):
         bom_enc, bom_len = get_bom_encoding(file_header)
 
         if bom_len > 0:
-            file_rb.seek(0)
-            file_rb.read(bom_len)
+            file_rb.seek(bom_len)
 
             # copy the rest of file
-            contents = file_rb.read()
             with open(file=newfilename, mode='wb+') as newfile_wb:
-                newfile_wb.write(contents)
+                shutil.copyfileobj(file_rb, newfile_wb)
 
         return bom_enc, bom_len
+
+
+def bom_text_encoding(bom_enc, encoding=None):
+    """Codec for decoding content following a detected BOM.
+
+    Args:
+        bom_enc: BOM encoding, see :func:`get_bom_encoding`.
+        encoding: (optional) Encoding when no text BOM was detected.
+
+    Returns:
+        Codec name, or 'encoding'.
+    """
+    return _BOM_TEXT_ENCODINGS.get(bom_enc, encoding)
+
+
+class BomStream(io.BufferedIOBase):
+    """Byte stream wrapper detecting and stripping a leading BOM on the fly.
+
+    Only the leading bytes are sniffed upon creation; the remainder
+    is passed through as read, without copying the stream.
+    """
+
+    def __init__(self, stream, encoding=None):
+        """
+        Args:
+            stream: Binary file-like object providing 'read(size)',
+                e.g. 'response.raw', a file, or :class:`MmapReader`.
+            encoding: (optional) Encoding when no text BOM is detected.
+        """
+        super(BomStream, self).__init__()
+        self._stream = stream
+
+        header = b''
+        while len(header) < BOM_SNIFF_SIZE:
+            chunk = stream.read(BOM_SNIFF_SIZE - len(header))
+            if not chunk:
+                break
+            header += chunk
+
+        self.bom_encoding, self.bom_len = get_bom_offset(header)
+        self.encoding = bom_text_encoding(self.bom_encoding, encoding)
+        self._pending = header[self.bom_len:]
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        pending = self._pending
+        if size is None or size < 0:
+            self._pending = b''
+            return pending + self._stream.read()
+        if pending:
+            self._pending = pending[size:]
+            return pending[:size]
+        return self._stream.read(size)
+
+    read1 = read
+
+    def readinto(self, b):
+        data = self.read(len(b))
+        size = len(data)
+        b[:size] = data
+        return size
+
+    def incremental_decoder(self, errors='strict'):
+        """Incremental decoder for detected encoding, default 'utf-8'.
+        """
+        return codecs.getincrementaldecoder(self.encoding or 'utf-8')(errors)
+
+    def text_reader(self, errors='strict', newline=None):
+        """Text stream decoding content with detected encoding, default 'utf-8'.
+        """
+        return io.TextIOWrapper(self, encoding=self.encoding or 'utf-8', errors=errors, newline=newline)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import logging
+import time
+
+from pyfortified_requests.exceptions.custom import (
+    RequestsFortifiedDeadlineExceededError,
+)
+from .timeout import timeout_min
+
+log = logging.getLogger(__name__)
+
+
+class Deadline(object):
+    """Total time budget of a logical request, across attempts and retry delays.
+
+    Passed on as request_retry 'deadline', so nested requests, e.g. each
+    attempt of a download, share the budget of the caller.
+    """
+
+    def __init__(self, total_timeout):
+        """
+        Args:
+            total_timeout: Seconds from now.
+        """
+        self.total_timeout = total_timeout
+        self.expires = time.monotonic() + total_timeout
+
+    def __repr__(self):
+        return "Deadline(total_timeout={0}, remaining={1:.3f})".format(self.total_timeout, self.remaining())
+
+    @classmethod
+    def from_request_retry(cls, request_retry):
+        """Deadline of request_retry: 'deadline' if provided, else new from 'total_timeout'.
+
+        Returns:
+            Deadline, or None if neither is provided.
+        """
+        if not request_retry:
+            return None
+        if request_retry.get('deadline') is not None:
+            return request_retry['deadline']
+        if request_retry.get('total_timeout') is not None:
+            return cls(request_retry['total_timeout'])
+        return None
+
+    def remaining(self):
+        """Seconds left, 0 once expired.
+        """
+        return max(0.0, self.expires - time.monotonic())
+
+    @property
+    def expired(self):
+        return self.remaining() <= 0
+
+    def timeout(self, timeout=None):
+        """Timeout shrunk to fit remaining budget.
+
+        Args:
+            timeout: (optional) Seconds, (connect, read) tuple, or None for no timeout.
+
+        Returns:
+            Seconds, or (connect, read) tuple.
+        """
+        return timeout_min(timeout, self.remaining())
+
+    def check(self, request_label=None, delay=0):
+        """Raise if budget is exhausted, or would be after 'delay'.
+
+        Raises:
+            RequestsFortifiedDeadlineExceededError
+        """
+        remaining = self.remaining()
+        if remaining <= delay:
+            raise RequestsFortifiedDeadlineExceededError(
+                error_message="{0}: Deadline Exceeded: Total timeout {1} secs".format(
+                    request_label or 'Request', self.total_timeout
+                ),
+                error_details={
+                    'total_timeout': self.total_timeout,
+                    'remaining': remaining,
+                    'delay': delay,
+                },
+            )
+
+    def check_response(self, response, request_label=None):
+        """Close streamed response and raise if budget is exhausted.
+
+        Raises:
+            RequestsFortifiedDeadlineExceededError
+        """
+        if not self.expired:
+            return
+        log.warning(
+            "{0}: Deadline Exceeded: Abort".format(request_label or 'Request'),
+            extra={'total_timeout': self.total_timeout}
+        )
+        response.close()
+        self.check(request_label)
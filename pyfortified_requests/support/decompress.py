@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import bz2
+import struct
+import zlib
+
+STREAM_COMPRESSIONS = ('gzip', 'bzip', 'pkzip')
+
+_ZIP_LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+_ZIP_LOCAL_HEADER_SIG = 0x04034b50
+_ZIP_FLAG_DATA_DESCRIPTOR = 0x08
+_ZIP_STORED = 0
+_ZIP_DEFLATED = 8
+
+
+class StreamDecompressor(object):
+    """Incremental decompression of gzip, bzip2 or zip payloads.
+
+    Data is fed as it arrives with 'decompress()', which yields
+    decompressed pieces no larger than 'max_length', so that memory
+    stays bounded by chunk size regardless of compression ratio.
+
+    Concatenated gzip members and bzip2 streams are supported.
+    For zip archives only the first member is extracted.
+    """
+
+    def __init__(self, compression, max_length=8192):
+        if compression not in STREAM_COMPRESSIONS:
+            raise ValueError("Unsupported compression: '{0}'".format(compression))
+
+        self.compression = compression
+        self.max_length = max_length
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+        self.__decompressor = None
+        self.__zip_header = b''
+        self.__zip_stored_remaining = None
+        self.__done = False
+
+        if compression != 'pkzip':
+            self.__decompressor = self.__new_decompressor()
+
+    def __new_decompressor(self):
+        if self.compression == 'gzip':
+            return zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if self.compression == 'bzip':
+            return bz2.BZ2Decompressor()
+        return zlib.decompressobj(-zlib.MAX_WBITS)
+
+    def decompress(self, data):
+        """Feed compressed data, yield decompressed pieces.
+
+        Args:
+            data: bytes
+
+        Returns:
+            Generator of bytes
+        """
+        self.bytes_in += len(data)
+
+        if self.compression == 'pkzip':
+            data = self.__zip_local_header(data)
+
+        for piece in self.__decompress(data):
+            self.bytes_out += len(piece)
+            yield piece
+
+    def __zip_local_header(self, data):
+        if self.__decompressor is not None or self.__zip_stored_remaining is not None:
+            return data
+
+        self.__zip_header += data
+        header = self.__zip_header
+        if len(header) < _ZIP_LOCAL_HEADER.size:
+            return b''
+
+        (sig, _, flags, method, _, _, _, compressed_size, _, name_len, extra_len) = \
+            _ZIP_LOCAL_HEADER.unpack_from(header)
+
+        if sig != _ZIP_LOCAL_HEADER_SIG:
+            raise ValueError("Zip: Invalid local file header")
+
+        offset = _ZIP_LOCAL_HEADER.size + name_len + extra_len
+        if len(header) < offset:
+            return b''
+
+        if method == _ZIP_DEFLATED:
+            self.__decompressor = self.__new_decompressor()
+        elif method == _ZIP_STORED:
+            if flags & _ZIP_FLAG_DATA_DESCRIPTOR:
+                raise ValueError("Zip: Stored member of unknown size cannot be streamed")
+            self.__zip_stored_remaining = compressed_size
+        else:
+            raise ValueError("Zip: Unsupported compression method: {0}".format(method))
+
+        self.__zip_header = None
+        return header[offset:]
+
+    def __decompress(self, data):
+        if self.__done or not data:
+            return
+
+        if self.__zip_stored_remaining is not None:
+            data = data[:self.__zip_stored_remaining]
+            self.__zip_stored_remaining -= len(data)
+            if not self.__zip_stored_remaining:
+                self.__done = True
+            for start in range(0, len(data), self.max_length):
+                yield data[start:start + self.max_length]
+            return
+
+        while data:
+            decompressor = self.__decompressor
+            if decompressor.eof:
+                # Concatenated gzip members or bzip2 streams.
+                decompressor = self.__decompressor = self.__new_decompressor()
+
+            if self.compression == 'bzip':
+                piece = decompressor.decompress(data, self.max_length)
+                data = b''
+                if piece:
+                    yield piece
+                while not decompressor.eof and decompressor.needs_input is False:
+                    piece = decompressor.decompress(b'', self.max_length)
+                    if not piece:
+                        break
+                    yield piece
+            else:
+                piece = decompressor.decompress(data, self.max_length)
+                if piece:
+                    yield piece
+                data = decompressor.unconsumed_tail
+
+            if decompressor.eof:
+                if self.compression == 'pkzip':
+                    # Remainder is zip central directory.
+                    self.__done = True
+                    return
+
+                # Next member or stream, if any, starts in unused data.
+                data = decompressor.unused_data
+
+    def flush(self):
+        """Remaining decompressed data, if any.
+
+        Returns:
+            bytes
+        """
+        decompressor = self.__decompressor
+        if decompressor is None or self.compression == 'bzip':
+            return b''
+        piece = decompressor.flush()
+        self.bytes_out += len(piece)
+        return piece
+
+    @property
+    def eof(self):
+        if self.__done:
+            return True
+        return self.__decompressor is not None and self.__decompressor.eof
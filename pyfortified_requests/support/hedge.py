@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import threading
+from collections.abc import Mapping
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    wait,
+)
+
+HEDGE_PERCENTILE = 95
+HEDGE_MIN_SAMPLES = 20
+HEDGE_WINDOW = 1000
+
+# Hedges allowed per request sent, e.g. 0.1 adds at most 10% extra load.
+HEDGE_BUDGET = 0.1
+HEDGE_BUDGET_MAX_TOKENS = 10
+
+# Worker threads of hedged calls, shared by all requests.
+HEDGE_MAX_WORKERS = 32
+
+
+class HedgeBudget(object):
+    """Token bucket capping hedged requests to a ratio of requests.
+
+    Each request deposits 'ratio' of a token, up to 'max_tokens';
+    each hedge withdraws one token, so bursts of hedges are bounded too.
+    """
+
+    def __init__(self, max_tokens=HEDGE_BUDGET_MAX_TOKENS):
+        self.max_tokens = max_tokens
+        self.tokens = 0.0
+        self.__lock = threading.Lock()
+
+    def deposit(self, ratio=HEDGE_BUDGET):
+        with self.__lock:
+            self.tokens = min(self.max_tokens, self.tokens + ratio)
+
+    def withdraw(self):
+        """Take one token, if available.
+
+        Returns:
+            True if hedge is within budget.
+        """
+        with self.__lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+def hedge_delay(metrics, metric_name, percentile=HEDGE_PERCENTILE, min_samples=HEDGE_MIN_SAMPLES, window=HEDGE_WINDOW):
+    """Delay before hedging: latency percentile of recent requests.
+
+    Args:
+        metrics: :class:`Metrics`
+        metric_name: Latency samples, in seconds.
+        percentile: (optional) Percentile of latency.
+        min_samples: (optional) Samples required.
+        window: (optional) Latest samples considered.
+
+    Returns:
+        Seconds, or None if there are fewer than 'min_samples'.
+    """
+    if metrics.count(metric_name) < min_samples:
+        return None
+    return metrics.percentile(metric_name, percentile, window=window)
+
+
+def is_hedge_body(request_data):
+    """Can body be sent twice concurrently: none, bytes, str or form data.
+    """
+    return request_data is None or isinstance(request_data, (bytes, str, Mapping, list, tuple))
+
+
+class HedgeWorkers(object):
+    """Worker threads of hedged calls, started on demand and reused.
+
+    At most 'max_workers' calls run at once; a call is not queued when
+    all workers are busy, so it is sent unhedged by its caller instead.
+    """
+
+    def __init__(self, max_workers=HEDGE_MAX_WORKERS):
+        self.max_workers = max_workers
+        self.__slots = threading.BoundedSemaphore(max_workers)
+        self.__executor = None
+        self.__lock = threading.Lock()
+
+    def submit(self, func):
+        """Call 'func' in a worker thread.
+
+        Returns:
+            concurrent.futures.Future, or None if all workers are busy.
+        """
+        if not self.__slots.acquire(blocking=False):
+            return None
+
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='pyfortified-requests-hedge',
+                )
+
+        future = self.__executor.submit(func)
+        future.add_done_callback(lambda _: self.__slots.release())
+        return future
+
+
+HEDGE_WORKERS = HedgeWorkers()
+
+
+def hedged_call(func, delay, budget, discard=None, is_final=None, workers=HEDGE_WORKERS):
+    """Call 'func'; if it takes longer than 'delay', call it again
+    concurrently, within budget, and take the first final result.
+
+    A result is final unless 'is_final' rejects it, e.g. a response of a
+    retried status such as 503: the other call is then waited for. If
+    neither call is final, the result of the first call is taken, or of
+    the hedge if the first call failed.
+
+    A call in flight cannot be interrupted: the losing call completes
+    in its thread, and its result is passed to 'discard', e.g. to close
+    a response and release its connection.
+
+    Args:
+        func: Callable, sent again as is.
+        delay: Seconds before hedging.
+        budget: :class:`HedgeBudget`
+        discard: (optional) Callable receiving the result of the losing call.
+        is_final: (optional) Callable, whether a result may win.
+        workers: (optional) :class:`HedgeWorkers`
+
+    Returns:
+        Tuple of result, and whether hedge was sent, and whether hedge won.
+
+    Raises:
+        Exception of first call, if all calls fail.
+    """
+    primary = workers.submit(func)
+    if primary is None:
+        return func(), False, False
+
+    done, _ = wait([primary], timeout=delay)
+    if done or not budget.withdraw():
+        return primary.result(), False, False
+
+    hedge = workers.submit(func)
+    if hedge is None:
+        budget.deposit(1)
+        return primary.result(), False, False
+
+    def is_winner(future):
+        return future.exception() is None and (is_final is None or is_final(future.result()))
+
+    pending = [primary, hedge]
+    winner = None
+    while pending and winner is None:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in (primary, hedge):
+            if future in done:
+                pending.remove(future)
+                if winner is None and is_winner(future):
+                    winner = future
+
+    if winner is None:
+        winner = hedge if primary.exception() is not None and hedge.exception() is None else primary
+
+    def discard_loser(loser):
+        if loser.exception() is None:
+            discard(loser.result())
+
+    if discard is not None:
+        # Runs at once if loser is already done.
+        (hedge if winner is primary else primary).add_done_callback(discard_loser)
+
+    return winner.result(), True, winner is hedge
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+from collections import namedtuple
+
+from pyhttpstatus_utils import (
+    HttpStatusCode,
+    HttpStatusType,
+    get_http_status_desc,
+    get_http_status_type,
+)
+
+from pyfortified_requests.exceptions.custom import (
+    RequestsFortifiedClientError,
+    RequestsFortifiedServiceError,
+)
+from .constants import REQUEST_RETRY_HTTP_STATUS_CODES
+
+# Error responses raising RequestsFortifiedClientError.
+HTTP_STATUS_CLIENT_ERROR_CODES = (
+    HttpStatusCode.BAD_REQUEST,
+    HttpStatusCode.UNAUTHORIZED,
+    HttpStatusCode.FORBIDDEN,
+    HttpStatusCode.NOT_FOUND,
+    HttpStatusCode.METHOD_NOT_ALLOWED,
+    HttpStatusCode.NOT_ACCEPTABLE,
+    HttpStatusCode.REQUEST_TIMEOUT,
+    HttpStatusCode.CONFLICT,
+    HttpStatusCode.GONE,
+    HttpStatusCode.UNPROCESSABLE_ENTITY,
+    HttpStatusCode.TOO_MANY_REQUESTS,
+)
+
+# Error responses raising RequestsFortifiedServiceError.
+HTTP_STATUS_SERVICE_ERROR_CODES = (
+    HttpStatusCode.INTERNAL_SERVER_ERROR,
+    HttpStatusCode.NOT_IMPLEMENTED,
+    HttpStatusCode.BAD_GATEWAY,
+    HttpStatusCode.SERVICE_UNAVAILABLE,
+    HttpStatusCode.NETWORK_AUTHENTICATION_REQUIRED,
+)
+
+HTTP_STATUS_CODE_MIN = 100
+HTTP_STATUS_CODE_MAX = 599
+
+# Classification of an HTTP status code.
+#   http_status_type: pyhttpstatus_utils.HttpStatusType
+#   http_status_desc: Description.
+#   ok: Successful or redirection.
+#   retryable: In retry status codes of the table, see :func:`http_status_classes`.
+#   error_class: Exception raised for error response; None if other than
+#       client or service error, so RequestsFortifiedModuleError.
+#   error_class_type: Exception by status type, raised once retries of
+#       status are exhausted; None if not client or server error.
+HttpStatusClass = namedtuple(
+    'HttpStatusClass',
+    ['http_status_code', 'http_status_type', 'http_status_desc', 'ok', 'retryable', 'error_class', 'error_class_type']
+)
+
+
+_CLIENT_ERROR_CODES = frozenset(int(code) for code in HTTP_STATUS_CLIENT_ERROR_CODES)
+_SERVICE_ERROR_CODES = frozenset(int(code) for code in HTTP_STATUS_SERVICE_ERROR_CODES)
+
+
+def _http_status_class(http_status_code, retry_codes=frozenset()):
+    http_status_type = get_http_status_type(http_status_code)
+
+    if http_status_code in _CLIENT_ERROR_CODES:
+        error_class = RequestsFortifiedClientError
+    elif http_status_code in _SERVICE_ERROR_CODES:
+        error_class = RequestsFortifiedServiceError
+    else:
+        error_class = None
+
+    if http_status_type == HttpStatusType.CLIENT_ERROR:
+        error_class_type = RequestsFortifiedClientError
+    elif http_status_type == HttpStatusType.SERVER_ERROR:
+        error_class_type = RequestsFortifiedServiceError
+    else:
+        error_class_type = None
+
+    return HttpStatusClass(
+        http_status_code=http_status_code,
+        http_status_type=http_status_type,
+        http_status_desc=get_http_status_desc(http_status_code),
+        ok=http_status_type in (HttpStatusType.SUCCESSFUL, HttpStatusType.REDIRECTION),
+        retryable=http_status_code in retry_codes,
+        error_class=error_class,
+        error_class_type=error_class_type,
+    )
+
+
+_RETRY_CODES_DEFAULT = frozenset(int(code) for code in REQUEST_RETRY_HTTP_STATUS_CODES)
+
+# Indexed by status code, built once; 'retryable' by default REQUEST_RETRY_HTTP_STATUS_CODES.
+HTTP_STATUS_CLASSES = [None] * HTTP_STATUS_CODE_MIN + [
+    _http_status_class(http_status_code, _RETRY_CODES_DEFAULT)
+    for http_status_code in range(HTTP_STATUS_CODE_MIN, HTTP_STATUS_CODE_MAX + 1)
+]
+
+# Tables by retry status codes, see :func:`http_status_classes`.
+_HTTP_STATUS_CLASSES_BY_RETRY_CODES = {_RETRY_CODES_DEFAULT: HTTP_STATUS_CLASSES}
+
+
+def http_status_classes(retry_http_status_codes=None):
+    """Table of :class:`HttpStatusClass` indexed by status code, with
+    'retryable' set for the given retry status codes.
+
+    Tables are built once per set of retry status codes, from the default
+    table.
+
+    Args:
+        retry_http_status_codes: (optional) Status codes retried, default
+            REQUEST_RETRY_HTTP_STATUS_CODES.
+
+    Returns:
+        List of HttpStatusClass, None below 100.
+    """
+    if retry_http_status_codes is None:
+        return HTTP_STATUS_CLASSES
+
+    retry_codes = frozenset(int(code) for code in retry_http_status_codes)
+    status_classes = _HTTP_STATUS_CLASSES_BY_RETRY_CODES.get(retry_codes)
+    if status_classes is None:
+        status_classes = [
+            status_class._replace(retryable=status_class.http_status_code in retry_codes)
+            if status_class is not None else None
+            for status_class in HTTP_STATUS_CLASSES
+        ]
+        _HTTP_STATUS_CLASSES_BY_RETRY_CODES[retry_codes] = status_classes
+    return status_classes
+
+
+def http_status_class(http_status_code, status_classes=HTTP_STATUS_CLASSES):
+    """Classification of HTTP status code, see :class:`HttpStatusClass`.
+
+    Args:
+        http_status_code: int
+        status_classes: (optional) Table of :func:`http_status_classes`,
+            deciding 'retryable'.
+
+    Returns:
+        HttpStatusClass
+
+    Raises:
+        pyhttpstatus_utils.InvalidHttpCode: Status code outside 100 to 599.
+    """
+    try:
+        if http_status_code >= HTTP_STATUS_CODE_MIN:
+            return status_classes[http_status_code]
+    except (IndexError, TypeError):
+        pass
+    return _http_status_class(http_status_code)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import uuid
+
+# RFC 7231 4.2.2: Sending these methods again has no further effect.
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'TRACE', 'PUT', 'DELETE'))
+
+IDEMPOTENCY_KEY_HEADER = 'Idempotency-Key'
+
+
+def is_idempotent_method(request_method):
+    """Is HTTP method idempotent, see 'IDEMPOTENT_METHODS'.
+    """
+    return bool(request_method) and request_method.upper() in IDEMPOTENT_METHODS
+
+
+def idempotency_key():
+    """New key identifying a logical request, sent again unchanged by its retries.
+    """
+    return str(uuid.uuid4())
+
+
+def set_idempotency_key(request_headers, request_idempotency_key=True):
+    """Add 'Idempotency-Key' header, unless already provided.
+
+    Args:
+        request_headers: Dictionary of request headers, updated.
+        request_idempotency_key: (optional) Key, or True to generate one.
+
+    Returns:
+        Idempotency key sent.
+    """
+    for header_name, header_value in request_headers.items():
+        if header_name.lower() == IDEMPOTENCY_KEY_HEADER.lower():
+            return header_value
+
+    if request_idempotency_key is True:
+        request_idempotency_key = idempotency_key()
+
+    request_headers[IDEMPOTENCY_KEY_HEADER] = str(request_idempotency_key)
+    return request_headers[IDEMPOTENCY_KEY_HEADER]
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import json
+
+JSON_ITEM = 'item'
+JSON_WHITESPACE = ' \t\n\r'
+JSON_NUMBER_CHARS = frozenset('0123456789+-.eE')
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+class JsonStreamDecodeError(ValueError):
+    """Malformed JSON found while streaming, with character offset of failure.
+    """
+
+    def __init__(self, msg, offset):
+        self.msg = msg
+        self.offset = offset
+        super(JsonStreamDecodeError, self).__init__("{0}: offset {1}".format(msg, offset))
+
+
+class _JsonStreamReader(object):
+    """Buffered reader over a text stream keeping track of absolute offset.
+    """
+
+    def __init__(self, text_stream, chunk_size):
+        self.text_stream = text_stream
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.offset = 0  # Absolute offset of buffer[0]
+        self.eof = False
+
+    @property
+    def position(self):
+        return self.offset + self.pos
+
+    def fill(self, size=None):
+        """Read more text, dropping consumed part of buffer.
+        """
+        if self.eof:
+            return False
+        text = self.text_stream.read(size or self.chunk_size)
+        if not text:
+            self.eof = True
+            return False
+        if self.pos:
+            self.offset += self.pos
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        self.buffer += text
+        return True
+
+    def error(self, msg):
+        return JsonStreamDecodeError(msg, self.position)
+
+    def peek(self):
+        """Next non-whitespace character, without consuming it.
+        """
+        while True:
+            buffer, pos = self.buffer, self.pos
+            while pos < len(buffer) and buffer[pos] in JSON_WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, chars):
+        char = self.peek()
+        if not char or char not in chars:
+            raise self.error("Expecting {0}".format(' or '.join(repr(c) for c in chars)))
+        self.pos += 1
+        return char
+
+    def decode(self):
+        """Decode next complete JSON value.
+        """
+        self.peek()
+        read_size = self.chunk_size
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self.buffer, self.pos)
+                # A number followed only by number characters up to buffer end
+                # may be truncated, e.g. '123.' of '123.456e7'.
+                if self.eof or not self._is_number_truncated(value, end):
+                    self.pos = end
+                    return value
+            except ValueError as json_decode_ex:
+                if self.eof:
+                    raise JsonStreamDecodeError(
+                        getattr(json_decode_ex, 'msg', str(json_decode_ex)),
+                        self.offset + getattr(json_decode_ex, 'pos', self.pos)
+                    )
+            if not self.fill(read_size):
+                continue
+            # Grow reads for large values to keep re-parsing amortized.
+            read_size *= 2
+
+    def _is_number_truncated(self, value, end):
+        """Can value decoded up to 'end' continue past buffer end.
+        """
+        buffer = self.buffer
+        if end >= len(buffer):
+            return True
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return False
+        for pos in range(end, len(buffer)):
+            if buffer[pos] not in JSON_NUMBER_CHARS:
+                return False
+        return True
+
+    def skip(self):
+        """Skip next JSON value without decoding it.
+        """
+        char = self.peek()
+        if char not in '{[':
+            self.decode()
+            return
+
+        depth = 0
+        in_string = False
+        escape = False
+        while True:
+            buffer = self.buffer
+            pos = self.pos
+            length = len(buffer)
+            while pos < length:
+                char = buffer[pos]
+                pos += 1
+                if in_string:
+                    if escape:
+                        escape = False
+                    elif char == '\\':
+                        escape = True
+                    elif char == '"':
+                        in_string = False
+                elif char == '"':
+                    in_string = True
+                elif char in '{[':
+                    depth += 1
+                elif char in '}]':
+                    depth -= 1
+                    if depth == 0:
+                        self.pos = pos
+                        return
+            self.pos = pos
+            if not self.fill():
+                raise self.error("Unterminated value")
+
+
+def _json_path(item_path):
+    if item_path is None or item_path == '':
+        return []
+    if isinstance(item_path, (list, tuple)):
+        return list(item_path)
+    return item_path.split('.')
+
+
+def _iter_json_path(reader, path):
+    if not path:
+        yield reader.decode()
+        return
+
+    key, path = path[0], path[1:]
+
+    if key == JSON_ITEM:
+        reader.expect('[')
+        if reader.peek() == ']':
+            reader.pos += 1
+            return
+        while True:
+            for value in _iter_json_path(reader, path):
+                yield value
+            if reader.expect(',]') == ']':
+                return
+
+    reader.expect('{')
+    if reader.peek() == '}':
+        reader.pos += 1
+        return
+    while True:
+        if reader.peek() != '"':
+            raise reader.error("Expecting property name enclosed in double quotes")
+        name = reader.decode()
+        reader.expect(':')
+        if name == key:
+            for value in _iter_json_path(reader, path):
+                yield value
+        else:
+            reader.skip()
+        if reader.expect(',}') == '}':
+            return
+
+
+def iter_json_items(text_stream, item_path=JSON_ITEM, chunk_size=65536):
+    """Incrementally yield JSON values found at 'item_path'.
+
+    Only the value being yielded is held in memory, so arbitrarily large
+    JSON documents can be consumed with bounded memory.
+
+    Args:
+        text_stream: Text file-like object providing 'read(size)'.
+        item_path: Dot-separated path, where 'item' selects each element
+            of an array, e.g. 'item' for top-level array elements,
+            'data.item' for elements of array under key 'data'.
+            Empty path yields the whole document.
+        chunk_size: (optional) Characters to read at a time.
+
+    Returns:
+        Generator of decoded JSON values.
+
+    Raises:
+        JsonStreamDecodeError: Upon malformed JSON, with offset of failure.
+    """
+    reader = _JsonStreamReader(text_stream, chunk_size)
+
+    for value in _iter_json_path(reader, _json_path(item_path)):
+        yield value
+
+    if reader.peek():
+        raise reader.error("Extra data")
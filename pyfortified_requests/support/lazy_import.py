@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import importlib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def optional_import(name):
+    """Import module on first use, so rarely used dependencies do not add to
+    'import pyfortified_requests'.
+
+    Args:
+        name: Module name.
+
+    Returns:
+        Module, or None if not installed. Result is cached, including None.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _safe_cast():
+    # 'safe_cast' imports NumPy at module load.
+    return importlib.import_module('safe_cast')
+
+
+def safe_str(val, default=None):
+    """'safe_cast.safe_str', importing 'safe_cast' on first use.
+    """
+    return _safe_cast().safe_str(val, default)
+
+
+def safe_int(val, default=None):
+    """'safe_cast.safe_int', importing 'safe_cast' on first use.
+    """
+    return _safe_cast().safe_int(val, default)
+
+
+def safe_dict(val, default=None):
+    """'safe_cast.safe_dict', importing 'safe_cast' on first use.
+    """
+    return _safe_cast().safe_dict(val, default)
@@ -3,6 +3,7 @@
 # @namespace pyfortified_requests
 
 import json
+import math
 import time
 
 
@@ -43,6 +44,32 @@ class Metrics(object):
         samples = self._metrics_dict.setdefault(name, list())
         samples.append((time.time(), value))
 
+    def percentile(self, name, percentile, window=None):
+        """
+        Percentile of the latest samples of metric <name>
+        :param name: name of metric
+        :param percentile: percentile, 0 to 100
+        :param window: number of latest samples considered, None for all
+        :return: value (nearest rank), or None if there are no samples
+        """
+        samples = self._metrics_dict.get(name)
+        if not samples:
+            return None
+        if window is not None:
+            samples = samples[-window:]
+        values = sorted(value for _, value in samples)
+        rank = max(0, min(len(values) - 1, int(math.ceil(percentile / 100.0 * len(values))) - 1))
+        return values[rank]
+
+    def count(self, name):
+        """
+        Number of samples of metric <name>, or value of counter <name>
+        :param name: name of metric
+        :return: int
+        """
+        value = self._metrics_dict.get(name, 0)
+        return len(value) if isinstance(value, list) else value
+
     def dict(self):
         return self._metrics_dict
 
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import io
+import mmap
+import os
+from contextlib import contextmanager
+
+MMAP_TEXT_CHUNK_SIZE = 256 * 1024
+
+
+@contextmanager
+def mmap_open(file_path):
+    """Memory-map file read-only.
+
+    Args:
+        file_path: File path.
+
+    Returns:
+        Context manager yielding 'mmap.mmap', or b'' for an empty file,
+        which cannot be mapped.
+    """
+    with open(file_path, 'rb') as file_rb:
+        if not os.fstat(file_rb.fileno()).st_size:
+            yield b''
+            return
+
+        file_mmap = mmap.mmap(file_rb.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield file_mmap
+        finally:
+            file_mmap.close()
+
+
+class MmapReader(io.BufferedIOBase):
+    """Binary file-like reader over byte range of a memory-mapped file.
+
+    Reads copy only the requested bytes, so wrapping with
+    'io.TextIOWrapper' decodes the mapping incrementally. Offsets are
+    absolute within the buffer, so 'tell()' after reading a header line
+    gives the byte offset of the next record.
+    """
+
+    def __init__(self, buffer, start=0, end=None):
+        """
+        Args:
+            buffer: 'mmap.mmap' or bytes-like object providing 'find'.
+            start: (optional) Byte offset to start reading at, e.g. after BOM.
+            end: (optional) Byte offset to stop reading at, default buffer end.
+        """
+        super(MmapReader, self).__init__()
+        self._buffer = buffer
+        self._start = start
+        self._end = len(buffer) if end is None else min(end, len(buffer))
+        self._pos = start
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._end
+        self._pos = max(self._start, min(offset, self._end))
+        return self._pos
+
+    def read(self, size=-1):
+        end = self._end if size is None or size < 0 else min(self._pos + size, self._end)
+        data = self._buffer[self._pos:end]
+        self._pos = end
+        return data
+
+    read1 = read
+
+    def readinto(self, b):
+        size = min(len(b), self._end - self._pos)
+        b[:size] = self._buffer[self._pos:self._pos + size]
+        self._pos += size
+        return size
+
+    def readline(self, size=-1):
+        newline = self._buffer.find(b'\n', self._pos, self._end)
+        end = self._end if newline < 0 else newline + 1
+        if size is not None and size >= 0:
+            end = min(end, self._pos + size)
+        return self.read(end - self._pos)
+
+
+def mmap_text_reader(buffer, start=0, end=None, encoding=None, newline=None):
+    """Text stream decoding byte range of a memory-mapped file.
+
+    Args:
+        buffer: 'mmap.mmap' or bytes-like object.
+        start: (optional) Byte offset to start reading at, e.g. after BOM.
+        end: (optional) Byte offset to stop reading at.
+        encoding: (optional) Text encoding, default locale encoding.
+        newline: (optional) As for 'open'.
+
+    Returns:
+        io.TextIOWrapper
+    """
+    text_reader = io.TextIOWrapper(MmapReader(buffer, start, end), encoding=encoding, newline=newline)
+    # Larger decode chunks amortize the per-call overhead of MmapReader.read1().
+    text_reader._CHUNK_SIZE = MMAP_TEXT_CHUNK_SIZE
+    return text_reader
+
+
+def mmap_decode(buffer, start=0, end=None, encoding='utf-8'):
+    """Decode byte range of a memory-mapped file, without intermediate bytes copy.
+
+    Args:
+        buffer: 'mmap.mmap' or bytes-like object.
+        start: (optional) Byte offset of range start.
+        end: (optional) Byte offset of range end.
+        encoding: (optional) Text encoding.
+
+    Returns:
+        str
+    """
+    with memoryview(buffer)[start:end] as buffer_view:
+        return str(buffer_view, encoding)
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import base64
+import hashlib
+import os
+import threading
+import ujson as json
+import xml.etree.ElementTree as ElementTree
+from urllib.parse import urljoin
+
+from .upload_stream import UPLOAD_CHUNK_SIZE
+
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
+UPLOAD_PROTOCOL_S3 = 's3'
+UPLOAD_PROTOCOL_TUS = 'tus'
+
+TUS_VERSION = '1.0.0'
+
+
+def part_md5(data):
+    """MD5 digest of part data, base64 encoded as for 'Content-MD5'.
+    """
+    return base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+
+
+class UploadPart(object):
+    """Byte range of upload file, streamed in chunks of 'chunk_size'.
+
+    Each iteration reads the range again from the file, so a part is sent
+    again by retries without being held in memory; its length is known,
+    so it is sent with 'Content-Length' instead of chunked.
+    """
+
+    # Sent as is by retries, see :class:`RequestBodyRewind`.
+    rewindable = True
+
+    def __init__(self, source_path, offset, size, chunk_size=UPLOAD_CHUNK_SIZE):
+        self.source_path = source_path
+        self.offset = offset
+        self.size = size
+        self.chunk_size = chunk_size
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        with open(self.source_path, 'rb') as source_rb:
+            source_rb.seek(self.offset)
+            remaining = self.size
+            while remaining > 0:
+                chunk = source_rb.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    raise IOError("Upload Part: Source truncated: '{0}'".format(self.source_path))
+                remaining -= len(chunk)
+                yield chunk
+
+    def skip(self, size):
+        """Part without its first 'size' bytes.
+        """
+        size = min(size, self.size)
+        return UploadPart(self.source_path, self.offset + size, self.size - size, chunk_size=self.chunk_size)
+
+    def md5(self):
+        """MD5 digest of part, base64 encoded as for 'Content-MD5', read in chunks.
+        """
+        digest = hashlib.md5()
+        for chunk in self:
+            digest.update(chunk)
+        return base64.b64encode(digest.digest()).decode('ascii')
+
+
+def _xml_find_text(element, name):
+    """Text of first element named 'name', ignoring XML namespaces.
+    """
+    for child in element.iter():
+        if child.tag == name or child.tag.endswith('}' + name):
+            return child.text
+    return None
+
+
+class UploadManifest(object):
+    """State of a resumable upload, persisted as JSON after each part.
+
+    A manifest only resumes an upload of the same source, unchanged
+    since (size and modification time), to the same URL, with the same
+    protocol and part size.
+    """
+
+    __FIELDS = (
+        'protocol',
+        'upload_url',
+        'source_path',
+        'source_size',
+        'source_mtime',
+        'part_size',
+        'upload_id',
+        'upload_location',
+        'upload_offset',
+        'parts',
+    )
+
+    def __init__(
+        self,
+        manifest_path,
+        protocol,
+        upload_url,
+        source_path,
+        part_size=UPLOAD_PART_SIZE,
+        source_size=None,
+        source_mtime=None,
+        upload_id=None,
+        upload_location=None,
+        upload_offset=0,
+        parts=None,
+    ):
+        source_stat = os.stat(source_path) if source_size is None or source_mtime is None else None
+
+        self.manifest_path = manifest_path
+        self.protocol = protocol
+        self.upload_url = upload_url
+        self.source_path = source_path
+        self.source_size = source_stat.st_size if source_stat else source_size
+        self.source_mtime = source_stat.st_mtime_ns if source_stat else source_mtime
+        self.part_size = part_size
+        self.upload_id = upload_id
+        self.upload_location = upload_location
+        self.upload_offset = upload_offset
+        self.parts = parts or {}  # Part number as str, to completed part details
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def load(cls, manifest_path):
+        """Load manifest, None if there is none.
+        """
+        if not manifest_path or not os.path.exists(manifest_path):
+            return None
+        with open(manifest_path, 'r') as manifest_r:
+            return cls(manifest_path=manifest_path, **json.load(manifest_r))
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__FIELDS}
+
+    def save(self):
+        """Persist manifest atomically, if it has a path.
+        """
+        if not self.manifest_path:
+            return
+        manifest_path_tmp = "{0}.tmp".format(self.manifest_path)
+        with open(manifest_path_tmp, 'w') as manifest_w:
+            json.dump(self.to_dict(), manifest_w)
+            manifest_w.flush()
+            os.fsync(manifest_w.fileno())
+        os.replace(manifest_path_tmp, self.manifest_path)
+
+    def remove(self):
+        if self.manifest_path and os.path.exists(self.manifest_path):
+            os.remove(self.manifest_path)
+
+    def matches(self, protocol, upload_url, source_path, part_size):
+        source_stat = os.stat(source_path)
+        return (
+            self.protocol == protocol and
+            self.upload_url == upload_url and
+            self.source_path == source_path and
+            self.source_size == source_stat.st_size and
+            self.source_mtime == source_stat.st_mtime_ns and
+            self.part_size == part_size
+        )
+
+    @property
+    def part_count(self):
+        return max(1, -(-self.source_size // self.part_size))
+
+    def part_range(self, part_number):
+        """Byte offset and size of part, numbered from 1.
+        """
+        offset = (part_number - 1) * self.part_size
+        return offset, min(self.part_size, self.source_size - offset)
+
+    def pending_parts(self):
+        return [
+            part_number for part_number in range(1, self.part_count + 1)
+            if str(part_number) not in self.parts
+        ]
+
+    def complete_part(self, part_number, **part_details):
+        """Record completed part, and persist.
+        """
+        with self.__lock:
+            self.parts[str(part_number)] = part_details
+            self.save()
+
+    def read_part(self, part_number):
+        """Part of source, streamed when sent, see :class:`UploadPart`.
+        """
+        offset, size = self.part_range(part_number)
+        return UploadPart(self.source_path, offset, size)
+
+
+class UploadProtocol(object):
+    """Protocol adapter of resumable upload engine.
+
+    Methods receive 'request', a callable with the keyword arguments of
+    :meth:`RequestsFortified.request` (request_method, request_url,
+    request_data, request_headers, request_params) and 'request_label_part',
+    returning the response or raising upon failure.
+    """
+
+    name = None
+
+    # Parts may be sent concurrently.
+    concurrent = True
+
+    def create(self, request, manifest):
+        """Start upload, recording its identity in manifest.
+        """
+        raise NotImplementedError
+
+    def resume(self, request, manifest):
+        """Reconcile manifest of resumed upload with server state.
+        """
+        pass
+
+    def upload_part(self, request, manifest, part_number, data, data_md5):
+        """Send part.
+
+        Args:
+            data: :class:`UploadPart`
+            data_md5: MD5 digest of part, base64 encoded.
+
+        Returns:
+            Dictionary of part details recorded in manifest.
+        """
+        raise NotImplementedError
+
+    def complete(self, request, manifest):
+        """Finish upload once all parts are sent.
+
+        Returns:
+            requests.Response or None
+        """
+        return None
+
+    def abort(self, request, manifest):
+        pass
+
+
+class S3MultipartUploadProtocol(UploadProtocol):
+    """S3-style multipart upload: initiate, upload parts by number, complete.
+
+    Parts are verified with 'Content-MD5'; an ETag in MD5 hex form which
+    does not match the part fails the part, so it is sent again.
+    Request signing is left to 'upload_request_headers' or pre-signed URLs.
+    """
+
+    name = UPLOAD_PROTOCOL_S3
+
+    def create(self, request, manifest):
+        response = request(
+            request_method='POST',
+            request_url=manifest.upload_url,
+            request_params={'uploads': ''},
+            request_label_part='S3 Multipart: Initiate',
+        )
+        upload_id = _xml_find_text(ElementTree.fromstring(response.content), 'UploadId')
+        if not upload_id:
+            raise ValueError("S3 Multipart: Initiate: Missing 'UploadId'")
+        manifest.upload_id = upload_id
+
+    def upload_part(self, request, manifest, part_number, data, data_md5):
+        response = request(
+            request_method='PUT',
+            request_url=manifest.upload_url,
+            request_params={'partNumber': part_number, 'uploadId': manifest.upload_id},
+            request_data=data,
+            request_headers={
+                'Content-MD5': data_md5,
+                'Content-Length': str(len(data)),
+            },
+            request_label_part="S3 Multipart: Part {0}".format(part_number),
+        )
+
+        etag = response.headers.get('ETag')
+        if not etag:
+            raise ValueError("S3 Multipart: Part {0}: Missing 'ETag'".format(part_number))
+
+        etag_hex = etag.strip('"')
+        if len(etag_hex) == 32 and etag_hex != base64.b64decode(data_md5).hex():
+            raise ValueError("S3 Multipart: Part {0}: ETag mismatch: '{1}'".format(part_number, etag))
+
+        return {'etag': etag, 'md5': data_md5, 'size': len(data)}
+
+    def complete(self, request, manifest):
+        complete_xml = ElementTree.Element('CompleteMultipartUpload')
+        for part_number in sorted(manifest.parts, key=int):
+            part_xml = ElementTree.SubElement(complete_xml, 'Part')
+            ElementTree.SubElement(part_xml, 'PartNumber').text = part_number
+            ElementTree.SubElement(part_xml, 'ETag').text = manifest.parts[part_number]['etag']
+
+        return request(
+            request_method='POST',
+            request_url=manifest.upload_url,
+            request_params={'uploadId': manifest.upload_id},
+            request_data=ElementTree.tostring(complete_xml),
+            request_headers={'Content-Type': 'application/xml'},
+            request_label_part='S3 Multipart: Complete',
+        )
+
+    def abort(self, request, manifest):
+        if manifest.upload_id:
+            request(
+                request_method='DELETE',
+                request_url=manifest.upload_url,
+                request_params={'uploadId': manifest.upload_id},
+                request_label_part='S3 Multipart: Abort',
+            )
+
+
+class TusUploadProtocol(UploadProtocol):
+    """tus (resumable upload protocol 1.0) core: create, then PATCH at offset.
+
+    Parts are appended in order, so they are never sent concurrently.
+    Resuming asks the server for its offset with HEAD. Parts carry
+    'Upload-Checksum' (checksum extension) with MD5.
+    """
+
+    name = UPLOAD_PROTOCOL_TUS
+    concurrent = False
+
+    def create(self, request, manifest):
+        response = request(
+            request_method='POST',
+            request_url=manifest.upload_url,
+            request_headers={
+                'Tus-Resumable': TUS_VERSION,
+                'Upload-Length': str(manifest.source_size),
+            },
+            request_label_part='tus: Create',
+        )
+        location = response.headers.get('Location')
+        if not location:
+            raise ValueError("tus: Create: Missing 'Location'")
+        manifest.upload_location = urljoin(manifest.upload_url, location)
+        manifest.upload_offset = 0
+
+    def resume(self, request, manifest):
+        response = request(
+            request_method='HEAD',
+            request_url=manifest.upload_location,
+            request_headers={'Tus-Resumable': TUS_VERSION},
+            request_label_part='tus: Offset',
+        )
+        upload_offset = int(response.headers['Upload-Offset'])
+
+        # Parts beyond server offset are sent again, even if in manifest.
+        manifest.upload_offset = upload_offset
+        manifest.parts = {
+            part_number: part_details for part_number, part_details in manifest.parts.items()
+            if sum(manifest.part_range(int(part_number))) <= upload_offset
+        }
+
+    def upload_part(self, request, manifest, part_number, data, data_md5):
+        part_offset, _ = manifest.part_range(part_number)
+
+        # Server may hold part of this part already.
+        skip = max(0, manifest.upload_offset - part_offset)
+        if skip >= len(data):
+            return {'md5': data_md5, 'size': len(data)}
+        if skip:
+            data = data.skip(skip)
+            data_md5 = data.md5()
+
+        response = request(
+            request_method='PATCH',
+            request_url=manifest.upload_location,
+            request_data=data,
+            request_headers={
+                'Tus-Resumable': TUS_VERSION,
+                'Upload-Offset': str(part_offset + skip),
+                'Upload-Checksum': 'md5 {0}'.format(data_md5),
+                'Content-Type': 'application/offset+octet-stream',
+            },
+            request_label_part="tus: Part {0}".format(part_number),
+        )
+
+        upload_offset = int(response.headers.get('Upload-Offset', -1))
+        if upload_offset != part_offset + skip + len(data):
+            raise ValueError("tus: Part {0}: Unexpected 'Upload-Offset': {1}".format(part_number, upload_offset))
+
+        manifest.upload_offset = upload_offset
+        return {'md5': data_md5, 'size': len(data) + skip}
+
+    def abort(self, request, manifest):
+        if manifest.upload_location:
+            request(
+                request_method='DELETE',
+                request_url=manifest.upload_location,
+                request_headers={'Tus-Resumable': TUS_VERSION},
+                request_label_part='tus: Terminate',
+            )
+
+
+UPLOAD_PROTOCOLS = {
+    UPLOAD_PROTOCOL_S3: S3MultipartUploadProtocol,
+    UPLOAD_PROTOCOL_TUS: TusUploadProtocol,
+}
+
+
+def get_upload_protocol(upload_protocol):
+    """Protocol adapter by name, or the given adapter instance.
+    """
+    if isinstance(upload_protocol, UploadProtocol):
+        return upload_protocol
+    if upload_protocol not in UPLOAD_PROTOCOLS:
+        raise ValueError("Unexpected upload protocol: '{0}'".format(upload_protocol))
+    return UPLOAD_PROTOCOLS[upload_protocol]()
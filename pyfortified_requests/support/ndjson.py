@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import codecs
+import ujson as json
+
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
+
+def ndjson_loads(line, line_count=None):
+    """Decode single NDJSON line.
+
+    Args:
+        line: bytes or str, without line terminator.
+        line_count: (optional) Line number, 1-based; UTF-8 BOM is
+            removed from first line.
+
+    Returns:
+        Decoded JSON value.
+    """
+    if line_count == 1:
+        if isinstance(line, bytes) and line.startswith(codecs.BOM_UTF8):
+            line = line[len(codecs.BOM_UTF8):]
+        elif isinstance(line, str) and line.startswith('\ufeff'):
+            line = line[1:]
+    return json.loads(line)
+
+
+def iter_ndjson_chunks(records, chunk_size=65536):
+    """Serialize records as NDJSON, yielding bytes chunks of about 'chunk_size'.
+
+    Records are consumed lazily, so the body is never materialized;
+    suitable as request data for chunked transfer encoding.
+
+    Args:
+        records: Iterable of JSON serializable values, typically dicts.
+        chunk_size: (optional) Approximate size in bytes of yielded chunks.
+
+    Returns:
+        Generator of bytes
+    """
+    buffer = []
+    buffer_size = 0
+    for record in records:
+        line = json.dumps(record).encode('utf-8') + b'\n'
+        buffer.append(line)
+        buffer_size += len(line)
+        if buffer_size >= chunk_size:
+            yield b''.join(buffer)
+            buffer = []
+            buffer_size = 0
+    if buffer:
+        yield b''.join(buffer)
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import logging
+import time
+from collections import deque
+
+from pyfortified_requests.support.utils import bytes_to_human
+
+log = logging.getLogger(__name__)
+
+MEGABYTE = 1024 * 1024
+
+
+def chunk_size_bytes(chunk, encoding=None):
+    """Actual size in bytes of a downloaded chunk.
+
+    Args:
+        chunk: bytes or str (when decoded with decode_unicode).
+        encoding: (optional) Encoding used when writing str chunks,
+            default 'utf-8'.
+
+    Returns:
+        int
+    """
+    if not chunk:
+        return 0
+    if isinstance(chunk, str):
+        return len(chunk.encode(encoding or 'utf-8'))
+    return len(chunk)
+
+
+def response_content_length(response):
+    """Get expected response size from 'Content-Length' header.
+
+    Args:
+        response:
+
+    Returns:
+        int or None
+    """
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    try:
+        content_length = int(headers.get('Content-Length', None))
+    except (TypeError, ValueError):
+        return None
+    return content_length if content_length >= 0 else None
+
+
+def response_wire_bytes(response):
+    """Bytes read from the socket so far, before content decoding.
+
+    Args:
+        response: requests.Response
+
+    Returns:
+        int or None, if raw response does not track it.
+    """
+    raw = getattr(response, 'raw', None)
+    try:
+        return raw.tell()
+    except Exception:
+        return None
+
+
+class DownloadProgress(object):
+    """Download progress: exact byte counts, rolling throughput and ETA.
+
+    Tracks bytes received on the wire (before Content-Encoding decoding)
+    and bytes decoded, a rolling MB/s rate over 'rate_window_secs',
+    and an ETA derived from 'Content-Length'.
+
+    Optionally calls 'progress_callback(progress)' on every update, or at
+    most every 'callback_interval_secs' and once more on 'finish()', and
+    logs a progress event every 'log_interval_secs'.
+    """
+
+    def __init__(
+        self,
+        content_length=None,
+        request_label=None,
+        progress_callback=None,
+        log_interval_secs=None,
+        rate_window_secs=5.0,
+        callback_interval_secs=None,
+        metrics=None,
+        metrics_prefix='api_download',
+    ):
+        self.content_length = content_length
+        self.request_label = request_label or 'Download Progress'
+        self.progress_callback = progress_callback
+        self.log_interval_secs = log_interval_secs
+        self.rate_window_secs = rate_window_secs
+        self.callback_interval_secs = callback_interval_secs
+        self.metrics = metrics
+        self.metrics_prefix = metrics_prefix
+
+        self.bytes_wire = 0
+        self.bytes_decoded = 0
+        self.chunk_count = 0
+
+        self.time_start = time.monotonic()
+        self.time_end = None
+        self.__time_logged = self.time_start
+        self.__time_called = None
+        self.__callback_pending = False
+        self.__samples = deque([(self.time_start, 0)])
+
+    @classmethod
+    def from_response(cls, response, **kwargs):
+        """Build progress tracker from response's 'Content-Length'.
+        """
+        return cls(content_length=response_content_length(response), **kwargs)
+
+    def update(self, chunk_bytes, wire_bytes=None):
+        """Record a received chunk.
+
+        Args:
+            chunk_bytes: Size in bytes of the decoded chunk.
+            wire_bytes: (optional) Total bytes read from the wire so far.
+                If not provided, assumed same as decoded bytes.
+
+        Returns:
+            None
+        """
+        now = time.monotonic()
+
+        self.chunk_count += 1
+        self.bytes_decoded += chunk_bytes
+        self.bytes_wire = wire_bytes if wire_bytes is not None else self.bytes_decoded
+
+        samples = self.__samples
+        samples.append((now, self.bytes_wire))
+        while len(samples) > 2 and now - samples[0][0] > self.rate_window_secs:
+            samples.popleft()
+
+        if self.progress_callback is not None:
+            if self.callback_interval_secs is None or self.__time_called is None or \
+                    now - self.__time_called >= self.callback_interval_secs:
+                self.__time_called = now
+                self.__callback_pending = False
+                self.progress_callback(self)
+            else:
+                self.__callback_pending = True
+
+        if self.log_interval_secs is not None and \
+                now - self.__time_logged >= self.log_interval_secs:
+            self.__time_logged = now
+            self.emit()
+
+    @property
+    def elapsed_secs(self):
+        return (self.time_end or time.monotonic()) - self.time_start
+
+    @property
+    def rate_bps(self):
+        """Rolling throughput in bytes per second on the wire.
+        """
+        (time_first, bytes_first), (time_last, bytes_last) = self.__samples[0], self.__samples[-1]
+        if time_last <= time_first:
+            return 0.0
+        return (bytes_last - bytes_first) / (time_last - time_first)
+
+    @property
+    def rate_mbps(self):
+        """Rolling throughput in MB/s on the wire.
+        """
+        return self.rate_bps / MEGABYTE
+
+    @property
+    def average_rate_mbps(self):
+        elapsed_secs = self.elapsed_secs
+        if elapsed_secs <= 0:
+            return 0.0
+        return self.bytes_wire / elapsed_secs / MEGABYTE
+
+    @property
+    def percent(self):
+        if not self.content_length:
+            return None
+        return min(100.0, 100.0 * self.bytes_wire / self.content_length)
+
+    @property
+    def eta_secs(self):
+        """Estimated seconds remaining, None if 'Content-Length' is unknown.
+        """
+        if self.content_length is None:
+            return None
+        remaining = max(0, self.content_length - self.bytes_wire)
+        if remaining == 0:
+            return 0.0
+        rate_bps = self.rate_bps
+        if rate_bps <= 0:
+            return None
+        return remaining / rate_bps
+
+    def emit(self):
+        """Log progress event and feed throughput sample to metrics.
+        """
+        if self.metrics is not None:
+            self.metrics.add_sample("{0}.throughput_mbps".format(self.metrics_prefix), self.rate_mbps)
+
+        log.info("{0}: Progress".format(self.request_label), extra=self.to_dict())
+
+    def finish(self):
+        """Mark download completed and record totals in metrics.
+        """
+        self.time_end = time.monotonic()
+
+        if self.__callback_pending:
+            self.__callback_pending = False
+            self.progress_callback(self)
+
+        if self.metrics is not None:
+            self.metrics.inc("{0}.count".format(self.metrics_prefix))
+            self.metrics.add_sample("{0}.bytes_wire".format(self.metrics_prefix), self.bytes_wire)
+            self.metrics.add_sample("{0}.bytes_decoded".format(self.metrics_prefix), self.bytes_decoded)
+            self.metrics.add_sample("{0}.duration".format(self.metrics_prefix), self.elapsed_secs)
+            self.metrics.add_sample("{0}.throughput_mbps".format(self.metrics_prefix), self.average_rate_mbps)
+
+        return self
+
+    def to_dict(self):
+        percent = self.percent
+        eta_secs = self.eta_secs
+        return {
+            'bytes_wire': self.bytes_wire,
+            'bytes_decoded': self.bytes_decoded,
+            'bytes_human': bytes_to_human(self.bytes_decoded),
+            'content_length': self.content_length,
+            'chunk_count': self.chunk_count,
+            'elapsed_secs': round(self.elapsed_secs, 3),
+            'rate_mbps': round(self.rate_mbps, 3),
+            'percent': round(percent, 1) if percent is not None else None,
+            'eta_secs': round(eta_secs, 1) if eta_secs is not None else None,
+        }
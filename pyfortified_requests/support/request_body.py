@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import io
+from collections.abc import Mapping
+
+from pyfortified_requests.exceptions.custom import (
+    RequestsFortifiedBodyNotReplayableError,
+)
+
+REQUEST_BODY_REPLAY_SIZE = 8 * 1024 * 1024
+REQUEST_BODY_READ_SIZE = 64 * 1024
+
+
+class ReplayBufferedBody(object):
+    """Iterable request body, replaying sent chunks from a bounded buffer.
+
+    Chunks pulled from source are kept while their total stays within
+    'buffer_size', so each iteration starts over with the same bytes.
+    Once more was sent, buffered chunks are dropped and the body is no
+    longer 'replayable'; iterating again then raises
+    :class:`RequestsFortifiedBodyNotReplayableError`, rather than sending
+    a truncated body.
+    """
+
+    def __init__(self, source, buffer_size=REQUEST_BODY_REPLAY_SIZE):
+        """
+        Args:
+            source: Iterable of bytes or str, or non-seekable file-like object.
+            buffer_size: (optional) Bytes kept for replay.
+        """
+        if hasattr(source, 'read'):
+            source = _iter_read(source)
+        self._source = iter(source)
+        self._buffer = []
+        self._buffer_size = buffer_size
+        self._buffered = 0
+        self._started = False
+        self.replayable = True
+
+    def __iter__(self):
+        if self._started and not self.replayable:
+            _raise_body_not_replayable(self._buffer_size)
+        self._started = True
+
+        for chunk in list(self._buffer):
+            yield chunk
+
+        for chunk in self._source:
+            if self.replayable:
+                self._buffered += len(chunk)
+                if self._buffered <= self._buffer_size:
+                    self._buffer.append(chunk)
+                else:
+                    self._buffer = []
+                    self.replayable = False
+            yield chunk
+
+
+def _iter_read(file_obj, size=REQUEST_BODY_READ_SIZE):
+    while True:
+        data = file_obj.read(size)
+        if not data:
+            break
+        yield data
+
+
+def _raise_body_not_replayable(buffer_size):
+    raise RequestsFortifiedBodyNotReplayableError(
+        error_message="Request body is not replayable: Streamed beyond replay buffer of {0} bytes".format(
+            buffer_size
+        ),
+    )
+
+
+class RequestBodyRewind(object):
+    """Request body which can be sent again by retries.
+
+    bytes, str, and form data are sent as is. Seekable file-like objects
+    are rewound to their starting position. Iterables which are
+    'rewindable', restarting from their source on each iteration such as
+    :class:`UploadChunks`, are sent as is. Other file-like objects,
+    iterables and generators are wrapped in :class:`ReplayBufferedBody`.
+    """
+
+    def __init__(self, body, buffer_size=REQUEST_BODY_REPLAY_SIZE):
+        """
+        Args:
+            body: Request body, as 'data' of 'requests.request'.
+            buffer_size: (optional) Bytes kept to replay non-seekable bodies.
+        """
+        self.body = body
+        self._position = None
+
+        if body is None or isinstance(body, (bytes, bytearray, str, Mapping, list, tuple)):
+            return
+        if getattr(body, 'rewindable', False):
+            return
+
+        if hasattr(body, 'read'):
+            if _is_seekable(body):
+                self._position = body.tell()
+                return
+        elif not hasattr(body, '__iter__'):
+            return
+
+        self.body = ReplayBufferedBody(body, buffer_size)
+
+    @property
+    def replayable(self):
+        return not isinstance(self.body, ReplayBufferedBody) or self.body.replayable
+
+    def rewind(self):
+        """Prepare body to be sent again.
+
+        Returns:
+            Body to be sent.
+
+        Raises:
+            RequestsFortifiedBodyNotReplayableError: Body was streamed beyond the replay buffer.
+        """
+        if not self.replayable:
+            _raise_body_not_replayable(self.body._buffer_size)
+        if self._position is not None:
+            self.body.seek(self._position)
+        return self.body
+
+
+def _is_seekable(file_obj):
+    try:
+        if not file_obj.seekable():
+            return False
+        file_obj.tell()
+        return True
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return False
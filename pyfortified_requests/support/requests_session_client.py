@@ -7,6 +7,7 @@ import requests
 from requests.adapters import (HTTPAdapter, DEFAULT_POOLSIZE)
 from urllib3.util.retry import Retry
 from pyfortified_requests.support import (REQUEST_RETRY_HTTP_STATUS_CODES)
+from pyfortified_requests.support.http_status import (http_status_classes)
 from pyfortified_requests.errors import (get_exception_message)
 
 log = logging.getLogger(__name__)
@@ -18,7 +19,11 @@ class RequestsSessionClient(object):
 
     __session = None
 
-    def __init__(self, retry_tries=3, retry_backoff=0.1, retry_codes=None, session=None):
+    def __init__(self, retry_tries=3, retry_backoff=0.1, retry_codes=None, session=None, timeout=None):
+        # Timeout of requests not providing one: seconds, or (connect, read) tuple.
+        self.timeout = timeout
+        # Status classification, 'retryable' by status codes retried by the session.
+        self.http_status_classes = http_status_classes(retry_codes)
 
         if session is not None:
             assert isinstance(session, requests.Session)
@@ -49,6 +54,8 @@ class RequestsSessionClient(object):
         self.__session = value
 
     def request(self, request_method, request_url, **kwargs):
+        if self.timeout is not None and kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
         extra_session_request = {'method': request_method, 'url': request_url}
         extra_session_request.update(kwargs)
         log.debug("Session Request: Details", extra=extra_session_request)
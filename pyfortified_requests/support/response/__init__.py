@@ -3,11 +3,49 @@
 # @namespace pyfortified_requests
 
 from .csv import (
+    CSV_BATCH_SIZE,
+    CSV_OUTPUT_COLUMNS,
+    CSV_OUTPUT_DICT,
+    CSV_OUTPUT_TUPLES,
+    CsvBatch,
+    csv_row_dict,
+    csv_rows_output,
     csv_skip_last_row,
 )
+from .csv_parallel import (
+    CSV_PARSE_RANGE_SIZE,
+    csv_parse_file_parallel,
+    csv_split_ranges,
+    csv_split_supported,
+)
+from .csv_schema import (
+    CSV_TYPE_BOOL,
+    CSV_TYPE_DATE,
+    CSV_TYPE_FLOAT,
+    CSV_TYPE_INT,
+    CSV_TYPE_STR,
+    CsvColumnType,
+    CsvSchema,
+)
+from .error_body import (
+    capture_response_error_details,
+    ERROR_BODY_LIMIT,
+    error_content_text,
+    response_error_body,
+)
+from .headers import (
+    RESPONSE_HEADER_REDACTED_VALUE,
+    RESPONSE_HEADERS_REDACTED,
+    response_headers_snapshot,
+)
 from .parse import (
+    html_text_lines,
+    HtmlTextExtractor,
     requests_response_text_html,
     requests_response_text_xml,
+    TEXT_EXTRACT_CHUNK_SIZE,
+    xml_dict,
+    xml_text_lines,
 )
 from .validate import (
     build_response_error_details,
@@ -2,6 +2,25 @@
 # -*- coding: utf-8 -*-
 # @namespace pyfortified_requests
 
+import logging
+from array import array
+from itertools import islice
+
+from ..lazy_import import optional_import
+from .csv_schema import CsvSchema
+
+log = logging.getLogger(__name__)
+
+CSV_OUTPUT_DICT = 'dict'
+CSV_OUTPUT_TUPLES = 'tuples'
+CSV_OUTPUT_COLUMNS = 'columns'
+
+CSV_OUTPUTS = (CSV_OUTPUT_DICT, CSV_OUTPUT_TUPLES, CSV_OUTPUT_COLUMNS)
+
+CSV_BATCH_SIZE = 10000
+
+_CSV_ARRAY_TYPECODES = {int: 'q', float: 'd'}
+
 
 def csv_skip_last_row(iterator):
     """Skip last CSV row.
@@ -12,7 +31,266 @@ def csv_skip_last_row(iterator):
     Returns:
 
     """
-    prev = next(iterator)
+    try:
+        prev = next(iterator)
+    except StopIteration:
+        return
     for item in iterator:
         yield prev
         prev = item
+
+
+def csv_row_dict(csv_header, row):
+    """Row as dictionary, as 'csv.DictReader' would: values missing from
+    a short row are None, and values past header of a long row are kept
+    as a list under key None.
+    """
+    row_dict = dict(zip(csv_header, row))
+    csv_header_len = len(csv_header)
+    if len(row) > csv_header_len:
+        row_dict[None] = list(row[csv_header_len:])
+    else:
+        for name in csv_header[len(row):]:
+            row_dict[name] = None
+    return row_dict
+
+
+class CsvBatch(object):
+    """Batch of CSV rows sharing one header.
+
+    Rows are kept as tuples; 'columns' provides the same data column-wise,
+    as NumPy arrays (when installed) or 'array.array' for int and float
+    columns, and lists otherwise.
+
+    Rows shorter than header are padded with None, and counted in
+    'rows_short'; values past header of longer rows are kept in
+    'overflow', by row index within batch.
+    """
+
+    __slots__ = ('header', 'rows', 'errors', 'overflow', 'rows_short', '_columns', '_column_types')
+
+    def __init__(self, header, rows=None, columns=None, column_types=None, errors=None, overflow=None, rows_short=0):
+        self.header = header
+        self.rows = rows
+        self.errors = errors or {}
+        self.overflow = overflow or {}
+        self.rows_short = rows_short
+        self._columns = columns
+        self._column_types = column_types or {}
+
+    @property
+    def rows_long(self):
+        return len(self.overflow)
+
+    def __len__(self):
+        if self.rows is not None:
+            return len(self.rows)
+        if self._columns:
+            return len(next(iter(self._columns.values())))
+        return 0
+
+    @property
+    def columns(self):
+        if self._columns is None:
+            columns = list(zip(*self.rows)) if self.rows else [() for _ in self.header]
+            self._columns = {
+                name: csv_column_array(column, self._column_types.get(name))
+                for name, column in zip(self.header, columns)
+            }
+        return self._columns
+
+    def to_dicts(self):
+        header = self.header
+        if self.rows is not None:
+            row_dicts = [dict(zip(header, row)) for row in self.rows]
+        else:
+            row_dicts = [dict(zip(header, row)) for row in zip(*(self._columns[name] for name in header))]
+        for index, values in self.overflow.items():
+            row_dicts[index][None] = values
+        return row_dicts
+
+
+def csv_column_array(column, column_type=None):
+    """Column values as array: NumPy if installed, else 'array.array' for int/float.
+
+    Columns containing None (null or failed cast), or ints beyond 64 bits,
+    are kept as lists.
+
+    Args:
+        column: Sequence of values, already cast to 'column_type'.
+        column_type: (optional) Type of values.
+
+    Returns:
+        numpy.ndarray, array.array or list
+    """
+    numpy = optional_import('numpy')
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        return column
+    typecode = _CSV_ARRAY_TYPECODES.get(column_type)
+    if typecode is None or None in column:
+        return list(column)
+    try:
+        if numpy is not None:
+            return numpy.array(column, dtype=numpy.int64 if column_type is int else numpy.float64)
+        return array(typecode, column)
+    except OverflowError:
+        return list(column)
+
+
+def _csv_column_values(column):
+    numpy = optional_import('numpy')
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        return column.tolist()
+    return column
+
+
+def log_csv_schema_errors(csv_schema):
+    """Log warning of cast errors counted per column, if any.
+    """
+    if csv_schema is not None and any(csv_schema.errors.values()):
+        log.warning(
+            "CSV Schema: Cast Errors",
+            extra={
+                'csv_schema_errors': {name: count for name, count in csv_schema.errors.items() if count},
+            }
+        )
+
+
+def log_csv_row_errors(rows_short, rows_long, csv_header_len):
+    """Log warning of rows whose length differs from header, if any.
+    """
+    if rows_short or rows_long:
+        log.warning(
+            "CSV Rows: Length Mismatch",
+            extra={
+                'csv_header_len': csv_header_len,
+                'rows_short': rows_short,
+                'rows_long': rows_long,
+            }
+        )
+
+
+def csv_rows_output(
+    csv_rows,
+    csv_header,
+    csv_output=CSV_OUTPUT_DICT,
+    csv_batch_size=CSV_BATCH_SIZE,
+    csv_schema=None,
+    log_errors=True,
+):
+    """Shape parsed CSV rows into requested output.
+
+    Args:
+        csv_rows: Iterator of row value lists, e.g. 'csv.reader'.
+        csv_header: Column names.
+        csv_output: (optional) 'dict': yield one dictionary per row (default);
+            'tuples': yield :class:`CsvBatch` of rows as tuples;
+            'columns': yield :class:`CsvBatch` of column arrays.
+        csv_batch_size: (optional) Rows per batch for 'tuples' and 'columns'.
+        csv_schema: (optional) :class:`CsvSchema`, or dictionary of column name
+            to column type specification, see :class:`CsvColumnType`.
+            Cast errors are counted per column in 'CsvSchema.errors'
+            and in 'CsvBatch.errors', instead of raising.
+        log_errors: (optional) Log warning of cast errors, and of rows whose
+            length differs from header, once rows are exhausted.
+
+    Rows whose length differs from header are kept as 'csv.DictReader'
+    would, see :func:`csv_row_dict` and :class:`CsvBatch`.
+
+    Returns:
+        Generator of dictionaries or :class:`CsvBatch`.
+    """
+    if csv_output not in CSV_OUTPUTS:
+        raise ValueError("Unexpected CSV output: '{0}'".format(csv_output))
+
+    csv_header = tuple(csv_header)
+    csv_header_len = len(csv_header)
+    csv_schema = CsvSchema.parse(csv_schema)
+
+    rows_short = rows_long = 0
+
+    if csv_output == CSV_OUTPUT_DICT and not csv_schema:
+        for row in csv_rows:
+            if len(row) == csv_header_len:
+                yield dict(zip(csv_header, row))
+                continue
+
+            if len(row) < csv_header_len:
+                rows_short += 1
+            else:
+                rows_long += 1
+            yield csv_row_dict(csv_header, row)
+
+        if log_errors:
+            log_csv_row_errors(rows_short, rows_long, csv_header_len)
+        return
+
+    csv_rows = iter(csv_rows)
+    while True:
+        rows = list(islice(csv_rows, csv_batch_size))
+        if not rows:
+            break
+
+        # Short rows are padded with None; values past header are kept aside.
+        batch_rows_short = 0
+        overflow = {}
+        for index, row in enumerate(rows):
+            if len(row) == csv_header_len:
+                continue
+            if len(row) < csv_header_len:
+                batch_rows_short += 1
+                rows[index] = list(row) + [None] * (csv_header_len - len(row))
+            else:
+                overflow[index] = list(row[csv_header_len:])
+                rows[index] = row[:csv_header_len]
+
+        rows_short += batch_rows_short
+        rows_long += len(overflow)
+
+        if not csv_schema:
+            yield CsvBatch(
+                csv_header,
+                rows=[tuple(row) for row in rows],
+                overflow=overflow,
+                rows_short=batch_rows_short,
+            )
+            continue
+
+        columns, batch_errors = csv_schema.cast_columns(csv_header, zip(*rows))
+        column_types = {name: csv_schema.column_type(name) for name in csv_header if name in csv_schema}
+
+        if csv_output == CSV_OUTPUT_COLUMNS:
+            yield CsvBatch(
+                csv_header,
+                columns={
+                    name: csv_column_array(column, column_types.get(name))
+                    for name, column in zip(csv_header, columns)
+                },
+                column_types=column_types,
+                errors=batch_errors,
+                overflow=overflow,
+                rows_short=batch_rows_short,
+            )
+            continue
+
+        rows = list(zip(*[_csv_column_values(column) for column in columns]))
+
+        if csv_output == CSV_OUTPUT_DICT:
+            for index, row in enumerate(rows):
+                row_dict = dict(zip(csv_header, row))
+                if overflow and index in overflow:
+                    row_dict[None] = overflow[index]
+                yield row_dict
+        else:
+            yield CsvBatch(
+                csv_header,
+                rows=rows,
+                column_types=column_types,
+                errors=batch_errors,
+                overflow=overflow,
+                rows_short=batch_rows_short,
+            )
+
+    if log_errors:
+        log_csv_schema_errors(csv_schema)
+        log_csv_row_errors(rows_short, rows_long, csv_header_len)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import csv
+import io
+import locale
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    wait,
+)
+
+from ..mmap_file import (
+    mmap_decode,
+    mmap_open,
+)
+from .csv import (
+    CSV_BATCH_SIZE,
+    CSV_OUTPUT_DICT,
+    CSV_OUTPUT_TUPLES,
+    CSV_OUTPUTS,
+    csv_rows_output,
+    csv_skip_last_row,
+    log_csv_row_errors,
+    log_csv_schema_errors,
+)
+from .csv_schema import CsvSchema
+
+CSV_PARSE_RANGE_SIZE = 8 * 1024 * 1024
+CSV_SPLIT_BLOCK_SIZE = 1024 * 1024
+
+# Encodings where b'\n' and b'"' bytes can only be those characters.
+_CSV_SPLIT_ENCODINGS = ('utf8', 'utf_8', 'ascii', 'latin_1', 'iso8859_1', 'cp125')
+
+
+def csv_split_supported(encoding):
+    """Can file in this encoding be split on raw bytes.
+
+    Args:
+        encoding: Encoding name, None for locale default.
+
+    Returns:
+        Boolean
+    """
+    encoding = (encoding or locale.getpreferredencoding(False)).lower().replace('-', '_')
+    return encoding.startswith(_CSV_SPLIT_ENCODINGS)
+
+
+def csv_split_ranges(file_path, start=0, range_size=CSV_PARSE_RANGE_SIZE, quotechar='"'):
+    """Split CSV file into byte ranges of about 'range_size', aligned on record boundaries.
+
+    A newline only ends a record when preceded by an even number of quote
+    characters, so quoted fields spanning lines are never split. Doubled
+    quotes within quoted fields keep parity, as in RFC 4180.
+
+    Args:
+        file_path: CSV file path.
+        start: (optional) Byte offset of first record, e.g. after header.
+        range_size: (optional) Approximate bytes per range.
+        quotechar: (optional) CSV quote character.
+
+    Returns:
+        List of (start, end) byte offsets.
+    """
+    quote = quotechar.encode('ascii')
+    ranges = []
+    range_start = start
+    target = start + range_size
+    in_quotes = 0
+    pos = start
+
+    with open(file_path, 'rb') as file_rb:
+        file_rb.seek(start)
+        while True:
+            block = file_rb.read(CSV_SPLIT_BLOCK_SIZE)
+            if not block:
+                break
+            length = len(block)
+            index = 0
+
+            while pos + length > target:
+                seek = max(target - pos, index)
+                in_quotes ^= block.count(quote, index, seek) & 1
+                newline = block.find(b'\n', seek)
+                if newline < 0:
+                    # Keep seeking record end from start of next block.
+                    in_quotes ^= block.count(quote, seek, length) & 1
+                    index = length
+                    target = pos + length
+                    break
+
+                in_quotes ^= block.count(quote, seek, newline) & 1
+                index = newline + 1
+                if in_quotes:
+                    target = pos + index
+                    continue
+
+                ranges.append((range_start, pos + index))
+                range_start = pos + index
+                target = range_start + range_size
+
+            in_quotes ^= block.count(quote, index, length) & 1
+            pos += length
+
+    if range_start < pos:
+        ranges.append((range_start, pos))
+
+    return ranges
+
+
+def _csv_parse_range(
+    file_path,
+    start,
+    end,
+    encoding,
+    csv_delimiter,
+    csv_header,
+    csv_output,
+    csv_batch_size,
+    csv_schema,
+    skip_last_row,
+):
+    """Parse one byte range within worker process.
+
+    Returns:
+        Tuple of list of :class:`CsvBatch`, and dictionaries of cast errors and nulls per column.
+    """
+    with mmap_open(file_path) as file_mmap:
+        text = mmap_decode(file_mmap, start, end, encoding or locale.getpreferredencoding(False))
+
+    csv_rows = csv.reader(io.StringIO(text, newline=''), delimiter=csv_delimiter)
+    csv_rows = (row for row in csv_rows if row)
+
+    if skip_last_row:
+        csv_rows = csv_skip_last_row(csv_rows)
+
+    errors = nulls = None
+    if csv_schema is not None:
+        errors, nulls = dict(csv_schema.errors), dict(csv_schema.nulls)
+
+    batches = list(
+        csv_rows_output(
+            csv_rows,
+            csv_header,
+            csv_output=CSV_OUTPUT_TUPLES if csv_output == CSV_OUTPUT_DICT else csv_output,
+            csv_batch_size=csv_batch_size,
+            csv_schema=csv_schema,
+            log_errors=False,
+        )
+    )
+
+    if csv_schema is not None:
+        errors = {name: count - errors[name] for name, count in csv_schema.errors.items()}
+        nulls = {name: count - nulls[name] for name, count in csv_schema.nulls.items()}
+
+    return batches, errors, nulls
+
+
+def csv_parse_file_parallel(
+    file_path,
+    csv_header,
+    start=0,
+    encoding=None,
+    csv_delimiter=',',
+    csv_output=CSV_OUTPUT_DICT,
+    csv_batch_size=CSV_BATCH_SIZE,
+    csv_schema=None,
+    skip_last_row=False,
+    processes=None,
+    ordered=True,
+    range_size=CSV_PARSE_RANGE_SIZE,
+):
+    """Parse CSV file in a process pool.
+
+    File is split into byte ranges aligned on record boundaries, see
+    :func:`csv_split_ranges`, which are parsed in parallel. At most two
+    ranges per process are in flight, so memory stays bounded when the
+    consumer is slower than the parsers.
+
+    Args:
+        file_path: CSV file path.
+        csv_header: Column names.
+        start: (optional) Byte offset of first record, e.g. after header.
+        encoding: (optional) File encoding, must be ASCII compatible,
+            see :func:`csv_split_supported`.
+        csv_delimiter: (optional) Delimiter character, default comma ','.
+        csv_output: (optional) 'dict', 'tuples' or 'columns',
+            see :func:`csv_rows_output`.
+        csv_batch_size: (optional) Rows per batch for 'tuples' and 'columns'.
+        csv_schema: (optional) :class:`CsvSchema` or dictionary of column types;
+            cast errors of all processes are summed into 'CsvSchema.errors'.
+        skip_last_row: (optional) Skip last row of file.
+        processes: (optional) Worker processes, default CPU count.
+        ordered: (optional) Yield in file order; when False, ranges are
+            yielded as soon as parsed.
+        range_size: (optional) Approximate bytes per range.
+
+    Returns:
+        Generator of dictionaries or :class:`CsvBatch`.
+    """
+    if csv_output not in CSV_OUTPUTS:
+        raise ValueError("Unexpected CSV output: '{0}'".format(csv_output))
+    if not csv_split_supported(encoding):
+        raise ValueError("CSV encoding cannot be split: '{0}'".format(encoding))
+
+    csv_header = tuple(csv_header)
+    csv_schema = CsvSchema.parse(csv_schema)
+    processes = processes or os.cpu_count() or 1
+
+    ranges = csv_split_ranges(file_path, start=start, range_size=range_size)
+    last_range = len(ranges) - 1
+    tasks = iter(enumerate(ranges))
+
+    # Imports multiprocessing, so only when parsing in parallel.
+    from concurrent.futures import ProcessPoolExecutor
+
+    rows_short = rows_long = 0
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = []
+
+        def submit():
+            for index, (range_start, range_end) in tasks:
+                pending.append(
+                    executor.submit(
+                        _csv_parse_range,
+                        file_path,
+                        range_start,
+                        range_end,
+                        encoding,
+                        csv_delimiter,
+                        csv_header,
+                        csv_output,
+                        csv_batch_size,
+                        csv_schema,
+                        skip_last_row and index == last_range,
+                    )
+                )
+                if len(pending) >= processes * 2:
+                    return
+
+        try:
+            submit()
+            while pending:
+                if ordered:
+                    future = pending.pop(0)
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = done.pop()
+                    pending.remove(future)
+
+                batches, errors, nulls = future.result()
+                submit()
+
+                if csv_schema is not None:
+                    for name, count in errors.items():
+                        csv_schema.errors[name] += count
+                    for name, count in nulls.items():
+                        csv_schema.nulls[name] += count
+
+                for batch in batches:
+                    rows_short += batch.rows_short
+                    rows_long += batch.rows_long
+                    if csv_output == CSV_OUTPUT_DICT:
+                        for row_dict in batch.to_dicts():
+                            yield row_dict
+                    else:
+                        yield batch
+
+            log_csv_schema_errors(csv_schema)
+            log_csv_row_errors(rows_short, rows_long, len(csv_header))
+        finally:
+            for future in pending:
+                future.cancel()
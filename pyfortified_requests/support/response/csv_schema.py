@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import datetime as dt
+from functools import partial
+
+from ..lazy_import import optional_import
+
+CSV_TYPE_STR = 'str'
+CSV_TYPE_INT = 'int'
+CSV_TYPE_FLOAT = 'float'
+CSV_TYPE_BOOL = 'bool'
+CSV_TYPE_DATE = 'date'
+CSV_TYPE_CALLABLE = 'callable'
+
+CSV_TYPES = (CSV_TYPE_STR, CSV_TYPE_INT, CSV_TYPE_FLOAT, CSV_TYPE_BOOL, CSV_TYPE_DATE)
+
+CSV_DATE_FORMAT = '%Y-%m-%d'
+
+CSV_BOOL_TRUE = ('true', 't', 'yes', 'y', '1')
+CSV_BOOL_FALSE = ('false', 'f', 'no', 'n', '0')
+
+_CSV_PYTHON_TYPES = {
+    str: CSV_TYPE_STR,
+    int: CSV_TYPE_INT,
+    float: CSV_TYPE_FLOAT,
+    bool: CSV_TYPE_BOOL,
+    dt.date: CSV_TYPE_DATE,
+}
+
+_CSV_BOOL_VALUES = dict(
+    [(value, True) for value in CSV_BOOL_TRUE] + [(value, False) for value in CSV_BOOL_FALSE]
+)
+
+
+def _cast_bool(value):
+    return _CSV_BOOL_VALUES[value.strip().lower()]
+
+
+def _cast_date(value, date_format=CSV_DATE_FORMAT):
+    return dt.datetime.strptime(value.strip(), date_format).date()
+
+
+class CsvColumnType(object):
+    """Type of a CSV column.
+
+    Specification is either a type name, optionally followed by ':format'
+    for dates and '?' when nullable, e.g. 'int', 'float?', 'date:%m/%d/%Y?';
+    a Python type: str, int, float, bool, datetime.date;
+    or any cast callable.
+    """
+
+    __slots__ = ('type_name', 'nullable', 'date_format', 'cast')
+
+    def __init__(self, type_name, nullable=False, date_format=None, cast=None):
+        if type_name not in CSV_TYPES and type_name != CSV_TYPE_CALLABLE:
+            raise ValueError("Unexpected CSV column type: '{0}'".format(type_name))
+
+        self.type_name = type_name
+        self.nullable = nullable
+        self.date_format = date_format
+
+        if cast is None:
+            if type_name == CSV_TYPE_INT:
+                cast = int
+            elif type_name == CSV_TYPE_FLOAT:
+                cast = float
+            elif type_name == CSV_TYPE_BOOL:
+                cast = _cast_bool
+            elif type_name == CSV_TYPE_DATE:
+                cast = partial(_cast_date, date_format=date_format or CSV_DATE_FORMAT)
+            else:
+                cast = str
+        self.cast = cast
+
+    @classmethod
+    def parse(cls, spec):
+        if isinstance(spec, cls):
+            return spec
+
+        if isinstance(spec, str):
+            nullable = spec.endswith('?')
+            type_name, _, date_format = spec.rstrip('?').partition(':')
+            return cls(type_name.strip().lower(), nullable=nullable, date_format=date_format or None)
+
+        if spec in _CSV_PYTHON_TYPES:
+            return cls(_CSV_PYTHON_TYPES[spec])
+
+        if callable(spec):
+            return cls(CSV_TYPE_CALLABLE, cast=spec)
+
+        raise ValueError("Unexpected CSV column type: '{0}'".format(spec))
+
+    @property
+    def python_type(self):
+        for python_type, type_name in _CSV_PYTHON_TYPES.items():
+            if type_name == self.type_name:
+                return python_type
+        return None
+
+
+class CsvSchema(object):
+    """CSV column schema, casting batches of values column-wise.
+
+    Cells that cannot be cast, or empty cells of non-nullable columns,
+    become None and are counted per column in 'errors' instead of raising.
+
+    When NumPy is installed, int, float, bool and ISO date columns are cast
+    vectorized. A batch falls back to the per-cell pure-Python path only
+    when it contains empty or malformed cells.
+    """
+
+    def __init__(self, columns, use_numpy=True):
+        """
+        Args:
+            columns: Dictionary of column name to column type specification,
+                see :class:`CsvColumnType`.
+            use_numpy: (optional) Use NumPy vectorized casting when installed.
+        """
+        self.columns = {name: CsvColumnType.parse(spec) for name, spec in columns.items()}
+        self.use_numpy = use_numpy and optional_import('numpy') is not None
+        self.errors = {name: 0 for name in self.columns}
+        self.nulls = {name: 0 for name in self.columns}
+
+    @classmethod
+    def parse(cls, csv_schema):
+        if csv_schema is None or isinstance(csv_schema, cls):
+            return csv_schema
+        return cls(csv_schema)
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def column_type(self, name):
+        column_type = self.columns.get(name)
+        return column_type.python_type if column_type is not None else None
+
+    def cast_column(self, name, values):
+        """Cast column values.
+
+        Args:
+            name: Column name.
+            values: Sequence of str values, None for missing cells.
+
+        Returns:
+            Tuple of cast column (numpy.ndarray when vectorized, otherwise list),
+            and count of errors.
+        """
+        column_type = self.columns.get(name)
+        if column_type is None:
+            return values, 0
+
+        if self.use_numpy:
+            column = self.__cast_column_numpy(column_type, values)
+            if column is not None:
+                return column, 0
+
+        cast = column_type.cast
+        nullable = column_type.nullable
+        column = []
+        errors = nulls = 0
+        for value in values:
+            if value is None or not value.strip():
+                column.append(None)
+                nulls += 1
+                if not nullable:
+                    errors += 1
+                continue
+            try:
+                column.append(cast(value))
+            except (ValueError, TypeError, KeyError, OverflowError):
+                column.append(None)
+                errors += 1
+
+        self.errors[name] += errors
+        self.nulls[name] += nulls
+        return column, errors
+
+    @staticmethod
+    def __cast_column_numpy(column_type, values):
+        """Vectorized cast, None if batch must use per-cell path.
+        """
+        type_name = column_type.type_name
+        if type_name not in (CSV_TYPE_INT, CSV_TYPE_FLOAT, CSV_TYPE_BOOL, CSV_TYPE_DATE):
+            return None
+        if type_name == CSV_TYPE_DATE and column_type.date_format not in (None, CSV_DATE_FORMAT):
+            return None
+        if not values or None in values:
+            return None
+
+        numpy = optional_import('numpy')
+        column = numpy.array(values, dtype=str)
+        if (column == '').any():
+            return None
+
+        try:
+            if type_name == CSV_TYPE_INT:
+                return column.astype(numpy.int64)
+            if type_name == CSV_TYPE_FLOAT:
+                return column.astype(numpy.float64)
+            if type_name == CSV_TYPE_DATE:
+                if (numpy.char.str_len(column) != 10).any():
+                    return None
+                return column.astype('datetime64[D]')
+
+            column = numpy.char.lower(numpy.char.strip(column))
+            column_true = numpy.isin(column, CSV_BOOL_TRUE)
+            if not (column_true | numpy.isin(column, CSV_BOOL_FALSE)).all():
+                return None
+            return column_true
+
+        except (ValueError, TypeError, OverflowError):
+            return None
+
+    def cast_columns(self, header, columns):
+        """Cast batch of columns.
+
+        Args:
+            header: Column names.
+            columns: List of column value sequences, ordered as header.
+
+        Returns:
+            Tuple of list of cast columns, and dictionary of errors per column for this batch.
+        """
+        batch_errors = {}
+        columns = list(columns)
+        for index, name in enumerate(header):
+            if name not in self.columns:
+                continue
+            columns[index], errors = self.cast_column(name, columns[index])
+            if errors:
+                batch_errors[name] = errors
+        return columns, batch_errors
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import ujson as json
+
+from pyfortified_requests.support.progress import response_content_length
+from .parse import (
+    html_text_lines,
+    xml_text_lines,
+)
+
+ERROR_BODY_LIMIT = 64 * 1024
+ERROR_BODY_CHUNK_SIZE = 8 * 1024
+
+
+def response_error_body(response, limit=ERROR_BODY_LIMIT):
+    """Capture at most 'limit' bytes of response body.
+
+    A streamed response not yet read is read incrementally, only up to
+    'limit' (plus one byte to detect truncation), and then closed, so a
+    huge error page is never loaded. A response already read is sliced.
+
+    Args:
+        response: requests.Response
+        limit: (optional) Maximum bytes captured.
+
+    Returns:
+        Tuple of captured bytes, and whether body was truncated.
+    """
+    if response is None:
+        return b'', False
+
+    content = getattr(response, '_content', None)
+
+    if content is False:
+        if getattr(response, '_content_consumed', False) or getattr(response, 'raw', None) is None:
+            return b'', False
+
+        body = bytearray()
+        truncated = False
+        try:
+            for chunk in response.iter_content(ERROR_BODY_CHUNK_SIZE):
+                body += chunk
+                if len(body) > limit:
+                    truncated = True
+                    break
+        finally:
+            response.close()
+        return bytes(body[:limit]), truncated
+
+    if content is None:
+        content = getattr(response, 'content', None) or b''
+
+    return content[:limit], len(content) > limit
+
+
+def error_body_text(body, encoding=None):
+    """Decode captured error body, replacing undecodable bytes,
+    e.g. a multi-byte character cut at the capture limit.
+    """
+    try:
+        return body.decode(encoding or 'utf-8', 'replace')
+    except LookupError:
+        return body.decode('utf-8', 'replace')
+
+
+def error_content_text(content, limit=ERROR_BODY_LIMIT):
+    """At most 'limit' bytes or characters of content, as text.
+
+    Args:
+        content: bytes or str, e.g. downloaded content failing to parse.
+        limit: (optional) Maximum bytes or characters kept.
+
+    Returns:
+        Tuple of text, and whether content was truncated.
+    """
+    truncated = len(content) > limit
+    content = content[:limit]
+    if not isinstance(content, str):
+        content = error_body_text(bytes(content))
+    return content, truncated
+
+
+def capture_response_error_details(response, limit=ERROR_BODY_LIMIT):
+    """Bounded details of error response body.
+
+    Body is captured up to 'limit' bytes, see :func:`response_error_body`,
+    then parsed as JSON if complete, or reduced to text for HTML and XML.
+
+    Args:
+        response: requests.Response
+        limit: (optional) Maximum bytes captured.
+
+    Returns:
+        Dictionary of 'response_details', 'response_details_source'
+        ('json', 'html', 'xml' or 'text'), and truncation metadata
+        'response_details_truncated', 'response_details_size' (bytes
+        captured) and 'response_content_length' (header, if any).
+    """
+    body, truncated = response_error_body(response, limit)
+
+    error_details = {
+        'response_details': None,
+        'response_details_source': None,
+        'response_details_truncated': truncated,
+        'response_details_size': len(body),
+        'response_content_length': response_content_length(response),
+    }
+
+    if not body:
+        return error_details
+
+    text = error_body_text(body, getattr(response, 'encoding', None))
+    text_start = text.lstrip()[:64].lower()
+
+    response_details = None
+    response_details_source = None
+
+    if not truncated and text_start.startswith(('{', '[')):
+        try:
+            response_details = json.loads(text)
+            response_details_source = 'json'
+        except ValueError:
+            pass
+
+    if response_details_source is None:
+        if text_start.startswith(('<html', '<!doctype html')):
+            response_details = html_text_lines(text)
+            response_details_source = 'html'
+        elif text_start.startswith('<?xml'):
+            response_details = xml_text_lines(text)
+            response_details_source = 'xml'
+        else:
+            response_details = text
+            response_details_source = 'text'
+
+    if truncated:
+        truncated_note = "... (truncated: {0} of {1} bytes)".format(
+            len(body), error_details['response_content_length'] or 'more'
+        )
+        if isinstance(response_details, list):
+            response_details.append(truncated_note)
+        elif isinstance(response_details, str):
+            response_details += ' ' + truncated_note
+
+    error_details.update({
+        'response_details': response_details,
+        'response_details_source': response_details_source,
+    })
+    return error_details
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+RESPONSE_HEADERS_REDACTED = frozenset((
+    'authorization',
+    'cookie',
+    'proxy-authenticate',
+    'proxy-authorization',
+    'set-cookie',
+    'www-authenticate',
+    'x-amz-security-token',
+    'x-api-key',
+    'x-auth-token',
+))
+
+RESPONSE_HEADER_REDACTED_VALUE = '[REDACTED]'
+
+_SNAPSHOT_ATTR = '_pyfortified_headers_snapshot'
+
+
+def response_headers_snapshot(response, redact=RESPONSE_HEADERS_REDACTED):
+    """Response headers as plain dictionary, built once per response.
+
+    The snapshot is cached on the response, so logging, error details and
+    metrics of the same response share it. Header names keep the case
+    sent by the server; use 'response.headers' for case-insensitive lookup.
+
+    Args:
+        response: requests.Response
+        redact: (optional) Lowercase header names whose values are replaced
+            by '[REDACTED]'; None or empty to keep all values.
+
+    Returns:
+        Dictionary, empty if response has no headers.
+    """
+    redact = frozenset(redact) if redact else frozenset()
+
+    snapshots = getattr(response, _SNAPSHOT_ATTR, None)
+    if snapshots is None:
+        snapshots = {}
+        try:
+            setattr(response, _SNAPSHOT_ATTR, snapshots)
+        except AttributeError:
+            pass
+    elif redact in snapshots:
+        return snapshots[redact]
+
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        snapshot = {}
+    else:
+        # requests' CaseInsensitiveDict keeps (name, value) by lowercase name,
+        # iterating it directly avoids a lookup per header.
+        header_items = getattr(headers, '_store', None)
+        if header_items is not None:
+            header_items = header_items.items()
+        else:
+            header_items = ((name.lower(), (name, value)) for name, value in headers.items())
+
+        snapshot = {
+            name: RESPONSE_HEADER_REDACTED_VALUE if name_lower in redact else value
+            for name_lower, (name, value) in header_items
+        }
+
+    snapshots[redact] = snapshot
+    return snapshot
@@ -3,14 +3,203 @@
 # @namespace pyfortified_requests
 
 import logging
+import re
 import ujson as json
-import xmltodict
-from bs4 import BeautifulSoup
+import xml.etree.ElementTree as ElementTree
+from html.parser import HTMLParser
 
 log = logging.getLogger(__name__)
 
 # from pprintpp import pprint
 
+TEXT_EXTRACT_CHUNK_SIZE = 64 * 1024
+
+# Elements whose content is not text.
+_HTML_SKIP_TAGS = frozenset(('script', 'style', 'noscript', 'template'))
+
+# Elements starting a new line of text.
+_HTML_BLOCK_TAGS = frozenset((
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4',
+    'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section',
+    'table', 'td', 'th', 'title', 'tr', 'ul',
+))
+
+_WHITESPACE_RE = re.compile(r'[ \t\r\f\v]+')
+
+
+class HtmlTextExtractor(HTMLParser):
+    """Incremental HTML to text, without script and style.
+
+    Text is collected as non-empty lines with whitespace collapsed; once
+    'max_chars' are collected, further input is ignored, so memory is
+    bounded regardless of input size.
+    """
+
+    def __init__(self, max_chars=None):
+        super(HtmlTextExtractor, self).__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.lines = []
+        self.chars = 0
+        self._line = []
+        self._skip_depth = 0
+
+    @property
+    def full(self):
+        return self.max_chars is not None and self.chars >= self.max_chars
+
+    def _end_line(self):
+        if self._line:
+            line = _WHITESPACE_RE.sub(' ', ''.join(self._line)).strip()
+            self._line = []
+            if line:
+                self.lines.append(line)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _HTML_SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in _HTML_BLOCK_TAGS:
+            self._end_line()
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in _HTML_BLOCK_TAGS:
+            self._end_line()
+
+    def handle_endtag(self, tag):
+        if tag in _HTML_SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _HTML_BLOCK_TAGS:
+            self._end_line()
+
+    def handle_data(self, data):
+        if self._skip_depth or self.full:
+            return
+        if self.max_chars is not None:
+            data = data[:self.max_chars - self.chars]
+        self.chars += len(data)
+
+        lines = data.split('\n')
+        self._line.append(lines[0])
+        for line in lines[1:]:
+            self._end_line()
+            self._line.append(line)
+
+    def close(self):
+        super(HtmlTextExtractor, self).close()
+        self._end_line()
+
+
+def html_text_lines(html, max_chars=None):
+    """Text of HTML, without script and style, as non-empty lines with whitespace collapsed.
+
+    Uses 'html.parser' incrementally; BeautifulSoup, if installed, is only
+    used should it fail.
+
+    Args:
+        html: HTML text.
+        max_chars: (optional) Maximum characters of text extracted.
+
+    Returns:
+        List of str
+    """
+    extractor = HtmlTextExtractor(max_chars=max_chars)
+    try:
+        for offset in range(0, len(html), TEXT_EXTRACT_CHUNK_SIZE):
+            extractor.feed(html[offset:offset + TEXT_EXTRACT_CHUNK_SIZE])
+            if extractor.full:
+                break
+        extractor.close()
+    except Exception as ex:
+        log.debug("HTML Text: Fallback", extra={'error_details': str(ex)})
+        return _html_text_lines_bs4(html)
+    return extractor.lines
+
+
+def _html_text_lines_bs4(html):
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        return [line.strip() for line in html.splitlines() if line.strip()]
+
+    soup = BeautifulSoup(html, 'html.parser')
+    for elem in soup.findAll(['script', 'style']):
+        elem.extract()
+    return [line.strip() for line in soup.get_text().splitlines() if line.strip()]
+
+
+def xml_text_lines(xml, max_chars=None):
+    """Text of XML elements as 'tag: text' lines, parsed incrementally.
+
+    Elements are cleared once read, so memory is bounded by 'max_chars'.
+    Not well-formed XML, e.g. truncated, yields the text read up to the error.
+
+    Args:
+        xml: XML text.
+        max_chars: (optional) Maximum characters of text extracted.
+
+    Returns:
+        List of str
+    """
+    lines = []
+    chars = 0
+    parser = ElementTree.XMLPullParser(events=('end',))
+    try:
+        for offset in range(0, len(xml), TEXT_EXTRACT_CHUNK_SIZE):
+            parser.feed(xml[offset:offset + TEXT_EXTRACT_CHUNK_SIZE])
+            for _, element in parser.read_events():
+                text = element.text
+                if text and not text.isspace():
+                    text = ' '.join(text.split())
+                    tag = element.tag.rsplit('}', 1)[-1]
+                    lines.append("{0}: {1}".format(tag, text))
+                    chars += len(text)
+                element.clear()
+                if max_chars is not None and chars >= max_chars:
+                    return lines
+        parser.close()
+    except ElementTree.ParseError as ex:
+        log.debug("XML Text: Not well-formed", extra={'error_details': str(ex)})
+        if not lines:
+            return [line.strip() for line in xml[:max_chars].splitlines() if line.strip()]
+    return lines
+
+
+def _xml_element_dict(element):
+    """Element as dictionary, in the form of 'xmltodict.parse'.
+    """
+    element_dict = {'@' + name: value for name, value in element.attrib.items()}
+    for child in element:
+        child_value = _xml_element_dict(child)[child.tag]
+        if child.tag in element_dict:
+            if not isinstance(element_dict[child.tag], list):
+                element_dict[child.tag] = [element_dict[child.tag]]
+            element_dict[child.tag].append(child_value)
+        else:
+            element_dict[child.tag] = child_value
+
+    text = (element.text or '').strip()
+    if text:
+        if not element_dict:
+            return {element.tag: text}
+        element_dict['#text'] = text
+    return {element.tag: element_dict or None}
+
+
+def xml_dict(xml):
+    """XML as dictionary, using 'xmltodict' if installed, else 'xml.etree'.
+
+    Args:
+        xml: XML text.
+
+    Returns:
+        Dictionary
+    """
+    try:
+        import xmltodict
+    except ImportError:
+        return _xml_element_dict(ElementTree.fromstring(xml))
+    return xmltodict.parse(xml)
+
 
 def requests_response_text_html(response):
     """Get HTML Text only
@@ -28,18 +217,9 @@ def requests_response_text_html(response):
 
     if response_content_type.startswith('text/html'):
         try:
-            response_content_html = response.text
-            soup = BeautifulSoup(response_content_html, 'html.parser')
-            for elem in soup.findAll(['script', 'style']):
-                elem.extract()
-            response_content_html_text = soup.get_text()
-            response_content_html_lines = response_content_html_text.splitlines()
-            response_content_html_lines = \
-                [item.strip() for item in response_content_html_lines]
-            response_content_html_lines = \
-                [x for x in response_content_html_lines if x != '']
+            response_content_html_lines = html_text_lines(response.text)
         except Exception as ex:
-            raise ValueError("Failed to parse text/html", errors=ex)
+            raise ValueError("Failed to parse text/html: {0}".format(ex))
     else:
         raise ValueError("Unexpected 'Content-Type': '{0}'".format(response_content_type))
 
@@ -69,7 +249,7 @@ def requests_response_text_xml(response):
         if response_http_status_code == 200 and \
                 response_content_length > 0 and \
                 response_content:
-            xml_dictionary = xmltodict.parse(response_content)
+            xml_dictionary = xml_dict(response_content)
             xml_json = json.loads(json.dumps(xml_dictionary))
 
     else:
@@ -2,13 +2,8 @@
 # -*- coding: utf-8 -*-
 # @namespace pyfortified_requests
 
-import ujson as json
 import logging
 
-import bs4
-from requests_toolbelt.utils import dump
-import xmltodict
-from pprintpp import pprint
 from pyhttpstatus_utils import (
     get_http_status_desc,
     get_http_status_type,
@@ -25,15 +20,22 @@ from pyfortified_requests.errors import (
 from pyfortified_requests.exceptions import (
     RequestsFortifiedModuleError,
 )
+from pyfortified_requests.support.response.headers import (
+    response_headers_snapshot,
+)
 from pyfortified_requests.support.utils import (
     bytes_to_human,
     base_class_name,
     python_check_version,
 )
-from safe_cast import (
+from ..lazy_import import (
     safe_int,
     safe_str,
 )
+from .error_body import (
+    ERROR_BODY_LIMIT,
+    capture_response_error_details,
+)
 from .parse import (requests_response_text_html)
 
 log = logging.getLogger(__name__)
@@ -78,8 +80,10 @@ def validate_response(
     # Assuming positive approach will give us speedup since when attribute exists
     # hasattr takes double the time.
     # Anyway we use text attribute here to logging purpose only
+    # Content of a streamed response not yet read is left untouched.
     try:
-        response_extra.update({'response_text_length': len(response.text)})
+        if response._content is not False:
+            response_extra.update({'response_text_length': len(response.text)})
     except AttributeError:
         pass
 
@@ -206,6 +210,17 @@ def validate_json_response(
     return json_response
 
 
+def _error_details_truncated(response_extra):
+    """Truncation metadata of captured error body, None if not truncated.
+    """
+    if not response_extra.get('response_details_truncated'):
+        return None
+    return "Response body truncated: {0} of {1} bytes captured".format(
+        response_extra.get('response_details_size'),
+        response_extra.get('response_content_length') or 'more'
+    )
+
+
 def requests_response_json(
     response,
     request_curl,
@@ -240,11 +255,6 @@ def requests_response_json(
     except ValueError as json_decode_ex:
         log.error("Validate JSON Response: Failed: JSONDecodeError", extra=response_extra)
 
-        data = dump.dump_all(response)
-        pprint(data.decode('utf-8'))
-
-        pprint(response.text)
-
         handle_json_decode_error(
             response_decode_ex=json_decode_ex,
             response=response,
@@ -256,8 +266,6 @@ def requests_response_json(
     except Exception as ex:
         log.error("Validate JSON Response: Failed: Exception", extra=response_extra)
 
-        pprint(response.text)
-
         handle_json_decode_error(
             response_decode_ex=ex,
             response=response,
@@ -283,13 +291,17 @@ def requests_response_json(
     return json_response
 
 
-def build_response_error_details(request_label, request_url, response):
+def build_response_error_details(request_label, request_url, response, error_body_limit=ERROR_BODY_LIMIT):
     """Build gather status of Requests' response.
 
+    Response body is captured up to 'error_body_limit' bytes,
+    see :func:`capture_response_error_details`.
+
     Args:
         request_label:
         request_url:
         response:
+        error_body_limit: (optional) Maximum bytes of body captured.
 
     Returns:
 
@@ -336,43 +348,12 @@ def build_response_error_details(request_label, request_url, response):
                 safe_str(response.headers['Content-Encoding'])
             response_error_details.update({'Content-Encoding': response_headers_content_encoding})
 
+        response_error_details.update({'response_headers': response_headers_snapshot(response)})
+
     if hasattr(response, "reason") and response.reason:
         response_error_details.update({'response_reason': response.reason})
 
-    response_details = None
-    response_details_source = None
-
-    try:
-        response_details = response.json()
-        response_details_source = 'json'
-    except Exception:
-        if hasattr(response, 'text') and \
-                response.text and \
-                len(response.text) > 0:
-            response_details = response.text
-            response_details_source = 'text'
-
-            if response_details.startswith('<html'):
-                response_details_source = 'html'
-                soup_html = bs4.BeautifulSoup(response_details, "html.parser")
-                # kill all script and style elements
-                for script in soup_html(["script", "style"]):
-                    script.extract()  # rip it out
-                text_html = soup_html.get_text()
-                lines_html = [line for line in text_html.split('\n') if line.strip() != '']
-                lines_html = [line.strip(' ') for line in lines_html]
-                response_details = lines_html
-
-            elif response_details.startswith('<?xml'):
-                response_details_source = 'xml'
-                response_details = json.dumps(xmltodict.parse(response_details))
-
-    response_error_details.update({
-        'response_details': response_details,
-        'response_details_source': response_details_source
-    })
-
-    # pprint(response_error_details)
+    response_error_details.update(capture_response_error_details(response, limit=error_body_limit))
 
     return response_error_details
 
@@ -383,6 +364,7 @@ def handle_json_decode_error(
     response_extra=None,
     request_label=None,
     request_curl=None,
+    error_body_limit=ERROR_BODY_LIMIT,
 ):
     """Handle JSON Decode Error
 
@@ -392,6 +374,7 @@ def handle_json_decode_error(
         response_extra:
         request_label:
         request_curl:
+        error_body_limit: (optional) Maximum bytes of body captured.
 
     Returns:
 
@@ -402,43 +385,20 @@ def handle_json_decode_error(
     if request_label:
         response_extra.update({'request_label': request_label})
 
-    if hasattr(response, 'text') and \
-            response.text and \
-            len(response.text) > 0:
-        response_details = response.text
-        response_details_source = 'text'
-        response_content_length = len(response_details)
-
-        if response_details.startswith('<html'):
-            response_details_source = 'html'
-            soup_html = bs4.BeautifulSoup(response_details, "html.parser")
-            # kill all script and style elements
-            for script in soup_html(["script", "style"]):
-                script.extract()  # rip it out
-            text_html = soup_html.get_text()
-            lines_html = [line for line in text_html.split('\n') if line.strip() != '']
-            lines_html = [line.strip(' ') for line in lines_html]
-            response_details = lines_html
-
-        elif response_details.startswith('<?xml'):
-            response_details_source = 'xml'
-            response_details = json.dumps(xmltodict.parse(response_details))
-        else:
-            pprint(response_details)
+    if response is not None:
+        response_extra.update(capture_response_error_details(response, limit=error_body_limit))
 
-        response_extra.update({
-            'response_details': response_details,
-            'response_details_source': response_details_source,
-            'response_content_length': response_content_length,
-            'error_exception': base_class_name(response_decode_ex),
-            'error_details': get_exception_message(response_decode_ex)
-        })
+    response_extra.update({
+        'error_exception': base_class_name(response_decode_ex),
+        'error_details': get_exception_message(response_decode_ex)
+    })
 
     log.error("Validate JSON Response: Failed: Invalid", extra=response_extra)
 
     raise RequestsFortifiedModuleError(
         error_message="Validate JSON Response: Failed: Invalid",
         errors=response_decode_ex,
+        error_details=_error_details_truncated(response_extra),
         error_request_curl=request_curl,
         error_code=RequestsFortifiedErrorCodes.REQ_ERR_SOFTWARE
     )
@@ -2,19 +2,25 @@
 # -*- coding: utf-8 -*-
 # @namespace pyfortified_requests
 
+import http.client as http_client
 import logging
+import socket
+
 import requests
+import urllib3
 
 from pyfortified_requests import (
     __python_required_version__,
 )
 from pyfortified_requests.errors import (
     get_exception_message,
-    RequestsFortifiedErrorCodes,
 )
 from pyfortified_requests.exceptions.custom import (
     RequestsFortifiedBaseError,
 )
+from pyfortified_requests.support.stream_watchdog import (
+    StreamIdleTimeout,
+)
 from pyfortified_requests.support.utils import (
     base_class_name,
     python_check_version,
@@ -23,6 +29,123 @@ from pyfortified_requests.support.utils import (
 log = logging.getLogger(__name__)
 python_check_version(__python_required_version__)
 
+EXCEPTION_CHAIN_MAX_DEPTH = 16
+
+# Exception type to retry decision, matched by the exception chain,
+# from root up, see :func:`classify_retry_exception`.
+RETRY_EXCEPTIONS = {
+    http_client.RemoteDisconnected: True,
+    ConnectionResetError: True,
+    StreamIdleTimeout: True,
+}
+
+# Failures before the request was sent: connection not established.
+CONNECT_PHASE_EXCEPTIONS = (
+    requests.exceptions.ConnectTimeout,
+    urllib3.exceptions.ConnectTimeoutError,
+    urllib3.exceptions.NewConnectionError,
+    ConnectionRefusedError,
+    socket.gaierror,
+)
+
+
+def register_retry_exception(excp_type, retry=True):
+    """Register retry decision of exception type, and its subclasses.
+
+    Args:
+        excp_type: Exception class.
+        retry: (optional) True to retry, False to never retry,
+            None to remove registration.
+    """
+    if retry is None:
+        RETRY_EXCEPTIONS.pop(excp_type, None)
+    else:
+        RETRY_EXCEPTIONS[excp_type] = retry
+
+
+def _exception_links(excp):
+    """Exceptions wrapped by exception, most specific first.
+    """
+    if isinstance(excp, RequestsFortifiedBaseError):
+        yield excp.errors
+    # urllib3 MaxRetryError, NewConnectionError
+    yield getattr(excp, 'reason', None)
+    # requests ConnectionError(MaxRetryError), urllib3 ProtocolError('...', RemoteDisconnected)
+    for arg in reversed(excp.args):
+        yield arg
+    yield excp.__cause__
+    yield excp.__context__
+
+
+def exception_chain(excp, max_depth=EXCEPTION_CHAIN_MAX_DEPTH):
+    """Exception followed by the exceptions it wraps, down to its root.
+
+    Follows 'errors' of RequestsFortifiedBaseError, urllib3 'reason',
+    exceptions in 'args', then '__cause__' and '__context__'.
+
+    Args:
+        excp: Exception
+        max_depth: (optional) Maximum length of chain.
+
+    Returns:
+        List of exceptions; last is root.
+    """
+    chain = [excp]
+    seen = {id(excp)}
+    while len(chain) < max_depth:
+        for link in _exception_links(chain[-1]):
+            if isinstance(link, BaseException) and id(link) not in seen:
+                chain.append(link)
+                seen.add(id(link))
+                break
+        else:
+            break
+    return chain
+
+
+def classify_retry_exception(excp, retry_exceptions=None):
+    """Retry decision of exception, by type of the exceptions in its chain.
+
+    The deepest exception of registered type, or subclass, decides.
+
+    Args:
+        excp: Exception
+        retry_exceptions: (optional) Dictionary of exception type to retry
+            decision, default 'RETRY_EXCEPTIONS'.
+
+    Returns:
+        Tuple of retry decision, and exception deciding it (root exception
+        if none is registered).
+    """
+    retry_exceptions = RETRY_EXCEPTIONS if retry_exceptions is None else retry_exceptions
+    chain = exception_chain(excp)
+
+    for chain_excp in reversed(chain):
+        for excp_type in type(chain_excp).__mro__:
+            if excp_type in retry_exceptions:
+                return retry_exceptions[excp_type], chain_excp
+
+    return False, chain[-1]
+
+
+def is_retry_exception(excp):
+    """Is exception a retry candidate, see :func:`classify_retry_exception`.
+    """
+    return classify_retry_exception(excp)[0]
+
+
+def is_connect_phase_exception(excp):
+    """Did exception occur before the request was sent, while connecting,
+    so sending it again cannot repeat its effect.
+
+    Args:
+        excp: Exception
+
+    Returns:
+        True if its chain holds one of 'CONNECT_PHASE_EXCEPTIONS'.
+    """
+    return any(isinstance(chain_excp, CONNECT_PHASE_EXCEPTIONS) for chain_excp in exception_chain(excp))
+
 
 def mv_request_retry_excps_func(excp, request_label=None):
     """Request Retry Exception Function
@@ -31,56 +154,23 @@ def mv_request_retry_excps_func(excp, request_label=None):
     :param request_label:
     :return:
     """
-    _request_label = 'Request Upload Exception'
-    request_label = '{}: {}'.format(request_label, _request_label) if request_label is not None else _request_label
+    is_retry, decided_excp = classify_retry_exception(excp)
 
-    error_exception = base_class_name(excp)
-    error_details = get_exception_message(excp)
+    if log.isEnabledFor(logging.DEBUG):
+        _request_label = 'Request Upload Exception'
+        request_label = '{}: {}'.format(request_label, _request_label) if request_label is not None else _request_label
 
-    if isinstance(excp, RequestsFortifiedBaseError):
-        log.debug(
-            "{0}: Expected".format(request_label),
-            extra={
-                'error_exception': error_exception,
-                'error_details': error_details,
-            }
-        )
-    else:
         log.debug(
-            "{0}: Unexpected".format(request_label),
+            "{0}: {1}: {2}".format(
+                request_label,
+                "Expected" if isinstance(excp, RequestsFortifiedBaseError) else "Unexpected",
+                "Retry" if is_retry else "No Retry",
+            ),
             extra={
-                'error_exception': error_exception,
-                'error_details': error_details,
+                'error_exception': base_class_name(excp),
+                'error_exception_root': base_class_name(decided_excp),
+                'error_details': get_exception_message(excp),
             }
         )
 
-    if isinstance(excp, requests.exceptions.ConnectionError):
-        if error_details.find('RemoteDisconnected') >= 0 or error_details.find('ConnectionResetError') >= 0:
-            log.debug(
-                "{0}: Retry".format(request_label),
-                extra={
-                    'error_exception': error_exception,
-                    'error_details': error_details,
-                }
-            )
-            return True
-
-    if isinstance(excp, RequestsFortifiedBaseError) and excp.error_code == RequestsFortifiedErrorCodes.REQ_ERR_REQUEST_CONNECT:
-        if error_details.find('RemoteDisconnected') >= 0 or error_details.find('ConnectionResetError') >= 0:
-            log.debug(
-                "{0}: Retry".format(request_label),
-                extra={
-                    'error_exception': error_exception,
-                    'error_details': error_details,
-                }
-            )
-            return True
-
-    log.debug(
-        "{0}: No Retry".format(request_label),
-        extra={
-            'error_exception': error_exception,
-            'error_details': error_details,
-        }
-    )
-    return False
+    return is_retry
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import io
+import logging
+import time
+from collections import deque
+
+import requests
+from requests.utils import stream_decode_response_unicode
+from urllib3.exceptions import (
+    DecodeError,
+    ProtocolError,
+    ReadTimeoutError,
+    SSLError,
+)
+
+log = logging.getLogger(__name__)
+
+# Bytes per second below which a stream is idle.
+STREAM_IDLE_MIN_RATE = 1
+
+# Throughput samples kept per idle timeout.
+STREAM_WATCHDOG_SAMPLES = 8
+
+
+class StreamIdleTimeout(requests.exceptions.ReadTimeout):
+    """Stream throughput stayed below minimum rate for idle timeout."""
+
+
+def _iter_raw_chunks(response, chunk_size):
+    """Yield decoded chunks of streamed response as soon as any bytes arrive.
+
+    urllib3 'read1' returns what is available, up to 'chunk_size', instead
+    of blocking until 'chunk_size' bytes are read; without it (urllib3 1.x),
+    chunks of 'chunk_size' are read. Errors are raised as by
+    'requests.Response.iter_content'.
+    """
+    raw = response.raw
+    read = getattr(raw, 'read1', None) or raw.read
+    try:
+        while True:
+            chunk = read(chunk_size, decode_content=True)
+            if not chunk:
+                break
+            yield chunk
+    except ProtocolError as ex:
+        raise requests.exceptions.ChunkedEncodingError(ex)
+    except DecodeError as ex:
+        raise requests.exceptions.ContentDecodingError(ex)
+    except ReadTimeoutError as ex:
+        raise requests.exceptions.ConnectionError(ex)
+    except SSLError as ex:
+        raise requests.exceptions.SSLError(ex)
+
+
+def iter_response_chunks(response, chunk_size, decode_unicode=False, watchdog=None, deadline=None, request_label=None):
+    """Yield chunks of streamed response, as 'requests.Response.iter_content'
+    does, checking 'watchdog' throughput and 'deadline' after each read.
+
+    Raises:
+        StreamIdleTimeout
+        RequestsFortifiedDeadlineExceededError
+    """
+    chunks = _iter_raw_chunks(response, chunk_size)
+    if decode_unicode:
+        chunks = stream_decode_response_unicode(chunks, response)
+    for chunk in chunks:
+        yield chunk
+        if watchdog is not None:
+            watchdog.update(len(chunk))
+        if deadline is not None:
+            deadline.check_response(response, request_label)
+
+
+class ResponseRawReader(io.RawIOBase):
+    """Decoded raw stream of response, for 'io.BufferedReader', checking
+    'deadline' before each read.
+
+    Reads return what is available, as :func:`iter_response_chunks` does,
+    so the deadline is checked while a server trickles bytes.
+    """
+
+    def __init__(self, response, deadline=None, request_label=None):
+        self.response = response
+        self.deadline = deadline
+        self.request_label = request_label
+
+        raw = response.raw
+        self.__read = getattr(raw, 'read1', None) or raw.read
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self.deadline is not None:
+            self.deadline.check_response(self.response, self.request_label)
+        chunk = self.__read(len(buffer), decode_content=True)
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+class StreamWatchdog(object):
+    """Abort streamed response whose throughput stays below 'min_rate'
+    bytes per second for 'idle_timeout' seconds.
+
+    A read timeout only fires if no byte arrives at all; a server
+    trickling bytes keeps each read alive. Chunks are read as soon as any
+    bytes arrive, and throughput is checked after each read; once stalled,
+    the response is closed and :class:`StreamIdleTimeout`, a retried read
+    timeout, is raised. The download is then restarted from its start,
+    not resumed.
+    """
+
+    def __init__(self, response, idle_timeout, min_rate=STREAM_IDLE_MIN_RATE, request_label=None):
+        self.response = response
+        self.idle_timeout = idle_timeout
+        self.min_rate = min_rate
+        self.request_label = request_label or 'Stream Watchdog'
+
+        self.bytes_read = 0
+        self.stalled = False
+
+        self.__interval = idle_timeout / float(STREAM_WATCHDOG_SAMPLES)
+        self.__samples = deque([(time.monotonic(), 0)])
+
+    @classmethod
+    def from_request_retry(cls, response, request_retry, request_label=None):
+        """Watchdog of request_retry 'idle_timeout' and 'idle_min_rate'.
+
+        Returns:
+            StreamWatchdog, or None if 'idle_timeout' is not provided.
+        """
+        if not request_retry or not request_retry.get('idle_timeout'):
+            return None
+        return cls(
+            response,
+            request_retry['idle_timeout'],
+            min_rate=request_retry.get('idle_min_rate', STREAM_IDLE_MIN_RATE),
+            request_label=request_label,
+        )
+
+    def update(self, chunk_bytes):
+        """Record bytes read.
+
+        Raises:
+            StreamIdleTimeout: Throughput over last 'idle_timeout' seconds
+                is below 'min_rate'.
+        """
+        now = time.monotonic()
+        self.bytes_read += chunk_bytes
+
+        samples = self.__samples
+        if now - samples[-1][0] >= self.__interval:
+            samples.append((now, self.bytes_read))
+        # Oldest sample kept is at least 'idle_timeout' old.
+        while len(samples) > 1 and now - samples[1][0] >= self.idle_timeout:
+            samples.popleft()
+
+        time_first, bytes_first = samples[0]
+        if now - time_first >= self.idle_timeout and \
+                self.bytes_read - bytes_first < self.min_rate * (now - time_first):
+            self.abort()
+
+    def abort(self):
+        """Close response and raise.
+
+        Raises:
+            StreamIdleTimeout
+        """
+        self.stalled = True
+        log.warning(
+            "{0}: Idle: Abort: Restart".format(self.request_label),
+            extra={
+                'idle_timeout': self.idle_timeout,
+                'idle_min_rate': self.min_rate,
+                'bytes_read': self.bytes_read,
+            }
+        )
+        self.response.close()
+        raise StreamIdleTimeout(
+            "{0}: Idle: Throughput below {1} bytes/sec for {2} secs".format(
+                self.request_label, self.min_rate, self.idle_timeout
+            ),
+            response=self.response,
+        )
+
+    def iter_chunks(self, chunk_size, decode_unicode=False):
+        """Yield chunks of response, as 'requests.Response.iter_content' does,
+        checking throughput after each read.
+
+        Raises:
+            StreamIdleTimeout
+        """
+        return iter_response_chunks(self.response, chunk_size, decode_unicode=decode_unicode, watchdog=self)
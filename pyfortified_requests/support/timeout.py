@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+# Types of timeout accepted by requests: seconds, or (connect, read) tuple.
+REQUEST_TIMEOUT_TYPES = (int, float, tuple)
+
+
+def request_timeout(timeout=None, connect_timeout=None, read_timeout=None):
+    """Timeout passed to requests.
+
+    Args:
+        timeout: (optional) Seconds to connect and to read, or (connect, read) tuple.
+        connect_timeout: (optional) Seconds to connect, instead of 'timeout'.
+        read_timeout: (optional) Seconds between bytes read, instead of 'timeout'.
+
+    Returns:
+        'timeout' if neither 'connect_timeout' nor 'read_timeout' is provided,
+        else (connect, read) tuple.
+    """
+    if connect_timeout is None and read_timeout is None:
+        return timeout
+
+    if isinstance(timeout, tuple):
+        timeout_connect, timeout_read = timeout
+    else:
+        timeout_connect = timeout_read = timeout
+
+    return (
+        connect_timeout if connect_timeout is not None else timeout_connect,
+        read_timeout if read_timeout is not None else timeout_read,
+    )
+
+
+def timeout_min(timeout, seconds):
+    """Timeout shrunk to at most 'seconds', each of connect and read if a tuple.
+
+    Args:
+        timeout: Seconds, (connect, read) tuple, or None for no timeout.
+        seconds: Seconds
+
+    Returns:
+        Seconds, or (connect, read) tuple.
+    """
+    if isinstance(timeout, tuple):
+        return tuple(seconds if value is None else min(value, seconds) for value in timeout)
+    return seconds if timeout is None else min(timeout, seconds)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import base64
+import hashlib
+import io
+
+from .lazy_import import optional_import
+
+UPLOAD_CHECKSUM_MD5 = 'md5'
+UPLOAD_CHECKSUM_SHA256 = 'sha256'
+UPLOAD_CHECKSUM_CRC32C = 'crc32c'
+
+UPLOAD_CHECKSUMS = (UPLOAD_CHECKSUM_MD5, UPLOAD_CHECKSUM_SHA256, UPLOAD_CHECKSUM_CRC32C)
+
+# Request headers carrying base64 digest of the request body.
+UPLOAD_CHECKSUM_HEADERS = {
+    UPLOAD_CHECKSUM_MD5: 'Content-MD5',
+    UPLOAD_CHECKSUM_SHA256: 'x-amz-checksum-sha256',
+    UPLOAD_CHECKSUM_CRC32C: 'x-amz-checksum-crc32c',
+}
+
+
+def _crc32c_table():
+    table = []
+    for index in range(256):
+        crc = index
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x82F63B78 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC32C_TABLE = None
+
+
+class _Crc32c(object):
+    """CRC-32C (Castagnoli) with 'hashlib' interface.
+
+    Uses the optional 'crc32c' package (hardware accelerated) when installed,
+    else a table driven implementation, correct but slow.
+    """
+
+    name = UPLOAD_CHECKSUM_CRC32C
+    digest_size = 4
+
+    def __init__(self):
+        self._crc = 0
+        self._crc32c = optional_import('crc32c')
+
+    def update(self, data):
+        if self._crc32c is not None:
+            self._crc = self._crc32c.crc32c(data, self._crc)
+            return
+
+        global _CRC32C_TABLE
+        if _CRC32C_TABLE is None:
+            _CRC32C_TABLE = _crc32c_table()
+        table = _CRC32C_TABLE
+
+        crc = self._crc ^ 0xFFFFFFFF
+        for byte in bytes(data):
+            crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+        self._crc = crc ^ 0xFFFFFFFF
+
+    def digest(self):
+        return self._crc.to_bytes(4, 'big')
+
+    def hexdigest(self):
+        return self.digest().hex()
+
+
+def _checksum_hash(algorithm):
+    if algorithm == UPLOAD_CHECKSUM_MD5:
+        return hashlib.md5()
+    if algorithm == UPLOAD_CHECKSUM_SHA256:
+        return hashlib.sha256()
+    if algorithm == UPLOAD_CHECKSUM_CRC32C:
+        return _Crc32c()
+    raise ValueError("Unexpected upload checksum: '{0}'".format(algorithm))
+
+
+class UploadChecksums(object):
+    """Checksums of upload body, updated incrementally as bytes are sent.
+
+    'digests' gives base64 digests, as sent in checksum headers;
+    'hexdigests' gives hex digests, as in MD5 ETags.
+    """
+
+    def __init__(self, algorithms=(UPLOAD_CHECKSUM_MD5,)):
+        """
+        Args:
+            algorithms: (optional) Iterable of 'md5', 'sha256' and 'crc32c'.
+        """
+        if isinstance(algorithms, str):
+            algorithms = (algorithms,)
+        self.algorithms = tuple(algorithms)
+        self._hashes = None
+        self.reset()
+
+    def reset(self):
+        """Restart checksums, e.g. when body is sent again.
+        """
+        self._hashes = {algorithm: _checksum_hash(algorithm) for algorithm in self.algorithms}
+        self.size = 0
+
+    def update(self, data):
+        for checksum_hash in self._hashes.values():
+            checksum_hash.update(data)
+        self.size += len(data)
+
+    @property
+    def digests(self):
+        return {
+            algorithm: base64.b64encode(checksum_hash.digest()).decode('ascii')
+            for algorithm, checksum_hash in self._hashes.items()
+        }
+
+    @property
+    def hexdigests(self):
+        return {algorithm: checksum_hash.hexdigest() for algorithm, checksum_hash in self._hashes.items()}
+
+    def headers(self):
+        """Checksum request headers, see 'UPLOAD_CHECKSUM_HEADERS'.
+        """
+        return {UPLOAD_CHECKSUM_HEADERS[algorithm]: digest for algorithm, digest in self.digests.items()}
+
+    def verify_etag(self, etag):
+        """Compare ETag with MD5 of body, if ETag has the form of an MD5 hex digest.
+
+        ETags of multipart or encrypted objects are not MD5 of the body,
+        so they are not compared.
+
+        Returns:
+            True if matching, False if not matching, None if not comparable.
+        """
+        if not etag or UPLOAD_CHECKSUM_MD5 not in self._hashes:
+            return None
+        etag_hex = etag.strip()
+        if etag_hex.startswith('W/'):
+            return None
+        etag_hex = etag_hex.strip('"').lower()
+        if len(etag_hex) != 32 or any(c not in '0123456789abcdef' for c in etag_hex):
+            return None
+        return etag_hex == self._hashes[UPLOAD_CHECKSUM_MD5].hexdigest()
+
+
+class ChecksumReader(io.RawIOBase):
+    """Binary file-like wrapper updating :class:`UploadChecksums` with bytes read.
+
+    Passed as request body, so a file is hashed while it is sent, and read
+    only once. Seeking back to the start restarts the checksums.
+    """
+
+    def __init__(self, file_obj, checksums):
+        super(ChecksumReader, self).__init__()
+        self._file_obj = file_obj
+        self.checksums = checksums
+
+    @property
+    def mode(self):
+        return getattr(self._file_obj, 'mode', 'rb')
+
+    @property
+    def name(self):
+        return getattr(self._file_obj, 'name', None)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return self._file_obj.seekable()
+
+    def fileno(self):
+        return self._file_obj.fileno()
+
+    def tell(self):
+        return self._file_obj.tell()
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        position = self._file_obj.seek(offset, whence)
+        if position == 0:
+            self.checksums.reset()
+        return position
+
+    def read(self, size=-1):
+        data = self._file_obj.read(size)
+        if data:
+            self.checksums.update(data)
+        return data
+
+    def readinto(self, b):
+        size = self._file_obj.readinto(b)
+        if size:
+            self.checksums.update(memoryview(b)[:size])
+        return size
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @namespace pyfortified_requests
+
+import zlib
+
+from .lazy_import import optional_import
+from .request_body import _is_seekable
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+UPLOAD_COMPRESSION_GZIP = 'gzip'
+UPLOAD_COMPRESSION_ZSTD = 'zstd'
+
+UPLOAD_COMPRESSIONS = (UPLOAD_COMPRESSION_GZIP, UPLOAD_COMPRESSION_ZSTD)
+
+
+class StreamCompressor(object):
+    """Incremental gzip or zstd compression, producing a single stream.
+
+    'compression' is also the matching 'Content-Encoding' header value.
+    zstd requires the optional 'zstandard' package.
+    """
+
+    def __init__(self, compression=UPLOAD_COMPRESSION_GZIP, level=None):
+        """
+        Args:
+            compression: (optional) 'gzip' (default) or 'zstd'.
+            level: (optional) Compression level, default of compression.
+        """
+        if compression == UPLOAD_COMPRESSION_GZIP:
+            self._compressor = zlib.compressobj(
+                zlib.Z_DEFAULT_COMPRESSION if level is None else level,
+                zlib.DEFLATED,
+                16 + zlib.MAX_WBITS  # gzip container
+            )
+        elif compression == UPLOAD_COMPRESSION_ZSTD:
+            zstandard = optional_import('zstandard')
+            if zstandard is None:
+                raise ValueError("Upload compression 'zstd' requires package 'zstandard'")
+            self._compressor = zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+        else:
+            raise ValueError("Unexpected upload compression: '{0}'".format(compression))
+
+        self.compression = compression
+        self.level = level
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def compress(self, data):
+        self.bytes_in += len(data)
+        data = self._compressor.compress(data)
+        self.bytes_out += len(data)
+        return data
+
+    def flush(self):
+        data = self._compressor.flush()
+        self.bytes_out += len(data)
+        return data
+
+
+class UploadChunks(object):
+    """Request body of unknown size, read from source in chunks of 'chunk_size'.
+
+    Being iterable without a length, it is sent by requests using chunked
+    transfer encoding. Small pieces are coalesced and large pieces split,
+    so memory is bounded by 'chunk_size' plus one piece of the source.
+
+    With 'compression', chunks are compressed as they are read; then
+    'bytes_read' counts source bytes and 'bytes_sent' compressed bytes.
+
+    With 'checksums', an :class:`UploadChecksums`, the sent bytes are hashed
+    as they are yielded.
+
+    If source is bytes, str, or a seekable file-like object, the body is
+    'rewindable': each iteration starts over from the source, so retries
+    send it again without a replay buffer.
+    """
+
+    def __init__(
+        self,
+        source,
+        chunk_size=UPLOAD_CHUNK_SIZE,
+        encoding='utf-8',
+        compression=None,
+        compression_level=None,
+        checksums=None,
+    ):
+        """
+        Args:
+            source: bytes, str, binary or text file-like object providing
+                'read(size)', or iterable/generator of bytes or str.
+            chunk_size: (optional) Bytes per chunk read from source.
+            encoding: (optional) Encoding of str pieces.
+            compression: (optional) 'gzip' or 'zstd', see :class:`StreamCompressor`.
+            compression_level: (optional) Compression level.
+            checksums: (optional) :class:`UploadChecksums` of sent bytes.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Unexpected upload chunk size: '{0}'".format(chunk_size))
+
+        self.source = source
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        self.compression = compression
+        self.compression_level = compression_level
+        self.checksums = checksums
+        self.bytes_read = 0
+        self.bytes_sent = 0
+        self.chunk_count = 0
+
+        self._source_position = None
+        if hasattr(source, 'read') and _is_seekable(source):
+            self._source_position = source.tell()
+
+        # Fail early upon unsupported compression, before request is sent.
+        if compression is not None:
+            StreamCompressor(compression, compression_level)
+
+    @property
+    def rewindable(self):
+        return self._source_position is not None or \
+            isinstance(self.source, (bytes, bytearray, memoryview, str))
+
+    def _rewind(self):
+        if self._source_position is not None:
+            self.source.seek(self._source_position)
+        self.bytes_read = 0
+        self.bytes_sent = 0
+        self.chunk_count = 0
+        if self.checksums is not None:
+            self.checksums.reset()
+
+    @property
+    def compression_ratio(self):
+        return self.bytes_sent / self.bytes_read if self.bytes_read else None
+
+    def _iter_source(self):
+        source = self.source
+        if isinstance(source, (bytes, bytearray, memoryview, str)):
+            yield source
+        elif hasattr(source, 'read'):
+            while True:
+                piece = source.read(self.chunk_size)
+                if not piece:
+                    break
+                yield piece
+        else:
+            for piece in source:
+                yield piece
+
+    def _chunk(self, chunk):
+        self.bytes_read += len(chunk)
+        return chunk
+
+    def _sent(self, chunk):
+        self.bytes_sent += len(chunk)
+        self.chunk_count += 1
+        if self.checksums is not None:
+            self.checksums.update(chunk)
+        return chunk
+
+    def __iter__(self):
+        if self.rewindable:
+            self._rewind()
+
+        compressor = None
+        if self.compression is not None:
+            compressor = StreamCompressor(self.compression, self.compression_level)
+
+        for chunk in self._iter_chunks():
+            if compressor is not None:
+                chunk = compressor.compress(chunk)
+                if not chunk:
+                    continue
+            yield self._sent(chunk)
+
+        if compressor is not None:
+            chunk = compressor.flush()
+            if chunk:
+                yield self._sent(chunk)
+
+    def _iter_chunks(self):
+        chunk_size = self.chunk_size
+        buffer = bytearray()
+
+        for piece in self._iter_source():
+            if isinstance(piece, str):
+                piece = piece.encode(self.encoding)
+            if not piece:
+                continue
+
+            piece = memoryview(piece)
+            offset = 0
+            if buffer:
+                offset = chunk_size - len(buffer)
+                buffer += piece[:offset]
+                if len(buffer) < chunk_size:
+                    continue
+                yield self._chunk(bytes(buffer))
+                buffer = bytearray()
+
+            while len(piece) - offset >= chunk_size:
+                yield self._chunk(bytes(piece[offset:offset + chunk_size]))
+                offset += chunk_size
+
+            buffer += piece[offset:]
+
+        if buffer:
+            yield self._chunk(bytes(buffer))
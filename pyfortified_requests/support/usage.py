@@ -3,13 +3,20 @@
 # @namespace pyfortified_requests
 
 import os
-import psutil
+from pyfortified_requests.support.lazy_import import optional_import
 from pyfortified_requests.support.utils import bytes_to_human
 from pyfortified_requests.support.constants import IRONIO_PARTITION
 
 
+def _psutil():
+    psutil = optional_import('psutil')
+    if psutil is None:
+        raise ImportError("Environment usage requires package 'psutil'")
+    return psutil
+
+
 def mem_usage():
-    virt = psutil.virtual_memory()
+    virt = _psutil().virtual_memory()
     return {
         'Mem': {
             'total': bytes_to_human(virt.total),
@@ -29,7 +36,7 @@ def disk_usage(dir=None):
     if not os.path.exists(dir):
         dir = '/'
 
-    usage = psutil.disk_usage(dir)
+    usage = _psutil().disk_usage(dir)
     return {
         'Disk:': {
             'path': dir,
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import codecs
+import gzip
+import io
+
+import pytest
+
+from pyfortified_requests.support.bom_encoding import (
+    BomStream,
+    bom_text_encoding,
+    get_bom_offset,
+)
+
+TEXT = 'id,name\n' + ''.join('{0},né €\n'.format(i) for i in range(1000))
+
+
+class _ShortReads(io.RawIOBase):
+    """Binary stream returning at most one byte per sized read."""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self._data.readinto(memoryview(b)[:1])
+
+
+def _mojibake_bom(code_page):
+    return codecs.BOM_UTF8.decode(code_page).encode('utf-8')
+
+
+@pytest.mark.parametrize('bom, codec, bom_encoding, encoding', [
+    (codecs.BOM_UTF8, 'utf-8', 'UTF-8', 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le', 'UTF-16LE', 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be', 'UTF-16BE', 'utf-16-be'),
+    (codecs.BOM_UTF32_LE, 'utf-32-le', 'UTF-32LE', 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be', 'UTF-32BE', 'utf-32-be'),
+    (_mojibake_bom('cp1252'), 'utf-8', 'cp1252', 'utf-8'),
+    (_mojibake_bom('cp1251'), 'utf-8', 'cp1251', 'utf-8'),
+])
+@pytest.mark.parametrize('short_reads', [False, True])
+def test_bom_stream_strips_bom(bom, codec, bom_encoding, encoding, short_reads):
+    data = bom + TEXT.encode(codec)
+    stream = _ShortReads(data) if short_reads else io.BytesIO(data)
+
+    bom_stream = BomStream(stream)
+
+    assert bom_stream.bom_encoding == bom_encoding
+    assert bom_stream.bom_len == len(bom)
+    assert bom_stream.encoding == encoding
+    assert bom_stream.text_reader(newline='').read() == TEXT
+
+
+def test_bom_stream_no_bom():
+    bom_stream = BomStream(io.BytesIO(TEXT.encode('latin-1', 'replace')), encoding='latin-1')
+
+    assert (bom_stream.bom_encoding, bom_stream.bom_len, bom_stream.encoding) == ('ANSI', 0, 'latin-1')
+    assert bom_stream.read() == TEXT.encode('latin-1', 'replace')
+
+
+@pytest.mark.parametrize('data', [b'', b'ab'])
+def test_bom_stream_shorter_than_sniff(data):
+    bom_stream = BomStream(io.BytesIO(data))
+
+    assert bom_stream.bom_len == 0
+    assert bom_stream.read() == data
+
+
+def test_bom_stream_compressed_signature_kept():
+    data = gzip.compress(TEXT.encode('utf-8'))
+
+    bom_stream = BomStream(io.BytesIO(data))
+
+    assert bom_stream.bom_encoding == 'gzip'
+    assert bom_stream.bom_len == 0
+    assert bom_stream.encoding is None
+    assert bom_stream.read() == data
+
+
+def test_bom_stream_sized_reads():
+    data = TEXT.encode('utf-8')
+    bom_stream = BomStream(io.BytesIO(codecs.BOM_UTF8 + data))
+
+    chunks = []
+    for size in iter(lambda: 4, None):
+        chunk = bom_stream.read(size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+
+    assert b''.join(chunks) == data
+    assert all(len(chunk) <= 4 for chunk in chunks)
+
+
+def test_bom_stream_readinto():
+    bom_stream = BomStream(io.BytesIO(codecs.BOM_UTF8 + b'abcdefgh'))
+    buffer = bytearray(5)
+
+    assert bom_stream.readinto(buffer) == 3
+    assert buffer[:3] == b'abc'
+    assert bom_stream.readinto(buffer) == 5
+    assert bytes(buffer) == b'defgh'
+
+
+def test_bom_stream_incremental_decoder():
+    data = codecs.BOM_UTF16_LE + TEXT.encode('utf-16-le')
+    bom_stream = BomStream(io.BytesIO(data))
+    decoder = bom_stream.incremental_decoder()
+
+    text = ''.join(decoder.decode(bom_stream.read(7)) for _ in range(len(data) // 7 + 1))
+
+    assert text + decoder.decode(b'', final=True) == TEXT
+
+
+@pytest.mark.parametrize('header, expected', [
+    (codecs.BOM_UTF8 + b'abc', ('UTF-8', 3)),
+    (b'\x1f\x8b\x08\x00\x00\x00', ('gzip', 0)),
+    (b'PK\x03\x04\x14\x00', ('pkzip', 0)),
+    (b'id,name', ('ANSI', 0)),
+])
+def test_get_bom_offset(header, expected):
+    assert get_bom_offset(header) == expected
+
+
+@pytest.mark.parametrize('bom_enc, encoding, expected', [
+    ('UTF-8', None, 'utf-8'),
+    ('UTF-16LE', 'latin-1', 'utf-16-le'),
+    ('ANSI', 'latin-1', 'latin-1'),
+    ('gzip', None, None),
+])
+def test_bom_text_encoding(bom_enc, encoding, expected):
+    assert bom_text_encoding(bom_enc, encoding) == expected
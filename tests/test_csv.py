@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import csv
+import io
+
+import pytest
+
+from pyfortified_requests.support.response.csv import (
+    CSV_OUTPUT_COLUMNS,
+    CSV_OUTPUT_TUPLES,
+    csv_row_dict,
+    csv_rows_output,
+)
+
+CSV_HEADER = ['id', 'name', 'note']
+
+# Short and long rows, quoted delimiters, quotes and newlines.
+CSV_TEXT = (
+    'id,name,note\r\n'
+    + ''.join(
+        '{0},"name, {0}","say ""hi""\n{0}"\r\n'.format(i) if i % 5 else '{0},short\r\n{0},long,x,y,z\r\n'.format(i)
+        for i in range(500)
+    )
+)
+
+
+def _dict_reader_rows(text):
+    return list(csv.DictReader(io.StringIO(text, newline='')))
+
+
+def _csv_rows(text):
+    rows = csv.reader(io.StringIO(text, newline=''))
+    next(rows)
+    return rows
+
+
+@pytest.mark.parametrize('row, expected', [
+    (['1', 'a', 'b'], {'id': '1', 'name': 'a', 'note': 'b'}),
+    (['1'], {'id': '1', 'name': None, 'note': None}),
+    (['1', 'a', 'b', 'c', 'd'], {'id': '1', 'name': 'a', 'note': 'b', None: ['c', 'd']}),
+])
+def test_csv_row_dict(row, expected):
+    assert csv_row_dict(CSV_HEADER, row) == expected
+
+
+def test_csv_rows_output_dict_as_dict_reader():
+    assert list(csv_rows_output(_csv_rows(CSV_TEXT), CSV_HEADER)) == _dict_reader_rows(CSV_TEXT)
+
+
+@pytest.mark.parametrize('csv_output', [CSV_OUTPUT_TUPLES, CSV_OUTPUT_COLUMNS])
+def test_csv_rows_output_batches_as_dict_reader(csv_output):
+    batches = list(csv_rows_output(_csv_rows(CSV_TEXT), CSV_HEADER, csv_output=csv_output, csv_batch_size=64))
+
+    assert [len(batch) for batch in batches] == [64] * 9 + [24]
+    assert [row for batch in batches for row in batch.to_dicts()] == _dict_reader_rows(CSV_TEXT)
+    assert sum(batch.rows_short for batch in batches) == 100
+    assert sum(batch.rows_long for batch in batches) == 100
+    assert all(len(column) == len(batches[0]) for column in batches[0].columns.values())
+
+
+def test_csv_rows_output_unexpected_output():
+    with pytest.raises(ValueError):
+        list(csv_rows_output([], CSV_HEADER, csv_output='xml'))
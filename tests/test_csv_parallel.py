@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import csv
+import io
+
+import pytest
+
+from pyfortified_requests.support.response.csv import (
+    CSV_OUTPUT_DICT,
+    CSV_OUTPUT_TUPLES,
+)
+from pyfortified_requests.support.response.csv_parallel import (
+    csv_parse_file_parallel,
+    csv_split_ranges,
+    csv_split_supported,
+)
+
+CSV_HEADER = ['id', 'name', 'note']
+
+# Short and long rows, quoted delimiters, quotes and newlines.
+CSV_TEXT = (
+    'id,name,note\r\n'
+    + ''.join(
+        '{0},"name, {0}","say ""hi""\n{0}"\r\n'.format(i) if i % 5 else '{0},short\r\n{0},long,x,y,z\r\n'.format(i)
+        for i in range(500)
+    )
+)
+
+
+def _dict_reader_rows(text):
+    return list(csv.DictReader(io.StringIO(text, newline='')))
+
+
+def _csv_rows(text):
+    rows = csv.reader(io.StringIO(text, newline=''))
+    next(rows)
+    return rows
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    file_path = tmp_path / 'test.csv'
+    file_path.write_bytes(CSV_TEXT.encode('utf-8'))
+    return str(file_path)
+
+
+@pytest.mark.parametrize('range_size', [1, 10, 100, 1000, 1 << 20])
+def test_csv_split_ranges_on_record_boundaries(csv_file, range_size):
+    start = len('id,name,note\r\n')
+
+    ranges = csv_split_ranges(csv_file, start=start, range_size=range_size)
+
+    assert ranges[0][0] == start
+    assert ranges[-1][1] == len(CSV_TEXT)
+    assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+    rows = []
+    for range_start, range_end in ranges:
+        rows.extend(csv.reader(io.StringIO(CSV_TEXT[range_start:range_end], newline='')))
+    assert rows == list(_csv_rows(CSV_TEXT))
+
+
+@pytest.mark.parametrize('csv_output', [CSV_OUTPUT_DICT, CSV_OUTPUT_TUPLES])
+def test_csv_parse_file_parallel_as_dict_reader(csv_file, csv_output):
+    outputs = csv_parse_file_parallel(
+        csv_file,
+        CSV_HEADER,
+        start=len('id,name,note\r\n'),
+        encoding='utf-8',
+        csv_output=csv_output,
+        processes=2,
+        range_size=1000,
+    )
+
+    if csv_output == CSV_OUTPUT_DICT:
+        rows = list(outputs)
+    else:
+        rows = [row for batch in outputs for row in batch.to_dicts()]
+    assert rows == _dict_reader_rows(CSV_TEXT)
+
+
+@pytest.mark.parametrize('encoding, expected', [
+    ('utf-8', True),
+    ('UTF8', True),
+    ('utf-8-sig', True),
+    ('latin-1', True),
+    ('cp1252', True),
+    ('utf-16', False),
+    ('shift_jis', False),
+])
+def test_csv_split_supported(encoding, expected):
+    assert csv_split_supported(encoding) == expected
+
+
+def test_csv_parse_file_parallel_unordered_skip_last_row(csv_file):
+    outputs = csv_parse_file_parallel(
+        csv_file,
+        CSV_HEADER,
+        start=len('id,name,note\r\n'),
+        encoding='utf-8',
+        processes=2,
+        ordered=False,
+        skip_last_row=True,
+        range_size=1000,
+    )
+
+    expected = _dict_reader_rows(CSV_TEXT)[:-1]
+    assert sorted(outputs, key=repr) == sorted(expected, key=repr)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import datetime as dt
+from array import array
+
+import pytest
+
+from pyfortified_requests.support.response import csv as csv_module
+from pyfortified_requests.support.response.csv import (
+    CSV_OUTPUT_COLUMNS,
+    CSV_OUTPUT_TUPLES,
+    csv_column_array,
+    csv_rows_output,
+)
+from pyfortified_requests.support.response.csv_schema import (
+    CsvColumnType,
+    CsvSchema,
+)
+
+numpy = pytest.importorskip('numpy')
+
+CSV_HEADER = ['id', 'name', 'note']
+
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'python'])
+def use_numpy(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(csv_module, 'optional_import', lambda name: None)
+    return request.param
+
+
+@pytest.mark.parametrize('spec, type_name, nullable, date_format', [
+    ('int', 'int', False, None),
+    ('Float?', 'float', True, None),
+    ('date:%m/%d/%Y?', 'date', True, '%m/%d/%Y'),
+    (bool, 'bool', False, None),
+    (len, 'callable', False, None),
+])
+def test_csv_column_type_parse(spec, type_name, nullable, date_format):
+    column_type = CsvColumnType.parse(spec)
+
+    assert (column_type.type_name, column_type.nullable, column_type.date_format) == (type_name, nullable, date_format)
+
+
+@pytest.mark.parametrize('numpy_cast', [True, False])
+@pytest.mark.parametrize('spec, values, expected', [
+    ('int', ['1', ' 2', '-3'], [1, 2, -3]),
+    ('float', ['1.5', '2e3'], [1.5, 2000.0]),
+    ('bool', ['true', 'N', ' yes '], [True, False, True]),
+    ('date', ['2020-01-31', '1999-12-01'], [dt.date(2020, 1, 31), dt.date(1999, 12, 1)]),
+    ('date:%m/%d/%Y', ['01/31/2020'], [dt.date(2020, 1, 31)]),
+])
+def test_csv_schema_cast_column(numpy_cast, spec, values, expected):
+    csv_schema = CsvSchema({'value': spec}, use_numpy=numpy_cast)
+
+    column, errors = csv_schema.cast_column('value', values)
+
+    column = column.tolist() if isinstance(column, numpy.ndarray) else column
+    assert column == expected
+    assert errors == 0
+
+
+def test_csv_schema_cast_errors_and_nulls():
+    csv_schema = CsvSchema({'id': 'int', 'amount': 'float?'})
+
+    ids, id_errors = csv_schema.cast_column('id', ['1', 'two', '', None])
+    amounts, amount_errors = csv_schema.cast_column('amount', ['1.5', ''])
+
+    assert ids == [1, None, None, None]
+    assert amounts == [1.5, None]
+    assert (id_errors, amount_errors) == (3, 0)
+    assert csv_schema.errors == {'id': 3, 'amount': 0}
+    assert csv_schema.nulls == {'id': 2, 'amount': 1}
+
+
+def test_csv_rows_output_schema_cast_errors():
+    rows = [['1', 'a', 'x'], ['two', 'b', 'y'], ['3', 'c', 'z']]
+
+    (batch,) = csv_rows_output(rows, CSV_HEADER, csv_output=CSV_OUTPUT_TUPLES, csv_schema={'id': 'int'})
+
+    assert [row[0] for row in batch.rows] == [1, None, 3]
+    assert batch.errors == {'id': 1}
+
+
+@pytest.mark.parametrize('column, column_type', [
+    ([1, 2, 3], int),
+    ([1.5, 2.5], float),
+])
+def test_csv_column_array(use_numpy, column, column_type):
+    column_array = csv_column_array(column, column_type)
+
+    assert isinstance(column_array, numpy.ndarray if use_numpy else array)
+    assert list(column_array) == column
+
+
+@pytest.mark.parametrize('column, column_type', [
+    ([1, 2 ** 70], int),
+    ([-2 ** 63 - 1], int),
+    ([1, None], int),
+    (['a', 'b'], str),
+])
+def test_csv_column_array_kept_as_list(use_numpy, column, column_type):
+    assert csv_column_array(column, column_type) == column
+
+
+def test_csv_rows_output_columns_int_beyond_64_bits(use_numpy):
+    rows = [['1', 'a', 'x'], [str(2 ** 70), 'b', 'y']]
+
+    (batch,) = csv_rows_output(rows, CSV_HEADER, csv_output=CSV_OUTPUT_COLUMNS, csv_schema={'id': 'int'})
+
+    assert batch.columns['id'] == [1, 2 ** 70]
+    assert batch.errors == {}
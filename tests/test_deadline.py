@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from pyfortified_requests.exceptions.custom import RequestsFortifiedDeadlineExceededError
+from pyfortified_requests.support import deadline as deadline_module
+from pyfortified_requests.support.deadline import Deadline
+
+
+class _Clock(object):
+    """Monotonic clock moved on by tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class _Response(object):
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(deadline_module, 'time', clock)
+    return clock
+
+
+def test_deadline_remaining(clock):
+    deadline = Deadline(10)
+
+    clock.now += 4
+    assert deadline.remaining() == 6
+    assert not deadline.expired
+
+    clock.now += 7
+    assert deadline.remaining() == 0
+    assert deadline.expired
+
+
+@pytest.mark.parametrize('timeout, expected', [
+    (None, 5),
+    (2, 2),
+    (30, 5),
+    ((1, 30), (1, 5)),
+    ((10, 30), (5, 5)),
+])
+def test_deadline_timeout_shrinks(clock, timeout, expected):
+    deadline = Deadline(10)
+    clock.now += 5
+
+    assert deadline.timeout(timeout) == expected
+
+
+def test_deadline_check(clock):
+    deadline = Deadline(10)
+    clock.now += 8
+
+    deadline.check()
+    with pytest.raises(RequestsFortifiedDeadlineExceededError):
+        deadline.check(delay=3)
+
+    clock.now += 2
+    with pytest.raises(RequestsFortifiedDeadlineExceededError):
+        deadline.check()
+
+
+def test_deadline_check_response(clock):
+    deadline = Deadline(10)
+    response = _Response()
+
+    deadline.check_response(response)
+    assert not response.closed
+
+    clock.now += 10
+    with pytest.raises(RequestsFortifiedDeadlineExceededError):
+        deadline.check_response(response)
+    assert response.closed
+
+
+def test_deadline_from_request_retry(clock):
+    deadline = Deadline(10)
+
+    assert Deadline.from_request_retry(None) is None
+    assert Deadline.from_request_retry({'tries': 3}) is None
+    assert Deadline.from_request_retry({'deadline': deadline, 'total_timeout': 1}) is deadline
+
+    new_deadline = Deadline.from_request_retry({'total_timeout': 1})
+    assert new_deadline.total_timeout == 1
+    assert new_deadline.remaining() == 1
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import bz2
+import gzip
+import io
+import zipfile
+
+import pytest
+
+from pyfortified_requests.support.decompress import StreamDecompressor
+
+DATA = b''.join(b'%06d,' % i for i in range(20000))
+
+
+def _pieces(data, size):
+    for offset in range(0, len(data), size):
+        yield data[offset:offset + size]
+
+
+def _zip(data, compress_type):
+    zip_bytes = io.BytesIO()
+    with zipfile.ZipFile(zip_bytes, 'w', compression=compress_type) as zip_file:
+        zip_file.writestr('data.csv', data)
+        zip_file.writestr('other.csv', b'other')
+    return zip_bytes.getvalue()
+
+
+COMPRESSED = {
+    'gzip': gzip.compress(DATA),
+    'gzip members': gzip.compress(DATA[:1000]) + gzip.compress(DATA[1000:]),
+    'bzip': bz2.compress(DATA),
+    'bzip streams': bz2.compress(DATA[:1000]) + bz2.compress(DATA[1000:]),
+    'pkzip deflated': _zip(DATA, zipfile.ZIP_DEFLATED),
+    'pkzip stored': _zip(DATA, zipfile.ZIP_STORED),
+}
+
+
+def _decompress(decompressor, compressed, piece_size):
+    pieces = []
+    for piece in _pieces(compressed, piece_size):
+        pieces.extend(decompressor.decompress(piece))
+    pieces.append(decompressor.flush())
+    return pieces
+
+
+@pytest.mark.parametrize('name', sorted(COMPRESSED))
+@pytest.mark.parametrize('piece_size', [1, 17, 4096, 1 << 20])
+def test_stream_decompressor_any_piece_size(name, piece_size):
+    compressed = COMPRESSED[name]
+    decompressor = StreamDecompressor(name.split()[0], max_length=1000)
+
+    pieces = _decompress(decompressor, compressed, piece_size)
+
+    assert b''.join(pieces) == DATA
+    assert all(len(piece) <= 1000 for piece in pieces)
+    assert decompressor.eof
+    assert decompressor.bytes_in == len(compressed)
+    assert decompressor.bytes_out == len(DATA)
+
+
+def test_stream_decompressor_zip_first_member_only():
+    decompressor = StreamDecompressor('pkzip')
+
+    assert b''.join(_decompress(decompressor, COMPRESSED['pkzip deflated'], 4096)) == DATA
+
+
+def test_stream_decompressor_zip_invalid_header():
+    decompressor = StreamDecompressor('pkzip')
+
+    with pytest.raises(ValueError):
+        list(decompressor.decompress(gzip.compress(DATA)))
+
+
+def test_stream_decompressor_unsupported_compression():
+    with pytest.raises(ValueError):
+        StreamDecompressor('lzma')
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import io
+
+import pytest
+import requests
+
+from pyfortified_requests.support.response import error_body as error_body_module
+from pyfortified_requests.support.response.error_body import (
+    capture_response_error_details,
+    error_content_text,
+    response_error_body,
+)
+
+LIMIT = 100
+
+
+class _CountingRaw(io.BytesIO):
+    """Raw stream recording bytes read and whether it was closed."""
+
+    def __init__(self, data):
+        super(_CountingRaw, self).__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super(_CountingRaw, self).read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def _streamed_response(data, headers=None):
+    response = requests.Response()
+    response.status_code = 500
+    response.raw = _CountingRaw(data)
+    response.headers.update(headers or {})
+    response.encoding = 'utf-8'
+    return response
+
+
+def _read_response(data, headers=None):
+    response = _streamed_response(data, headers)
+    response.content
+    return response
+
+
+@pytest.mark.parametrize('size, truncated', [
+    (0, False),
+    (LIMIT - 1, False),
+    (LIMIT, False),
+    (LIMIT + 1, True),
+    (LIMIT * 50, True),
+])
+def test_response_error_body_truncated(size, truncated):
+    data = b'x' * size
+
+    for response in (_streamed_response(data), _read_response(data)):
+        body, body_truncated = response_error_body(response, limit=LIMIT)
+        assert body == data[:LIMIT]
+        assert body_truncated is truncated
+
+
+def test_response_error_body_streamed_read_stops_after_limit(monkeypatch):
+    monkeypatch.setattr(error_body_module, 'ERROR_BODY_CHUNK_SIZE', 1)
+    response = _streamed_response(b'x' * (LIMIT * 50))
+
+    body, truncated = response_error_body(response, limit=LIMIT)
+
+    assert len(body) == LIMIT
+    assert truncated
+    assert response.raw.bytes_read == LIMIT + 1
+    assert response.raw.closed
+
+
+def test_response_error_body_streamed_read_bounded_by_chunk():
+    response = _streamed_response(b'x' * (error_body_module.ERROR_BODY_CHUNK_SIZE * 10))
+
+    response_error_body(response, limit=LIMIT)
+
+    assert response.raw.bytes_read == error_body_module.ERROR_BODY_CHUNK_SIZE
+
+
+def test_response_error_body_consumed_stream():
+    response = _streamed_response(b'error')
+    list(response.iter_content(16))
+
+    assert response_error_body(response, limit=LIMIT) == (b'', False)
+
+
+def test_response_error_body_none():
+    assert response_error_body(None) == (b'', False)
+
+
+def test_error_content_text():
+    assert error_content_text('abc', limit=2) == ('ab', True)
+    assert error_content_text(b'abc', limit=3) == ('abc', False)
+    # Multi-byte character cut at the limit is replaced.
+    assert error_content_text('é'.encode('utf-8'), limit=1) == ('\ufffd', True)
+
+
+def test_capture_response_error_details_json():
+    response = _streamed_response(b'{"error": "bad request"}')
+
+    error_details = capture_response_error_details(response, limit=LIMIT)
+
+    assert error_details == {
+        'response_details': {'error': 'bad request'},
+        'response_details_source': 'json',
+        'response_details_truncated': False,
+        'response_details_size': 24,
+        'response_content_length': None,
+    }
+
+
+def test_capture_response_error_details_json_truncated():
+    data = b'{"error": "' + b'x' * LIMIT + b'"}'
+    response = _streamed_response(data, headers={'Content-Length': str(len(data))})
+
+    error_details = capture_response_error_details(response, limit=LIMIT)
+
+    assert error_details['response_details_source'] == 'text'
+    assert error_details['response_details_truncated'] is True
+    assert error_details['response_details_size'] == LIMIT
+    assert error_details['response_content_length'] == len(data)
+    assert error_details['response_details'].endswith(
+        "... (truncated: {0} of {1} bytes)".format(LIMIT, len(data))
+    )
+
+
+def test_capture_response_error_details_html():
+    data = (
+        b'<!DOCTYPE html><html><head><title>Error</title><style>p {}</style></head>'
+        b'<body><p>Service   Unavailable</p><script>var x;</script></body></html>'
+    )
+    error_details = capture_response_error_details(_streamed_response(data), limit=len(data))
+
+    assert error_details['response_details_source'] == 'html'
+    assert error_details['response_details'] == ['Error', 'Service Unavailable']
+    assert error_details['response_details_truncated'] is False
+
+
+def test_capture_response_error_details_html_truncated():
+    data = b'<html><body><p>Service Unavailable</p>' + b'<p>filler</p>' * LIMIT + b'</body></html>'
+
+    error_details = capture_response_error_details(_streamed_response(data), limit=LIMIT)
+
+    assert error_details['response_details_source'] == 'html'
+    assert error_details['response_details'][0] == 'Service Unavailable'
+    assert error_details['response_details'][-1] == "... (truncated: {0} of more bytes)".format(LIMIT)
+
+
+def test_capture_response_error_details_xml():
+    data = b'<?xml version="1.0"?><Error><Code>NoSuchKey</Code><Message>Not found</Message></Error>'
+
+    error_details = capture_response_error_details(_streamed_response(data), limit=LIMIT)
+
+    assert error_details['response_details_source'] == 'xml'
+    assert error_details['response_details'] == ['Code: NoSuchKey', 'Message: Not found']
+
+
+def test_capture_response_error_details_empty():
+    error_details = capture_response_error_details(_streamed_response(b''), limit=LIMIT)
+
+    assert error_details['response_details'] is None
+    assert error_details['response_details_source'] is None
+    assert error_details['response_details_size'] == 0
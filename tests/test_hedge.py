@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import io
+import threading
+
+import pytest
+
+from pyfortified_requests.support.hedge import (
+    HedgeBudget,
+    HedgeWorkers,
+    hedge_delay,
+    hedged_call,
+    is_hedge_body,
+)
+from pyfortified_requests.support.metrics import Metrics
+
+TIMEOUT = 5
+
+
+class _Calls(object):
+    """Callable whose n-th call waits for its event, then returns or raises its result."""
+
+    def __init__(self, *results):
+        self.results = results
+        self.events = [threading.Event() for _ in results]
+        self.count = 0
+        self.__lock = threading.Lock()
+
+    def __call__(self):
+        with self.__lock:
+            index = self.count
+            self.count += 1
+        assert self.events[index].wait(TIMEOUT)
+        result = self.results[index]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _budget(tokens):
+    budget = HedgeBudget()
+    budget.deposit(tokens)
+    return budget
+
+
+def test_hedge_budget_ratio_and_cap():
+    budget = HedgeBudget(max_tokens=2)
+
+    for _ in range(3):
+        budget.deposit(0.25)
+    assert not budget.withdraw()
+
+    budget.deposit(0.25)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+    budget.deposit(100)
+    assert budget.tokens == 2
+
+
+def test_hedge_delay_min_samples():
+    metrics = Metrics()
+    name = 'test_hedge.latency'
+
+    for value in range(1, 20):
+        metrics.add_sample(name, value / 100.0)
+    assert hedge_delay(metrics, name, percentile=95, min_samples=20) is None
+
+    metrics.add_sample(name, 0.2)
+    assert hedge_delay(metrics, name, percentile=95, min_samples=20) == 0.19
+    assert hedge_delay(metrics, name, percentile=50, min_samples=20, window=2) == 0.19
+
+
+@pytest.mark.parametrize('request_data, expected', [
+    (None, True),
+    (b'data', True),
+    ('data', True),
+    ({'key': 'value'}, True),
+    ([('key', 'value')], True),
+    (iter([b'data']), False),
+    (io.BytesIO(b'data'), False),
+])
+def test_is_hedge_body(request_data, expected):
+    assert is_hedge_body(request_data) == expected
+
+
+def test_hedged_call_fast_primary_not_hedged():
+    calls = _Calls('primary')
+    calls.events[0].set()
+    budget = _budget(1)
+
+    assert hedged_call(calls, TIMEOUT, budget) == ('primary', False, False)
+    assert calls.count == 1
+    assert budget.tokens == 1
+
+
+def test_hedged_call_slow_primary_hedge_wins():
+    calls = _Calls('primary', 'hedge')
+    calls.events[1].set()
+    discarded = []
+
+    result = hedged_call(calls, 0.01, _budget(1), discard=discarded.append)
+
+    assert result == ('hedge', True, True)
+    calls.events[0].set()
+    assert _wait_for(lambda: discarded == ['primary'])
+
+
+def test_hedged_call_without_budget_waits_for_primary():
+    calls = _Calls('primary')
+    threading.Timer(0.05, calls.events[0].set).start()
+
+    assert hedged_call(calls, 0.01, _budget(0.5)) == ('primary', False, False)
+    assert calls.count == 1
+
+
+def test_hedged_call_not_final_primary_waits_for_hedge():
+    calls = _Calls('retry', 'ok')
+    # Primary completes first, after hedge is sent.
+    threading.Timer(0.05, calls.events[0].set).start()
+    threading.Timer(0.15, calls.events[1].set).start()
+    discarded = []
+
+    result = hedged_call(calls, 0.01, _budget(1), discard=discarded.append, is_final=lambda value: value != 'retry')
+
+    assert result == ('ok', True, True)
+    assert discarded == ['retry']
+
+
+def test_hedged_call_neither_final_takes_primary():
+    calls = _Calls('retry primary', 'retry hedge')
+    threading.Timer(0.05, calls.events[0].set).start()
+    threading.Timer(0.05, calls.events[1].set).start()
+    discarded = []
+
+    result = hedged_call(calls, 0.01, _budget(1), discard=discarded.append, is_final=lambda value: False)
+
+    assert result == ('retry primary', True, False)
+    assert _wait_for(lambda: discarded == ['retry hedge'])
+
+
+def test_hedged_call_failed_primary_takes_hedge():
+    calls = _Calls(IOError('primary'), 'hedge')
+    threading.Timer(0.05, calls.events[0].set).start()
+    threading.Timer(0.05, calls.events[1].set).start()
+
+    assert hedged_call(calls, 0.01, _budget(1)) == ('hedge', True, True)
+
+
+def test_hedged_call_all_fail_raises_primary():
+    calls = _Calls(IOError('primary'), IOError('hedge'))
+    threading.Timer(0.05, calls.events[0].set).start()
+    threading.Timer(0.05, calls.events[1].set).start()
+
+    with pytest.raises(IOError, match='primary'):
+        hedged_call(calls, 0.01, _budget(1))
+
+
+def test_hedged_call_workers_busy_called_inline():
+    calls = _Calls('primary')
+    calls.events[0].set()
+    caller = threading.current_thread()
+    threads = []
+
+    def func():
+        threads.append(threading.current_thread())
+        return calls()
+
+    assert hedged_call(func, 0.01, _budget(1), workers=HedgeWorkers(max_workers=0)) == ('primary', False, False)
+    assert threads == [caller]
+
+
+def test_hedged_call_hedge_worker_busy_refunds_budget():
+    calls = _Calls('primary')
+    threading.Timer(0.05, calls.events[0].set).start()
+    budget = _budget(1)
+
+    assert hedged_call(calls, 0.01, budget, workers=HedgeWorkers(max_workers=1)) == ('primary', False, False)
+    assert calls.count == 1
+    assert budget.tokens == 1
+
+
+def _wait_for(condition):
+    event = threading.Event()
+    for _ in range(int(TIMEOUT / 0.01)):
+        if condition():
+            return True
+        event.wait(0.01)
+    return condition()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+
+import pytest
+import requests
+import urllib3
+from pyhttpstatus_utils import HttpStatusType
+from pyhttpstatus_utils.http_status_methods import InvalidHttpCode
+
+from pyfortified_requests import RequestsFortified
+from pyfortified_requests.errors import RequestsFortifiedErrorCodes
+from pyfortified_requests.exceptions.custom import (
+    RequestsFortifiedClientError,
+    RequestsFortifiedModuleError,
+    RequestsFortifiedServiceError,
+)
+from pyfortified_requests.support.http_status import (
+    HTTP_STATUS_CLASSES,
+    http_status_class,
+    http_status_classes,
+)
+from pyfortified_requests.support.requests_session_client import RequestsSessionClient
+
+REQUEST_URL = 'https://api.example.com/items'
+
+
+@pytest.mark.parametrize('http_status_code, http_status_type, ok, retryable, error_class, error_class_type', [
+    (200, HttpStatusType.SUCCESSFUL, True, False, None, None),
+    (302, HttpStatusType.REDIRECTION, True, False, None, None),
+    (404, HttpStatusType.CLIENT_ERROR, False, False, RequestsFortifiedClientError, RequestsFortifiedClientError),
+    (418, HttpStatusType.CLIENT_ERROR, False, False, None, RequestsFortifiedClientError),
+    (429, HttpStatusType.CLIENT_ERROR, False, True, RequestsFortifiedClientError, RequestsFortifiedClientError),
+    (503, HttpStatusType.SERVER_ERROR, False, True, RequestsFortifiedServiceError, RequestsFortifiedServiceError),
+    (599, HttpStatusType.SERVER_ERROR, False, False, None, RequestsFortifiedServiceError),
+])
+def test_http_status_class(http_status_code, http_status_type, ok, retryable, error_class, error_class_type):
+    status_class = http_status_class(http_status_code)
+
+    assert status_class.http_status_code == http_status_code
+    assert status_class.http_status_type == http_status_type
+    assert status_class.http_status_desc
+    assert status_class.ok == ok
+    assert status_class.retryable == retryable
+    assert status_class.error_class is error_class
+    assert status_class.error_class_type is error_class_type
+
+
+def test_http_status_class_cached():
+    assert http_status_class(503) is http_status_class(503) is HTTP_STATUS_CLASSES[503]
+
+
+@pytest.mark.parametrize('http_status_code', [0, 99, 600, 1000])
+def test_http_status_class_invalid(http_status_code):
+    with pytest.raises(InvalidHttpCode):
+        http_status_class(http_status_code)
+
+
+def test_http_status_classes_retry_codes():
+    status_classes = http_status_classes([500, 409])
+
+    assert http_status_class(409, status_classes).retryable
+    assert http_status_class(500, status_classes).retryable
+    assert not http_status_class(503, status_classes).retryable
+    assert http_status_class(409, status_classes)._replace(retryable=False) == http_status_class(409)
+
+
+def test_http_status_classes_cached():
+    assert http_status_classes() is HTTP_STATUS_CLASSES
+    assert http_status_classes([409, 500]) is http_status_classes((500, 409))
+    assert http_status_classes([503, 502, 500, 504, 429]) is HTTP_STATUS_CLASSES
+
+
+def test_requests_session_client_http_status_classes():
+    assert RequestsSessionClient().http_status_classes is HTTP_STATUS_CLASSES
+    assert http_status_class(409, RequestsSessionClient(retry_codes=[409]).http_status_classes).retryable
+
+
+def _request_retry_error(monkeypatch, http_status_code, retry_codes=None):
+    """Request whose session exhausts retries of 'http_status_code'."""
+    requests_client = RequestsSessionClient(retry_codes=retry_codes)
+
+    def _session_request(**kwargs):
+        raise requests.exceptions.RetryError(urllib3.exceptions.MaxRetryError(
+            None, REQUEST_URL, urllib3.exceptions.ResponseError(
+                'too many {0} error responses'.format(http_status_code)
+            )
+        ))
+
+    monkeypatch.setattr(requests_client.session, 'request', _session_request)
+
+    return RequestsFortified(logger_level=logging.CRITICAL, requests_client=requests_client).request(
+        request_method='GET', request_url=REQUEST_URL, request_retry={'tries': 1}, build_request_curl=False,
+    )
+
+
+@pytest.mark.parametrize('http_status_code, retry_codes, error_class', [
+    (503, None, RequestsFortifiedServiceError),
+    (429, None, RequestsFortifiedClientError),
+    (409, [409], RequestsFortifiedClientError),
+])
+def test_request_retry_error_retryable(monkeypatch, http_status_code, retry_codes, error_class):
+    with pytest.raises(error_class) as excinfo:
+        _request_retry_error(monkeypatch, http_status_code, retry_codes)
+
+    assert excinfo.value.error_code == http_status_code
+
+
+def test_request_retry_error_not_retryable(monkeypatch):
+    with pytest.raises(RequestsFortifiedModuleError) as excinfo:
+        _request_retry_error(monkeypatch, 409)
+
+    assert excinfo.value.error_code == RequestsFortifiedErrorCodes.REQ_ERR_RETRY_EXHAUSTED
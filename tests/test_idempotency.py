@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+import uuid
+
+import pytest
+
+from pyfortified_requests import RequestsFortified
+from pyfortified_requests.exceptions.custom import RequestsFortifiedServiceError
+from pyfortified_requests.support.idempotency import (
+    IDEMPOTENCY_KEY_HEADER,
+    is_idempotent_method,
+    set_idempotency_key,
+)
+
+REQUEST_URL = 'https://api.example.com/orders'
+
+
+@pytest.mark.parametrize('request_method, idempotent', [
+    ('GET', True),
+    ('put', True),
+    ('DELETE', True),
+    ('POST', False),
+    ('patch', False),
+    (None, False),
+])
+def test_is_idempotent_method(request_method, idempotent):
+    assert is_idempotent_method(request_method) is idempotent
+
+
+def test_set_idempotency_key_generated():
+    request_headers = {}
+
+    key = set_idempotency_key(request_headers)
+
+    assert request_headers == {IDEMPOTENCY_KEY_HEADER: key}
+    assert str(uuid.UUID(key)) == key
+    assert set_idempotency_key({}) != key
+
+
+def test_set_idempotency_key_given():
+    request_headers = {'Accept': 'application/json'}
+
+    assert set_idempotency_key(request_headers, 12345) == '12345'
+    assert request_headers[IDEMPOTENCY_KEY_HEADER] == '12345'
+
+
+def test_set_idempotency_key_already_provided():
+    request_headers = {'idempotency-key': 'caller-key'}
+
+    assert set_idempotency_key(request_headers) == 'caller-key'
+    assert set_idempotency_key(request_headers, 'other-key') == 'caller-key'
+    assert request_headers == {'idempotency-key': 'caller-key'}
+
+
+def _retry_service_error(excp, request_label=None):
+    return isinstance(excp, RequestsFortifiedServiceError)
+
+
+def _post(request_retry, request_headers=None):
+    return RequestsFortified(logger_level=logging.CRITICAL).request(
+        request_method='POST', request_url=REQUEST_URL, request_json={'item': 1},
+        request_headers=request_headers,
+        request_retry=dict(request_retry, tries=3, delay=0),
+        request_retry_http_status_codes=[503],
+        request_retry_excps_func=_retry_service_error,
+        build_request_curl=False,
+    )
+
+
+def _sent_keys(requests_mock, status_codes):
+    """Register POST responding by 'status_codes', returning keys sent by each attempt."""
+    sent_keys = []
+    status_codes = list(status_codes)
+
+    def _callback(request, context):
+        sent_keys.append(request.headers.get(IDEMPOTENCY_KEY_HEADER))
+        context.status_code = status_codes.pop(0)
+        return '{}'
+
+    requests_mock.post(REQUEST_URL, text=_callback)
+    return sent_keys
+
+
+def test_request_idempotency_key_reused_by_retries(requests_mock):
+    sent_keys = _sent_keys(requests_mock, [503, 503, 200])
+
+    response = _post({'idempotency_key': True})
+
+    assert response.status_code == 200
+    assert len(sent_keys) == 3
+    assert len(set(sent_keys)) == 1
+    assert str(uuid.UUID(sent_keys[0])) == sent_keys[0]
+
+
+def test_request_idempotency_key_given(requests_mock):
+    sent_keys = _sent_keys(requests_mock, [503, 200])
+
+    _post({'idempotency_key': 'order-1'})
+
+    assert sent_keys == ['order-1', 'order-1']
+
+
+def test_request_idempotency_key_of_caller_headers(requests_mock):
+    sent_keys = _sent_keys(requests_mock, [503, 200])
+    request_headers = {IDEMPOTENCY_KEY_HEADER: 'caller-key'}
+
+    _post({'idempotency_key': True}, request_headers=request_headers)
+
+    assert sent_keys == ['caller-key', 'caller-key']
+
+
+def test_request_idempotency_key_new_per_request(requests_mock):
+    sent_keys = _sent_keys(requests_mock, [200, 200])
+
+    _post({'idempotency_key': True})
+    _post({'idempotency_key': True})
+
+    assert len(set(sent_keys)) == 2
+
+
+def test_request_not_idempotent_not_retried(requests_mock):
+    sent_keys = _sent_keys(requests_mock, [503, 200])
+
+    with pytest.raises(RequestsFortifiedServiceError):
+        _post({})
+
+    assert sent_keys == [None]
+
+
+def test_request_idempotent_retried_without_key(requests_mock):
+    sent_keys = _sent_keys(requests_mock, [503, 200])
+
+    _post({'idempotent': True})
+
+    assert sent_keys == [None, None]
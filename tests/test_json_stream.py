@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import io
+import json
+
+import pytest
+
+from pyfortified_requests.support.json_stream import (
+    iter_json_items,
+    JsonStreamDecodeError,
+)
+
+DOCUMENTS = [
+    [1, -2.5e10, 123.456e7, 0, -0.0, 1e-7, 10, 3.25],
+    ['x' * 97, 123.456e7, {'a': [True, False, None]}, -2.5e10],
+    {'data': [{'id': i, 'value': i * 1.5e3, 'name': 'né\\"%d' % i} for i in range(20)], 'count': 20},
+    [[], {}, '', [[1, 2], [3]], {'k': {'l': 'm'}}],
+]
+
+
+class _ChunkedText(io.StringIO):
+    """Text stream returning at most 'size' characters per read."""
+
+    def __init__(self, text, size):
+        super(_ChunkedText, self).__init__(text)
+        self.size = size
+
+    def read(self, size=-1):
+        return super(_ChunkedText, self).read(min(size, self.size) if size and size > 0 else self.size)
+
+
+@pytest.mark.parametrize('document', DOCUMENTS)
+@pytest.mark.parametrize('chunk_size', list(range(1, 12)) + [64, 65536])
+def test_iter_json_items_any_chunk_size(document, chunk_size):
+    text = json.dumps(document)
+    item_path = 'data.item' if isinstance(document, dict) else 'item'
+    expected = document['data'] if isinstance(document, dict) else document
+
+    items = list(iter_json_items(io.StringIO(text), item_path=item_path, chunk_size=chunk_size))
+
+    assert items == expected
+
+
+@pytest.mark.parametrize('offset', range(20))
+def test_iter_json_items_number_split_at_read_boundary(offset):
+    # Long string places the number across the first read at each offset.
+    chunk_size = 65536
+    text = json.dumps(['x' * (chunk_size - 8 - offset), 123.456e7, -2.5e10])
+
+    items = list(iter_json_items(_ChunkedText(text, chunk_size), chunk_size=chunk_size))
+
+    assert items == json.loads(text)
+
+
+def test_iter_json_items_whole_document():
+    text = json.dumps({'a': 1})
+    assert list(iter_json_items(io.StringIO(text), item_path='')) == [{'a': 1}]
+
+
+@pytest.mark.parametrize('text', ['[1, 2', '[1 2]', '{"a": 1', '[1] x'])
+def test_iter_json_items_malformed(text):
+    with pytest.raises(JsonStreamDecodeError):
+        list(iter_json_items(io.StringIO(text), chunk_size=2))
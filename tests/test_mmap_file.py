@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import codecs
+import csv
+import io
+
+import pytest
+
+from pyfortified_requests.support.mmap_file import (
+    MmapReader,
+    mmap_decode,
+    mmap_open,
+    mmap_text_reader,
+)
+
+TEXT = 'id,name\r\n' + ''.join('{0},"né\n{0}"\r\n'.format(i) for i in range(20000))
+DATA = codecs.BOM_UTF8 + TEXT.encode('utf-8')
+
+
+@pytest.fixture
+def file_path(tmp_path):
+    file_path = tmp_path / 'data.csv'
+    file_path.write_bytes(DATA)
+    return str(file_path)
+
+
+def test_mmap_open(file_path):
+    with mmap_open(file_path) as file_mmap:
+        assert len(file_mmap) == len(DATA)
+        assert file_mmap[:3] == codecs.BOM_UTF8
+
+
+def test_mmap_open_empty_file(tmp_path):
+    file_path = tmp_path / 'empty.csv'
+    file_path.write_bytes(b'')
+
+    with mmap_open(str(file_path)) as file_mmap:
+        assert file_mmap == b''
+
+
+def test_mmap_reader_range():
+    reader = MmapReader(DATA, start=3, end=20)
+
+    assert reader.readline() == b'id,name\r\n'
+    assert reader.tell() == 12
+    assert reader.read(4) == b'0,"n'
+    assert reader.read() == DATA[16:20]
+    assert reader.read() == b''
+
+    assert reader.seek(0) == 3
+    assert reader.seek(-2, io.SEEK_END) == 18
+    assert reader.seek(100) == 20
+
+
+def test_mmap_reader_readinto():
+    reader = MmapReader(DATA, start=3)
+    buffer = bytearray(8)
+
+    assert reader.readinto(buffer) == 8
+    assert bytes(buffer) == b'id,name\r'
+
+
+def test_mmap_reader_readline_size():
+    reader = MmapReader(b'abcdef\nxyz')
+
+    assert reader.readline(3) == b'abc'
+    assert reader.readline() == b'def\n'
+    assert reader.readline() == b'xyz'
+    assert reader.readline() == b''
+
+
+def test_mmap_text_reader_csv(file_path):
+    with mmap_open(file_path) as file_mmap:
+        text_reader = mmap_text_reader(file_mmap, start=len(codecs.BOM_UTF8), encoding='utf-8', newline='')
+        rows = list(csv.reader(text_reader))
+
+    assert rows == list(csv.reader(io.StringIO(TEXT, newline='')))
+
+
+def test_mmap_text_reader_offset_after_header(file_path):
+    with mmap_open(file_path) as file_mmap:
+        reader = MmapReader(file_mmap, start=len(codecs.BOM_UTF8))
+        reader.readline()
+
+        assert file_mmap[reader.tell():].decode('utf-8') == TEXT[len('id,name\r\n'):]
+
+
+def test_mmap_decode(file_path):
+    with mmap_open(file_path) as file_mmap:
+        assert mmap_decode(file_mmap, start=len(codecs.BOM_UTF8)) == TEXT
+        assert mmap_decode(file_mmap, start=3, end=10) == 'id,name'
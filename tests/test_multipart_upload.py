@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import base64
+import hashlib
+import logging
+import os
+import threading
+import xml.etree.ElementTree as ElementTree
+from urllib.parse import (
+    parse_qs,
+    urlparse,
+)
+
+import pytest
+
+from pyfortified_requests import RequestsFortifiedUpload
+from pyfortified_requests.exceptions.custom import RequestsFortifiedBaseError
+from pyfortified_requests.support.multipart_upload import (
+    UploadManifest,
+    UploadPart,
+)
+from pyfortified_requests.support.request_body import RequestBodyRewind
+
+UPLOAD_URL = 'http://localhost/bucket/object.bin'
+TUS_URL = 'http://localhost/files'
+
+PART_SIZE = 64 * 1024
+DATA = os.urandom(5 * PART_SIZE + 123)
+PART_COUNT = 6
+
+PART_RETRY = {'tries': 3, 'delay': 0}
+
+
+def _md5(data):
+    return base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+
+
+class S3StandIn(object):
+    """Stand-in of S3 multipart upload API, on a requests-mock adapter.
+
+    'fail' maps part number to count of responses 500 before success,
+    and 'bad_etag' to count of responses with an ETag not matching.
+    """
+
+    def __init__(self, requests_mock):
+        self.parts = {}
+        self.sent = []
+        self.fail = {}
+        self.bad_etag = {}
+        self.initiated = 0
+        self.completed = None
+        self.aborted = []
+        self.abort_status = 204
+        self.__lock = threading.Lock()
+
+        requests_mock.post(UPLOAD_URL, content=self.post)
+        requests_mock.put(UPLOAD_URL, content=self.put)
+        requests_mock.delete(UPLOAD_URL, content=self.delete)
+
+    @staticmethod
+    def _query(request):
+        query = parse_qs(urlparse(request.url).query, keep_blank_values=True)
+        return {name: values[0] for name, values in query.items()}
+
+    def post(self, request, context):
+        query = self._query(request)
+        if 'uploads' in query:
+            self.initiated += 1
+            return (
+                b'<?xml version="1.0" encoding="UTF-8"?>'
+                b'<InitiateMultipartUploadResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+                b'<UploadId>upload-1</UploadId></InitiateMultipartUploadResult>'
+            )
+        assert query['uploadId'] == 'upload-1'
+        self.completed = ElementTree.fromstring(request.body)
+        return b'<CompleteMultipartUploadResult/>'
+
+    def put(self, request, context):
+        query = self._query(request)
+        assert query['uploadId'] == 'upload-1'
+        part_number = int(query['partNumber'])
+        body = b''.join(request.body)
+
+        with self.__lock:
+            self.sent.append(part_number)
+            if self.fail.get(part_number):
+                self.fail[part_number] -= 1
+                context.status_code = 500
+                return b'Internal Error'
+
+            assert int(request.headers['Content-Length']) == len(body)
+            assert request.headers['Content-MD5'] == _md5(body)
+            etag = hashlib.md5(body).hexdigest()
+            if self.bad_etag.get(part_number):
+                self.bad_etag[part_number] -= 1
+                etag = '0' * 32
+
+            self.parts[part_number] = body
+            context.headers['ETag'] = '"{0}"'.format(etag)
+            return b''
+
+    def delete(self, request, context):
+        self.aborted.append(self._query(request)['uploadId'])
+        context.status_code = self.abort_status
+        return b''
+
+    @property
+    def data(self):
+        return b''.join(self.parts[part_number] for part_number in sorted(self.parts))
+
+
+class TusStandIn(object):
+    """Stand-in of tus 1.0 core server, on a requests-mock adapter.
+
+    'fail_at' is an offset at which a PATCH stores 'fail_partial' bytes
+    of its body, then fails with 500, once.
+    """
+
+    location = TUS_URL + '/upload-1'
+
+    def __init__(self, requests_mock):
+        self.data = bytearray()
+        self.offsets = []
+        self.heads = 0
+        self.terminated = 0
+        self.fail_at = None
+        self.fail_partial = 1000
+
+        requests_mock.post(TUS_URL, status_code=201, headers={'Location': '/files/upload-1'}, content=self.create)
+        requests_mock.head(self.location, content=self.head)
+        requests_mock.patch(self.location, content=self.patch)
+        requests_mock.delete(self.location, content=self.delete)
+
+    def create(self, request, context):
+        assert request.headers['Upload-Length'] == str(len(DATA))
+        self.data = bytearray()
+        return b''
+
+    def head(self, request, context):
+        self.heads += 1
+        context.headers['Upload-Offset'] = str(len(self.data))
+        return b''
+
+    def patch(self, request, context):
+        upload_offset = int(request.headers['Upload-Offset'])
+        body = b''.join(request.body)
+        self.offsets.append(upload_offset)
+
+        if upload_offset != len(self.data):
+            context.status_code = 409
+            return b''
+        assert request.headers['Upload-Checksum'] == 'md5 {0}'.format(_md5(body))
+
+        if self.fail_at is not None and upload_offset >= self.fail_at:
+            self.fail_at = None
+            self.data += body[:self.fail_partial]
+            context.status_code = 500
+            return b''
+
+        self.data += body
+        context.status_code = 204
+        context.headers['Upload-Offset'] = str(len(self.data))
+        return b''
+
+    def delete(self, request, context):
+        self.terminated += 1
+        context.status_code = 204
+        return b''
+
+
+@pytest.fixture
+def source_path(tmp_path):
+    source_path = tmp_path / 'object.bin'
+    source_path.write_bytes(DATA)
+    return str(source_path)
+
+
+@pytest.fixture
+def manifest_path(source_path):
+    return "{0}.upload.json".format(source_path)
+
+
+@pytest.fixture
+def upload():
+    return RequestsFortifiedUpload(logger_level=logging.CRITICAL)
+
+
+def _upload_s3(upload, source_path, **kwargs):
+    return upload.request_upload_resumable(
+        UPLOAD_URL, source_path, **dict({'upload_part_size': PART_SIZE, 'upload_part_retry': PART_RETRY}, **kwargs)
+    )
+
+
+def _upload_tus(upload, source_path, **kwargs):
+    return upload.request_upload_resumable(
+        TUS_URL,
+        source_path,
+        upload_protocol='tus',
+        **dict({'upload_part_size': PART_SIZE, 'upload_part_retry': PART_RETRY}, **kwargs)
+    )
+
+
+def test_s3_upload(requests_mock, upload, source_path, manifest_path):
+    s3 = S3StandIn(requests_mock)
+
+    response = _upload_s3(upload, source_path)
+
+    assert response.status_code == 200
+    assert s3.data == DATA
+    assert sorted(s3.sent) == list(range(1, PART_COUNT + 1))
+    assert [
+        (part.find('PartNumber').text, part.find('ETag').text) for part in s3.completed
+    ] == [
+        (str(part_number), '"{0}"'.format(hashlib.md5(s3.parts[part_number]).hexdigest()))
+        for part_number in range(1, PART_COUNT + 1)
+    ]
+    assert not os.path.exists(manifest_path)
+
+
+def test_s3_resume_sends_missing_parts(requests_mock, upload, source_path, manifest_path):
+    s3 = S3StandIn(requests_mock)
+    s3.fail = {3: PART_RETRY['tries']}
+
+    with pytest.raises(RequestsFortifiedBaseError):
+        _upload_s3(upload, source_path, upload_max_workers=1, upload_abort_on_failure=False)
+
+    manifest = UploadManifest.load(manifest_path)
+    parts_sent = sorted(int(part_number) for part_number in manifest.parts)
+    assert parts_sent == [1, 2]
+    assert not s3.aborted
+
+    s3.sent = []
+    _upload_s3(upload, source_path)
+
+    assert s3.initiated == 1
+    assert sorted(s3.sent) == [3, 4, 5, 6]
+    assert s3.data == DATA
+    assert len(s3.completed) == PART_COUNT
+    assert not os.path.exists(manifest_path)
+
+
+def test_s3_resume_changed_source_restarts(requests_mock, upload, source_path, manifest_path):
+    s3 = S3StandIn(requests_mock)
+    s3.fail = {3: PART_RETRY['tries']}
+
+    with pytest.raises(RequestsFortifiedBaseError):
+        _upload_s3(upload, source_path, upload_max_workers=1, upload_abort_on_failure=False)
+
+    with open(source_path, 'ab') as source_ab:
+        source_ab.write(b'x')
+
+    s3.sent = []
+    _upload_s3(upload, source_path)
+
+    assert s3.initiated == 2
+    assert sorted(s3.sent) == list(range(1, PART_COUNT + 1))
+    assert s3.data == DATA + b'x'
+
+
+def test_s3_part_retried_on_failure_and_etag_mismatch(requests_mock, upload, source_path):
+    s3 = S3StandIn(requests_mock)
+    s3.fail = {2: 1}
+    s3.bad_etag = {4: 1}
+
+    _upload_s3(upload, source_path)
+
+    assert s3.sent.count(2) == 2
+    assert s3.sent.count(4) == 2
+    assert s3.data == DATA
+
+
+def test_s3_abort_on_failure(requests_mock, upload, source_path, manifest_path):
+    s3 = S3StandIn(requests_mock)
+    s3.fail = {3: PART_RETRY['tries']}
+
+    with pytest.raises(RequestsFortifiedBaseError):
+        _upload_s3(upload, source_path)
+
+    assert s3.sent.count(3) == PART_RETRY['tries']
+    assert s3.aborted == ['upload-1']
+    assert s3.completed is None
+    assert not os.path.exists(manifest_path)
+
+
+def test_s3_abort_failed_keeps_manifest(requests_mock, upload, source_path, manifest_path):
+    s3 = S3StandIn(requests_mock)
+    s3.fail = {3: PART_RETRY['tries']}
+    s3.abort_status = 403
+
+    with pytest.raises(RequestsFortifiedBaseError):
+        _upload_s3(upload, source_path)
+
+    assert s3.aborted == ['upload-1']
+    assert os.path.exists(manifest_path)
+
+
+def test_tus_upload(requests_mock, upload, source_path, manifest_path):
+    tus = TusStandIn(requests_mock)
+
+    _upload_tus(upload, source_path)
+
+    assert bytes(tus.data) == DATA
+    assert tus.offsets == [part_number * PART_SIZE for part_number in range(PART_COUNT)]
+    assert not os.path.exists(manifest_path)
+
+
+def test_tus_resume_from_head_offset(requests_mock, upload, source_path, manifest_path):
+    tus = TusStandIn(requests_mock)
+    # Part 3 is partly stored by server, then fails.
+    tus.fail_at = 2 * PART_SIZE
+
+    with pytest.raises(RequestsFortifiedBaseError):
+        _upload_tus(upload, source_path, upload_part_retry={'tries': 1}, upload_abort_on_failure=False)
+
+    assert len(tus.data) == 2 * PART_SIZE + tus.fail_partial
+    assert os.path.exists(manifest_path)
+
+    tus.offsets = []
+    _upload_tus(upload, source_path)
+
+    assert tus.heads == 1
+    assert tus.offsets == [2 * PART_SIZE + tus.fail_partial, 3 * PART_SIZE, 4 * PART_SIZE, 5 * PART_SIZE]
+    assert bytes(tus.data) == DATA
+    assert not os.path.exists(manifest_path)
+
+
+def test_tus_abort_on_failure(requests_mock, upload, source_path, manifest_path):
+    tus = TusStandIn(requests_mock)
+    tus.fail_at = 2 * PART_SIZE
+
+    with pytest.raises(RequestsFortifiedBaseError):
+        _upload_tus(upload, source_path, upload_part_retry={'tries': 1})
+
+    assert tus.terminated == 1
+    assert not os.path.exists(manifest_path)
+
+
+@pytest.mark.parametrize('offset, size', [(0, len(DATA)), (1000, 5000), (len(DATA) - 7, 7)])
+def test_upload_part_streams_range(source_path, offset, size):
+    data = DATA[offset:offset + size]
+
+    upload_part = UploadPart(source_path, offset, size, chunk_size=4096)
+
+    assert len(upload_part) == size
+    assert all(len(chunk) <= 4096 for chunk in upload_part)
+    assert b''.join(upload_part) == b''.join(upload_part) == data
+    assert upload_part.md5() == _md5(data)
+    assert b''.join(upload_part.skip(5)) == data[5:]
+    assert len(upload_part.skip(size + 1)) == 0
+    # Sent as is by retries, without a replay buffer.
+    assert RequestBodyRewind(upload_part).body is upload_part
+
+
+def test_upload_part_source_truncated(tmp_path):
+    source_path = tmp_path / 'object.bin'
+    source_path.write_bytes(DATA[:100])
+
+    with pytest.raises(IOError):
+        list(UploadPart(str(source_path), 50, 100))
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import codecs
+import io
+import logging
+
+import pytest
+
+from pyfortified_requests import (
+    RequestsFortifiedDownload,
+    RequestsFortifiedUpload,
+)
+from pyfortified_requests.support.ndjson import (
+    NDJSON_CONTENT_TYPE,
+    iter_ndjson_chunks,
+    ndjson_loads,
+)
+
+REQUEST_URL = 'http://localhost/records.ndjson'
+
+RECORDS = [{'id': i, 'name': 'né "{0}"'.format(i), 'values': [i, i * 1.5, None]} for i in range(1000)]
+
+
+class _Records(object):
+    """Generator of records, counting how many were consumed."""
+
+    def __init__(self, records):
+        self.records = records
+        self.consumed = 0
+
+    def __iter__(self):
+        for record in self.records:
+            self.consumed += 1
+            yield record
+
+
+@pytest.mark.parametrize('line', [
+    codecs.BOM_UTF8 + b'{"id": 1}',
+    '\ufeff{"id": 1}',
+    b'{"id": 1}',
+])
+def test_ndjson_loads_first_line_bom(line):
+    assert ndjson_loads(line, line_count=1) == {'id': 1}
+
+
+def test_iter_ndjson_chunks_round_trip():
+    chunks = list(iter_ndjson_chunks(RECORDS, chunk_size=1000))
+
+    assert len(chunks) > 1
+    assert all(chunk.endswith(b'\n') for chunk in chunks)
+    lines = b''.join(chunks).splitlines()
+    assert [ndjson_loads(line, line_count) for line_count, line in enumerate(lines, 1)] == RECORDS
+
+
+def test_iter_ndjson_chunks_lazy():
+    records = _Records(RECORDS)
+    chunks = iter_ndjson_chunks(records, chunk_size=1000)
+
+    next(chunks)
+
+    assert records.consumed < 20
+
+
+def test_ndjson_upload_download_round_trip(requests_mock):
+    records = _Records(RECORDS)
+    uploaded = {}
+
+    def upload_callback(request, context):
+        # Sent as a generator, not materialized before sending.
+        assert not isinstance(request.body, (bytes, str))
+        assert records.consumed == 0
+        uploaded['headers'] = request.headers
+        uploaded['body'] = b''.join(request.body)
+        return ''
+
+    requests_mock.put(REQUEST_URL, text=upload_callback)
+
+    response = RequestsFortifiedUpload(logger_level=logging.CRITICAL).request_upload_ndjson(
+        REQUEST_URL, records, upload_chunk_size=1000
+    )
+
+    assert response.status_code == 200
+    assert records.consumed == len(RECORDS)
+    assert uploaded['headers']['Content-Type'] == NDJSON_CONTENT_TYPE
+    assert uploaded['headers']['Transfer-Encoding'] == 'chunked'
+
+    requests_mock.get(
+        REQUEST_URL,
+        body=io.BytesIO(codecs.BOM_UTF8 + uploaded['body']),
+        headers={'Content-Type': NDJSON_CONTENT_TYPE},
+    )
+
+    downloaded = RequestsFortifiedDownload(logger_level=logging.CRITICAL).stream_ndjson(
+        REQUEST_URL, None, chunk_size=100
+    )
+
+    assert list(downloaded) == RECORDS
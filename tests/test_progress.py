@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from pyfortified_requests.support import progress as progress_module
+from pyfortified_requests.support.metrics import Metrics
+from pyfortified_requests.support.progress import (
+    MEGABYTE,
+    DownloadProgress,
+    chunk_size_bytes,
+)
+
+
+class _Clock(object):
+    """Monotonic clock moved on by tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(progress_module, 'time', clock)
+    return clock
+
+
+@pytest.mark.parametrize('chunk, encoding, expected', [
+    (b'', None, 0),
+    (None, None, 0),
+    (b'abc', None, 3),
+    ('né', None, 3),
+    ('né', 'latin-1', 2),
+])
+def test_chunk_size_bytes(chunk, encoding, expected):
+    assert chunk_size_bytes(chunk, encoding) == expected
+
+
+def test_download_progress_wire_and_decoded_bytes(clock):
+    progress = DownloadProgress()
+
+    progress.update(100, wire_bytes=40)
+    progress.update(150, wire_bytes=70)
+
+    assert progress.bytes_decoded == 250
+    assert progress.bytes_wire == 70
+    assert progress.chunk_count == 2
+
+
+def test_download_progress_wire_bytes_default_decoded(clock):
+    progress = DownloadProgress()
+
+    progress.update(100)
+    progress.update(50)
+
+    assert progress.bytes_wire == progress.bytes_decoded == 150
+
+
+def test_download_progress_rolling_rate(clock):
+    progress = DownloadProgress(rate_window_secs=5.0)
+
+    # 1 MB/s for 10 secs, then 4 MB/s for 10 secs.
+    for rate in [MEGABYTE] * 10 + [4 * MEGABYTE] * 10:
+        clock.now += 1
+        progress.update(rate)
+
+    assert progress.rate_mbps == pytest.approx(4.0)
+    assert progress.average_rate_mbps == pytest.approx(2.5)
+
+
+def test_download_progress_eta(clock):
+    progress = DownloadProgress(content_length=1000)
+    assert progress.eta_secs is None
+
+    clock.now += 2
+    progress.update(200)
+    assert progress.rate_bps == pytest.approx(100)
+    assert progress.eta_secs == pytest.approx(8)
+    assert progress.percent == pytest.approx(20)
+
+    clock.now += 1
+    progress.update(800)
+    assert progress.eta_secs == 0
+    assert progress.percent == 100
+
+
+def test_download_progress_eta_unknown_length(clock):
+    progress = DownloadProgress()
+
+    clock.now += 1
+    progress.update(200)
+
+    assert progress.eta_secs is None
+    assert progress.percent is None
+
+
+def test_download_progress_callback_every_chunk(clock):
+    calls = []
+    progress = DownloadProgress(progress_callback=lambda progress_: calls.append(progress_.bytes_decoded))
+
+    for _ in range(5):
+        clock.now += 0.1
+        progress.update(10)
+    progress.finish()
+
+    assert calls == [10, 20, 30, 40, 50]
+
+
+def test_download_progress_callback_throttled(clock):
+    calls = []
+    progress = DownloadProgress(
+        progress_callback=lambda progress_: calls.append(progress_.bytes_decoded),
+        callback_interval_secs=1.0,
+    )
+
+    for _ in range(25):
+        clock.now += 0.1
+        progress.update(10)
+    assert calls == [10, 110, 210]
+
+    # Last update is delivered on finish.
+    progress.finish()
+    assert calls == [10, 110, 210, 250]
+
+
+def test_download_progress_metrics(clock):
+    metrics = Metrics()
+    metrics_prefix = 'test_progress'
+    progress = DownloadProgress(
+        content_length=3 * MEGABYTE,
+        metrics=metrics,
+        metrics_prefix=metrics_prefix,
+        log_interval_secs=1.0,
+    )
+
+    for _ in range(3):
+        clock.now += 1
+        progress.update(MEGABYTE, wire_bytes=progress.bytes_wire + MEGABYTE // 2)
+    progress.finish()
+
+    samples = metrics.dict()
+    assert metrics.count('test_progress.count') == 1
+    assert [value for _, value in samples['test_progress.bytes_wire']] == [3 * MEGABYTE // 2]
+    assert [value for _, value in samples['test_progress.bytes_decoded']] == [3 * MEGABYTE]
+    assert [value for _, value in samples['test_progress.duration']] == [3]
+    # Logged every second, then average on finish.
+    assert [value for _, value in samples['test_progress.throughput_mbps']] == pytest.approx([0.5] * 4)
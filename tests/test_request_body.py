@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import io
+import logging
+
+import pytest
+
+from pyfortified_requests import RequestsFortified
+from pyfortified_requests.exceptions.custom import (
+    RequestsFortifiedBodyNotReplayableError,
+    RequestsFortifiedServiceError,
+)
+from pyfortified_requests.support.request_body import (
+    ReplayBufferedBody,
+    RequestBodyRewind,
+)
+
+REQUEST_URL = 'http://localhost/upload'
+
+DATA = b''.join(b'%06d,' % i for i in range(20000))
+
+
+def _pieces(data, size):
+    for offset in range(0, len(data), size):
+        yield data[offset:offset + size]
+
+
+class _NonSeekable(io.RawIOBase):
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self._data.readinto(b)
+
+
+@pytest.mark.parametrize('body', [None, b'data', 'data', {'key': 'value'}, [('key', 'value')]])
+def test_request_body_rewind_sent_as_is(body):
+    body_rewind = RequestBodyRewind(body)
+
+    assert body_rewind.body is body
+    assert body_rewind.rewind() is body
+    assert body_rewind.replayable
+
+
+def test_request_body_rewind_seekable_source():
+    source = io.BytesIO(b'head' + DATA)
+    source.seek(4)
+    body_rewind = RequestBodyRewind(source)
+
+    assert body_rewind.body is source
+    assert body_rewind.rewind().read() == DATA
+    assert body_rewind.rewind().read() == DATA
+
+
+def test_request_body_rewind_generator_replayed():
+    body_rewind = RequestBodyRewind(_pieces(DATA, 1000), buffer_size=len(DATA))
+
+    assert isinstance(body_rewind.body, ReplayBufferedBody)
+    assert b''.join(body_rewind.rewind()) == DATA
+    assert body_rewind.replayable
+    assert b''.join(body_rewind.rewind()) == DATA
+
+
+def test_request_body_rewind_non_seekable_file_replayed():
+    body_rewind = RequestBodyRewind(_NonSeekable(DATA), buffer_size=len(DATA))
+
+    assert b''.join(body_rewind.rewind()) == DATA
+    assert b''.join(body_rewind.rewind()) == DATA
+
+
+def test_request_body_rewind_generator_beyond_buffer():
+    body_rewind = RequestBodyRewind(_pieces(DATA, 1000), buffer_size=len(DATA) - 1)
+
+    assert b''.join(body_rewind.rewind()) == DATA
+    assert not body_rewind.replayable
+    with pytest.raises(RequestsFortifiedBodyNotReplayableError):
+        body_rewind.rewind()
+
+
+def test_replay_buffered_body_partly_sent_replayed():
+    body = ReplayBufferedBody(_pieces(DATA, 1000), buffer_size=len(DATA))
+
+    chunks = iter(body)
+    next(chunks)
+    next(chunks)
+
+    assert b''.join(body) == DATA
+
+
+def _retry_service_error(excp, request_label=None):
+    return isinstance(excp, RequestsFortifiedServiceError)
+
+
+def _request(body, request_retry):
+    return RequestsFortified(logger_level=logging.CRITICAL).request(
+        request_method='PUT',
+        request_url=REQUEST_URL,
+        request_data=body,
+        request_retry=dict(request_retry, delay=0),
+        request_retry_http_status_codes=[503],
+        request_retry_excps_func=_retry_service_error,
+        build_request_curl=False,
+    )
+
+
+def _sent_bodies(requests_mock, responses):
+    bodies = []
+
+    def callback(request, context):
+        bodies.append(request.body if isinstance(request.body, bytes) else b''.join(request.body))
+        context.status_code = responses.pop(0)
+        return b''
+
+    requests_mock.put(REQUEST_URL, content=callback)
+    return bodies
+
+
+def test_request_retry_replays_generator_body(requests_mock):
+    bodies = _sent_bodies(requests_mock, [503, 503, 200])
+
+    response = _request(_pieces(DATA, 1000), {'tries': 3})
+
+    assert response.status_code == 200
+    assert bodies == [DATA] * 3
+
+
+def test_request_retry_rewinds_file_body(requests_mock):
+    bodies = _sent_bodies(requests_mock, [503, 200])
+
+    response = _request(io.BytesIO(DATA), {'tries': 2})
+
+    assert response.status_code == 200
+    assert bodies == [DATA] * 2
+
+
+def test_request_retry_body_beyond_replay_size(requests_mock):
+    bodies = _sent_bodies(requests_mock, [503, 200])
+
+    with pytest.raises(RequestsFortifiedBodyNotReplayableError):
+        _request(_pieces(DATA, 1000), {'tries': 2, 'body_replay_size': 1000})
+
+    assert bodies == [DATA]
+
+
+def test_request_single_attempt_body_not_buffered(requests_mock):
+    sent = []
+
+    def callback(request, context):
+        sent.append(request.body)
+        return b''
+
+    requests_mock.put(REQUEST_URL, content=callback)
+    body = _pieces(DATA, 1000)
+
+    _request(body, {'tries': 1})
+
+    assert sent == [body]
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import requests
+
+from pyfortified_requests.support.response.headers import (
+    RESPONSE_HEADER_REDACTED_VALUE,
+    response_headers_snapshot,
+)
+
+HEADERS = {
+    'Content-Type': 'application/json',
+    'Set-Cookie': 'session=secret',
+    'X-Api-Key': 'key',
+    'ETag': '"abc"',
+}
+
+
+def _response(headers=HEADERS):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers)
+    return response
+
+
+def test_response_headers_snapshot_redacted():
+    snapshot = response_headers_snapshot(_response())
+
+    assert snapshot == {
+        'Content-Type': 'application/json',
+        'Set-Cookie': RESPONSE_HEADER_REDACTED_VALUE,
+        'X-Api-Key': RESPONSE_HEADER_REDACTED_VALUE,
+        'ETag': '"abc"',
+    }
+    assert type(snapshot) is dict
+
+
+def test_response_headers_snapshot_keeps_server_case():
+    response = _response({'x-lower': '1', 'X-UPPER': '2'})
+
+    assert list(response_headers_snapshot(response)) == ['x-lower', 'X-UPPER']
+
+
+def test_response_headers_snapshot_redact_custom():
+    snapshot = response_headers_snapshot(_response(), redact=['etag'])
+
+    assert snapshot['ETag'] == RESPONSE_HEADER_REDACTED_VALUE
+    assert snapshot['Set-Cookie'] == 'session=secret'
+
+
+def test_response_headers_snapshot_redact_none():
+    assert response_headers_snapshot(_response(), redact=None) == HEADERS
+
+
+def test_response_headers_snapshot_cached():
+    response = _response()
+
+    snapshot = response_headers_snapshot(response)
+    response.headers['X-Later'] = '1'
+
+    assert response_headers_snapshot(response) is snapshot
+    assert 'X-Later' not in snapshot
+
+
+def test_response_headers_snapshot_cached_per_redact():
+    response = _response()
+
+    redacted = response_headers_snapshot(response)
+    unredacted = response_headers_snapshot(response, redact=None)
+
+    assert unredacted is not redacted
+    assert unredacted['Set-Cookie'] == 'session=secret'
+    assert response_headers_snapshot(response, redact=()) is unredacted
+    assert response_headers_snapshot(response) is redacted
+
+
+def test_response_headers_snapshot_plain_headers():
+    class _PlainResponse(object):
+        __slots__ = ('headers',)
+
+        def __init__(self, headers):
+            self.headers = headers
+
+    response = _PlainResponse({'Authorization': 'Bearer x', 'Accept': '*/*'})
+
+    assert response_headers_snapshot(response) == {
+        'Authorization': RESPONSE_HEADER_REDACTED_VALUE,
+        'Accept': '*/*',
+    }
+
+
+def test_response_headers_snapshot_no_headers():
+    response = requests.Response()
+
+    assert response_headers_snapshot(response) == {}
+    assert response_headers_snapshot(None) == {}
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+
+import pytest
+
+from pyfortified_requests.support.response import parse as parse_module
+from pyfortified_requests.support.response.parse import (
+    HtmlTextExtractor,
+    html_text_lines,
+    xml_dict,
+    xml_text_lines,
+)
+
+HTML = (
+    '<!DOCTYPE html>\n'
+    '<html><head><title>Service Error</title>\n'
+    '<style>body { color: red; }</style>\n'
+    '<script>var message = "<p>not text</p>";</script></head>\n'
+    '<body><h1>503   Service\tUnavailable</h1>\n'
+    '<div>Try <b>again</b> later.<br/>Request id: 42</div>\n'
+    '<noscript>Enable JavaScript</noscript>\n'
+    '<ul><li>one</li><li>two &amp; three</li></ul>\n'
+    '</body></html>'
+)
+
+HTML_LINES = [
+    'Service Error',
+    '503 Service Unavailable',
+    'Try again later.',
+    'Request id: 42',
+    'one',
+    'two & three',
+]
+
+XML = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<Error xmlns="http://s3.amazonaws.com/doc/2006-03-01/">\n'
+    '  <Code>SlowDown</Code>\n'
+    '  <Message>Please reduce\n    your request rate.</Message>\n'
+    '  <RequestId>  </RequestId>\n'
+    '</Error>'
+)
+
+
+def test_html_text_lines():
+    assert html_text_lines(HTML) == HTML_LINES
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64])
+def test_html_text_lines_chunked(monkeypatch, chunk_size):
+    monkeypatch.setattr(parse_module, 'TEXT_EXTRACT_CHUNK_SIZE', chunk_size)
+
+    assert html_text_lines(HTML) == HTML_LINES
+
+
+def test_html_text_extractor_max_chars():
+    extractor = HtmlTextExtractor(max_chars=20)
+    extractor.feed(HTML)
+    extractor.close()
+
+    assert extractor.full
+    assert extractor.chars == 20
+    assert extractor.lines == ['Service Error', '503']
+
+
+def test_html_text_lines_max_chars_stops_feeding(monkeypatch):
+    fed = []
+
+    feed = HtmlTextExtractor.feed
+
+    def _feed(self, data):
+        fed.append(data)
+        feed(self, data)
+
+    monkeypatch.setattr(parse_module, 'TEXT_EXTRACT_CHUNK_SIZE', 16)
+    monkeypatch.setattr(HtmlTextExtractor, 'feed', _feed)
+
+    html = '<p>' + 'x' * 64 + '</p>' + '<p>filler</p>' * 100
+    lines = html_text_lines(html, max_chars=10)
+
+    assert lines == ['x' * 10]
+    assert len(fed) < len(html) // 16
+
+
+def test_html_text_extractor_nested_skip_tags():
+    extractor = HtmlTextExtractor()
+    extractor.feed('<p>a<noscript>b<template>c</template>d</noscript>e</p></template>f')
+    extractor.close()
+
+    assert extractor.lines == ['ae', 'f']
+
+
+def test_html_text_lines_fallback(monkeypatch):
+    def _feed(self, data):
+        raise AssertionError('parser failed')
+
+    monkeypatch.setattr(HtmlTextExtractor, 'feed', _feed)
+
+    assert html_text_lines('<p>fall</p>\n<p>back</p>') == ['fall', 'back']
+
+
+def test_xml_text_lines():
+    assert xml_text_lines(XML) == [
+        'Code: SlowDown',
+        'Message: Please reduce your request rate.',
+    ]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 64])
+def test_xml_text_lines_chunked(monkeypatch, chunk_size):
+    monkeypatch.setattr(parse_module, 'TEXT_EXTRACT_CHUNK_SIZE', chunk_size)
+
+    assert xml_text_lines(XML) == [
+        'Code: SlowDown',
+        'Message: Please reduce your request rate.',
+    ]
+
+
+def test_xml_text_lines_max_chars():
+    assert xml_text_lines(XML, max_chars=5) == ['Code: SlowDown']
+
+
+def test_xml_text_lines_truncated():
+    assert xml_text_lines(XML[:XML.index('<Message>') + 20]) == ['Code: SlowDown']
+
+
+def test_xml_text_lines_not_xml():
+    assert xml_text_lines('plain\n  text <\n') == ['plain', 'text <']
+
+
+def test_xml_dict_etree(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'xmltodict', None)
+
+    assert xml_dict('<a x="1"><b>one</b><b>two</b><c/></a>') == {
+        'a': {'@x': '1', 'b': ['one', 'two'], 'c': None},
+    }
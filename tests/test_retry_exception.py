@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import http.client as http_client
+import socket
+
+import pytest
+import requests
+import urllib3
+
+from pyfortified_requests.exceptions.custom import RequestsFortifiedServiceError
+from pyfortified_requests.support import retry_exception as retry_exception_module
+from pyfortified_requests.support.retry_exception import (
+    EXCEPTION_CHAIN_MAX_DEPTH,
+    classify_retry_exception,
+    exception_chain,
+    is_connect_phase_exception,
+    is_retry_exception,
+    mv_request_retry_excps_func,
+    register_retry_exception,
+)
+from pyfortified_requests.support.stream_watchdog import StreamIdleTimeout
+
+REQUEST_URL = 'https://api.example.com/items'
+
+
+class _OuterError(Exception):
+    pass
+
+
+class _InnerError(Exception):
+    pass
+
+
+class _ResetError(ConnectionResetError):
+    pass
+
+
+def _raised_from(excp, cause):
+    try:
+        raise excp from cause
+    except Exception as ex:
+        return ex
+
+
+def _raised_during(excp, context):
+    try:
+        try:
+            raise context
+        except Exception:
+            raise excp
+    except Exception as ex:
+        return ex
+
+
+def _remote_disconnected():
+    """requests' error of server closing connection without response."""
+    root = http_client.RemoteDisconnected('Remote end closed connection without response')
+    protocol_error = urllib3.exceptions.ProtocolError('Connection aborted.', root)
+    return requests.exceptions.ConnectionError(protocol_error), protocol_error, root
+
+
+def _connection_refused():
+    """requests' error of failing to connect, wrapped by urllib3 MaxRetryError."""
+    root = urllib3.exceptions.NewConnectionError(None, 'Failed to establish a new connection')
+    max_retry_error = urllib3.exceptions.MaxRetryError(None, REQUEST_URL, root)
+    return requests.exceptions.ConnectionError(max_retry_error), max_retry_error, root
+
+
+def test_exception_chain_requests_args():
+    excp, protocol_error, root = _remote_disconnected()
+
+    assert exception_chain(excp) == [excp, protocol_error, root]
+
+
+def test_exception_chain_urllib3_reason():
+    excp, max_retry_error, root = _connection_refused()
+
+    assert exception_chain(excp) == [excp, max_retry_error, root]
+
+
+def test_exception_chain_requests_fortified_errors():
+    root = ConnectionResetError(104, 'Connection reset by peer')
+    excp = RequestsFortifiedServiceError(error_message='Failed', errors=root)
+
+    assert exception_chain(excp) == [excp, root]
+
+
+def test_exception_chain_cause_and_context():
+    root = _InnerError('root')
+    middle = _raised_from(ValueError('middle'), root)
+    excp = _raised_during(_OuterError('outer'), middle)
+
+    assert exception_chain(excp) == [excp, middle, root]
+
+
+def test_exception_chain_cycle():
+    first, second = _OuterError('first'), _InnerError('second')
+    first.__context__ = second
+    second.__context__ = first
+
+    assert exception_chain(first) == [first, second]
+
+
+def test_exception_chain_max_depth():
+    excp = _InnerError(0)
+    for depth in range(1, EXCEPTION_CHAIN_MAX_DEPTH * 2):
+        excp = _raised_from(_OuterError(depth), excp)
+
+    assert len(exception_chain(excp)) == EXCEPTION_CHAIN_MAX_DEPTH
+    assert len(exception_chain(excp, max_depth=3)) == 3
+
+
+def test_exception_chain_single():
+    excp = ValueError('no chain')
+
+    assert exception_chain(excp) == [excp]
+
+
+def test_classify_retry_exception_root_decides():
+    excp, _, root = _remote_disconnected()
+
+    assert classify_retry_exception(excp) == (True, root)
+
+
+def test_classify_retry_exception_not_registered():
+    excp, _, root = _connection_refused()
+
+    assert classify_retry_exception(excp) == (False, root)
+
+
+@pytest.mark.parametrize('excp', [
+    _ResetError('subclass'),
+    StreamIdleTimeout('Read below minimum rate'),
+    RequestsFortifiedServiceError(error_message='Failed', errors=ConnectionResetError()),
+    _raised_from(_OuterError('outer'), ConnectionResetError()),
+])
+def test_classify_retry_exception_retry(excp):
+    is_retry, decided_excp = classify_retry_exception(excp)
+
+    assert is_retry
+    assert isinstance(decided_excp, (ConnectionResetError, StreamIdleTimeout))
+    assert is_retry_exception(excp)
+    assert mv_request_retry_excps_func(excp, 'Request')
+
+
+def test_classify_retry_exception_deepest_decides():
+    inner = _InnerError('inner')
+    excp = _raised_from(_OuterError('outer'), inner)
+
+    retry_exceptions = {_OuterError: True, _InnerError: False}
+    assert classify_retry_exception(excp, retry_exceptions) == (False, inner)
+
+    retry_exceptions = {_OuterError: True, ValueError: False}
+    assert classify_retry_exception(excp, retry_exceptions) == (True, excp)
+
+
+def test_classify_retry_exception_most_specific_type():
+    excp = _ResetError('reset')
+
+    assert classify_retry_exception(excp, {OSError: False, ConnectionResetError: True}) == (True, excp)
+    assert classify_retry_exception(excp, {_ResetError: False, ConnectionResetError: True}) == (False, excp)
+
+
+def test_register_retry_exception(monkeypatch):
+    monkeypatch.setattr(retry_exception_module, 'RETRY_EXCEPTIONS', dict(retry_exception_module.RETRY_EXCEPTIONS))
+    excp, _, root = _connection_refused()
+
+    register_retry_exception(urllib3.exceptions.NewConnectionError)
+    assert classify_retry_exception(excp) == (True, root)
+
+    register_retry_exception(ConnectionResetError, retry=False)
+    assert not is_retry_exception(ConnectionResetError())
+
+    register_retry_exception(urllib3.exceptions.NewConnectionError, retry=None)
+    assert not is_retry_exception(excp)
+
+
+@pytest.mark.parametrize('excp', [
+    _connection_refused()[0],
+    requests.exceptions.ConnectTimeout('Connect timed out'),
+    requests.exceptions.ConnectionError(urllib3.exceptions.MaxRetryError(
+        None, REQUEST_URL, urllib3.exceptions.ConnectTimeoutError('Connect timed out')
+    )),
+    _raised_from(requests.exceptions.ConnectionError('Name resolution'), socket.gaierror(-2, 'Name not known')),
+    RequestsFortifiedServiceError(error_message='Failed', errors=ConnectionRefusedError()),
+])
+def test_is_connect_phase_exception(excp):
+    assert is_connect_phase_exception(excp)
+
+
+@pytest.mark.parametrize('excp', [
+    _remote_disconnected()[0],
+    requests.exceptions.ReadTimeout('Read timed out'),
+    StreamIdleTimeout('Read below minimum rate'),
+    ConnectionResetError(),
+    ValueError(),
+])
+def test_is_not_connect_phase_exception(excp):
+    assert not is_connect_phase_exception(excp)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import requests
+from urllib3.exceptions import ProtocolError
+
+from pyfortified_requests.support import stream_watchdog as stream_watchdog_module
+from pyfortified_requests.support.retry_exception import is_retry_exception
+from pyfortified_requests.support.stream_watchdog import (
+    STREAM_IDLE_MIN_RATE,
+    StreamIdleTimeout,
+    StreamWatchdog,
+    iter_response_chunks,
+)
+
+IDLE_TIMEOUT = 8
+MIN_RATE = 100
+
+
+class _Clock(object):
+    """Monotonic clock moved on by tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class _Raw(object):
+    """Raw stream returning 'chunks', moving clock on by 'secs_per_read' per read."""
+
+    def __init__(self, clock, chunks, secs_per_read=1):
+        self.clock = clock
+        self.chunks = list(chunks)
+        self.secs_per_read = secs_per_read
+
+    def read(self, size, decode_content=False):
+        self.clock.now += self.secs_per_read
+        if not self.chunks:
+            return b''
+        chunk = self.chunks.pop(0)
+        if isinstance(chunk, Exception):
+            raise chunk
+        return chunk
+
+
+class _Response(object):
+    closed = False
+    encoding = None
+
+    def __init__(self, raw=None):
+        self.raw = raw
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(stream_watchdog_module, 'time', clock)
+    return clock
+
+
+def _watchdog(response=None):
+    return StreamWatchdog(response or _Response(), IDLE_TIMEOUT, min_rate=MIN_RATE, request_label='Download')
+
+
+def _updates_until_abort(clock, watchdog, chunk_bytes, updates=100, secs=1):
+    """Update watchdog every 'secs' with bytes of 'chunk_bytes', returning count of updates when it aborts."""
+    for update in range(1, updates + 1):
+        clock.now += secs
+        try:
+            watchdog.update(chunk_bytes(update) if callable(chunk_bytes) else chunk_bytes)
+        except StreamIdleTimeout:
+            return update
+    return None
+
+
+def test_stream_watchdog_steady(clock):
+    watchdog = _watchdog()
+
+    assert _updates_until_abort(clock, watchdog, MIN_RATE * 2) is None
+    assert watchdog.bytes_read == MIN_RATE * 2 * 100
+    assert not watchdog.stalled
+
+
+def test_stream_watchdog_trickle_aborts_after_idle_timeout(clock):
+    response = _Response()
+    watchdog = _watchdog(response)
+
+    assert _updates_until_abort(clock, watchdog, MIN_RATE // 10) == IDLE_TIMEOUT
+    assert watchdog.stalled
+    assert response.closed
+
+
+def test_stream_watchdog_not_aborted_before_idle_timeout(clock):
+    watchdog = _watchdog()
+
+    clock.now += IDLE_TIMEOUT - 0.5
+    watchdog.update(0)
+
+    assert not watchdog.stalled
+
+
+def test_stream_watchdog_stall_after_burst(clock):
+    watchdog = _watchdog()
+
+    # Burst at first second, then 1 byte per second: the burst leaves the
+    # window 'idle_timeout' seconds later.
+    update = _updates_until_abort(clock, watchdog, lambda update: MIN_RATE * 100 if update == 1 else 1)
+
+    assert update == IDLE_TIMEOUT + 1
+
+
+def test_stream_watchdog_recovers(clock):
+    watchdog = _watchdog()
+
+    # Bursts every 'idle_timeout' / 2 seconds, above minimum rate over any 'idle_timeout' seconds.
+    def chunk_bytes(update):
+        return MIN_RATE * IDLE_TIMEOUT if update % IDLE_TIMEOUT == 0 else 0
+
+    assert _updates_until_abort(clock, watchdog, chunk_bytes, secs=0.5) is None
+
+
+def test_stream_watchdog_many_small_updates(clock):
+    watchdog = _watchdog()
+
+    # 1000 bytes per second, in updates of 1 byte.
+    assert _updates_until_abort(clock, watchdog, 1, updates=20000, secs=0.001) is None
+    assert watchdog.bytes_read == 20000
+
+
+def test_stream_watchdog_abort(clock):
+    response = _Response()
+    watchdog = _watchdog(response)
+    watchdog.update(10)
+
+    with pytest.raises(StreamIdleTimeout) as excinfo:
+        watchdog.abort()
+
+    assert watchdog.stalled
+    assert response.closed
+    assert excinfo.value.response is response
+    assert str(excinfo.value) == 'Download: Idle: Throughput below 100 bytes/sec for 8 secs'
+    assert isinstance(excinfo.value, requests.exceptions.ReadTimeout)
+    assert is_retry_exception(excinfo.value)
+
+
+def test_stream_watchdog_from_request_retry():
+    response = _Response()
+
+    assert StreamWatchdog.from_request_retry(response, None) is None
+    assert StreamWatchdog.from_request_retry(response, {'tries': 3}) is None
+
+    watchdog = StreamWatchdog.from_request_retry(response, {'idle_timeout': 30})
+    assert (watchdog.idle_timeout, watchdog.min_rate) == (30, STREAM_IDLE_MIN_RATE)
+
+    watchdog = StreamWatchdog.from_request_retry(response, {'idle_timeout': 30, 'idle_min_rate': 1024})
+    assert (watchdog.idle_timeout, watchdog.min_rate) == (30, 1024)
+
+
+def test_stream_watchdog_iter_chunks(clock):
+    chunks = [b'x' * MIN_RATE * 2] * 20
+    response = _Response(_Raw(clock, chunks))
+
+    assert list(_watchdog(response).iter_chunks(1024)) == chunks
+
+
+def test_stream_watchdog_iter_chunks_trickle(clock):
+    response = _Response(_Raw(clock, [b'x'] * 20))
+    received = []
+
+    with pytest.raises(StreamIdleTimeout):
+        for chunk in _watchdog(response).iter_chunks(1024):
+            received.append(chunk)
+
+    assert len(received) == IDLE_TIMEOUT
+    assert response.closed
+
+
+def test_iter_response_chunks_protocol_error(clock):
+    response = _Response(_Raw(clock, [b'abc', ProtocolError('Connection broken')]))
+    received = []
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        for chunk in iter_response_chunks(response, 1024):
+            received.append(chunk)
+
+    assert received == [b'abc']
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+
+import requests
+
+from pyfortified_requests import RequestsFortified
+from pyfortified_requests.errors import RequestsFortifiedErrorCodes
+from pyfortified_requests.exceptions.custom import RequestsFortifiedModuleError
+
+REQUEST_URL = 'http://localhost/test'
+
+
+def _response(status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    return response
+
+
+def test_last_try_response_returned():
+    response = _response()
+
+    to_raise_exception, to_return_response = RequestsFortified(logger_level=logging.CRITICAL).try_send_request(
+        attempts=1, tries=0, request_func=lambda: response, request_retry_func=None, request_url=REQUEST_URL
+    )
+
+    assert to_raise_exception is None
+    assert to_return_response is response
+
+
+def test_last_try_retry_candidate_exhausted():
+    to_raise_exception, to_return_response = RequestsFortified(logger_level=logging.CRITICAL).try_send_request(
+        attempts=1,
+        tries=0,
+        request_func=_response,
+        request_retry_func=lambda response: True,
+        request_url=REQUEST_URL,
+    )
+
+    assert to_return_response is None
+    assert isinstance(to_raise_exception, RequestsFortifiedModuleError)
+    assert to_raise_exception.error_code == RequestsFortifiedErrorCodes.REQ_ERR_RETRY_EXHAUSTED
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import base64
+import hashlib
+import io
+
+import pytest
+
+from pyfortified_requests.support import upload_checksum as upload_checksum_module
+from pyfortified_requests.support.upload_checksum import (
+    ChecksumReader,
+    UploadChecksums,
+)
+
+DATA = b''.join(b'%06d,' % i for i in range(20000))
+
+
+@pytest.fixture(params=['python', 'crc32c'])
+def crc32c_implementation(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(upload_checksum_module, 'optional_import', lambda name: None)
+    else:
+        pytest.importorskip('crc32c')
+    return request.param
+
+
+@pytest.mark.parametrize('data, expected', [
+    (b'', 0x00000000),
+    (b'123456789', 0xE3069283),
+    (bytes(32), 0x8A9136AA),
+    (b'\xff' * 32, 0x62A8AB43),
+])
+def test_crc32c_known_vectors(crc32c_implementation, data, expected):
+    checksums = UploadChecksums('crc32c')
+
+    checksums.update(data)
+
+    assert checksums.hexdigests['crc32c'] == '{0:08x}'.format(expected)
+    assert checksums.digests['crc32c'] == base64.b64encode(expected.to_bytes(4, 'big')).decode('ascii')
+
+
+def test_crc32c_incremental(crc32c_implementation):
+    checksums = UploadChecksums('crc32c')
+
+    for piece in (b'1', b'2345', b'', b'6789'):
+        checksums.update(piece)
+
+    assert checksums.hexdigests['crc32c'] == 'e3069283'
+
+
+def test_upload_checksums_digests_and_headers():
+    checksums = UploadChecksums(('md5', 'sha256'))
+
+    for offset in range(0, len(DATA), 1000):
+        checksums.update(DATA[offset:offset + 1000])
+
+    assert checksums.size == len(DATA)
+    assert checksums.hexdigests == {
+        'md5': hashlib.md5(DATA).hexdigest(),
+        'sha256': hashlib.sha256(DATA).hexdigest(),
+    }
+    assert checksums.headers() == {
+        'Content-MD5': base64.b64encode(hashlib.md5(DATA).digest()).decode('ascii'),
+        'x-amz-checksum-sha256': base64.b64encode(hashlib.sha256(DATA).digest()).decode('ascii'),
+    }
+
+
+def test_upload_checksums_reset():
+    checksums = UploadChecksums()
+    checksums.update(b'partial')
+
+    checksums.reset()
+    checksums.update(DATA)
+
+    assert checksums.size == len(DATA)
+    assert checksums.hexdigests['md5'] == hashlib.md5(DATA).hexdigest()
+
+
+def test_upload_checksums_unexpected_algorithm():
+    with pytest.raises(ValueError):
+        UploadChecksums('crc64')
+
+
+@pytest.mark.parametrize('etag, expected', [
+    ('"{0}"'.format(hashlib.md5(DATA).hexdigest()), True),
+    (hashlib.md5(DATA).hexdigest().upper(), True),
+    ('"{0}"'.format(hashlib.md5(b'other').hexdigest()), False),
+    ('"{0}-3"'.format(hashlib.md5(DATA).hexdigest()), None),
+    ('W/"{0}"'.format(hashlib.md5(DATA).hexdigest()), None),
+    ('"{0}"'.format('z' * 32), None),
+    (None, None),
+])
+def test_upload_checksums_verify_etag(etag, expected):
+    checksums = UploadChecksums()
+    checksums.update(DATA)
+
+    assert checksums.verify_etag(etag) is expected
+
+
+def test_upload_checksums_verify_etag_without_md5():
+    checksums = UploadChecksums('sha256')
+    checksums.update(DATA)
+
+    assert checksums.verify_etag('"{0}"'.format(hashlib.md5(DATA).hexdigest())) is None
+
+
+def test_checksum_reader_hashes_while_read():
+    checksums = UploadChecksums()
+    reader = ChecksumReader(io.BytesIO(DATA), checksums)
+
+    chunks = list(iter(lambda: reader.read(4096), b''))
+
+    assert b''.join(chunks) == DATA
+    assert checksums.hexdigests['md5'] == hashlib.md5(DATA).hexdigest()
+
+
+def test_checksum_reader_readinto():
+    checksums = UploadChecksums()
+    reader = io.BufferedReader(ChecksumReader(io.BytesIO(DATA), checksums), buffer_size=1000)
+
+    assert reader.read() == DATA
+    assert checksums.size == len(DATA)
+    assert checksums.hexdigests['md5'] == hashlib.md5(DATA).hexdigest()
+
+
+def test_checksum_reader_rewind_restarts():
+    checksums = UploadChecksums()
+    reader = ChecksumReader(io.BytesIO(DATA), checksums)
+
+    reader.read(1000)
+    assert reader.seek(0) == 0
+    assert reader.read() == DATA
+
+    assert checksums.size == len(DATA)
+    assert checksums.hexdigests['md5'] == hashlib.md5(DATA).hexdigest()
+    assert reader.seekable()
+    assert reader.tell() == len(DATA)
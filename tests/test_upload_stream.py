@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import gzip
+import io
+import zlib
+
+import pytest
+
+from pyfortified_requests.support.request_body import RequestBodyRewind
+from pyfortified_requests.support.upload_checksum import UploadChecksums
+from pyfortified_requests.support.upload_stream import (
+    StreamCompressor,
+    UploadChunks,
+)
+
+DATA = b''.join(b'%06d,' % i for i in range(20000))
+
+
+def _pieces(data, size):
+    for offset in range(0, len(data), size):
+        yield data[offset:offset + size]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096, 65536, len(DATA) + 1])
+@pytest.mark.parametrize('piece_size', [3, 1000, 70000])
+def test_upload_chunks_coalesces_and_splits(chunk_size, piece_size):
+    upload_chunks = UploadChunks(_pieces(DATA, piece_size), chunk_size=chunk_size)
+
+    chunks = list(upload_chunks)
+
+    assert b''.join(chunks) == DATA
+    assert all(len(chunk) == chunk_size for chunk in chunks[:-1])
+    assert upload_chunks.bytes_read == upload_chunks.bytes_sent == len(DATA)
+
+
+def test_upload_chunks_str_source():
+    assert b''.join(UploadChunks(['né', 'x'], chunk_size=2)) == 'néx'.encode('utf-8')
+
+
+def test_upload_chunks_gzip():
+    upload_chunks = UploadChunks(io.BytesIO(DATA), chunk_size=1024, compression='gzip')
+
+    assert gzip.decompress(b''.join(upload_chunks)) == DATA
+    assert upload_chunks.bytes_read == len(DATA)
+    assert upload_chunks.compression_ratio < 1
+
+
+def test_upload_chunks_unexpected_compression():
+    with pytest.raises(ValueError):
+        UploadChunks(DATA, compression='lzma')
+
+
+def test_upload_chunks_seekable_source_is_rewound():
+    source = io.BytesIO(b'head' + DATA)
+    source.seek(4)
+    checksums = UploadChecksums()
+    upload_chunks = UploadChunks(source, chunk_size=1000, compression='gzip', checksums=checksums)
+
+    first = b''.join(upload_chunks)
+    digests = checksums.hexdigests
+    second = b''.join(upload_chunks)
+
+    assert upload_chunks.rewindable
+    assert gzip.decompress(first) == gzip.decompress(second) == DATA
+    assert checksums.hexdigests == digests
+    assert upload_chunks.bytes_read == len(DATA)
+    # Sent as is by retries, without a replay buffer.
+    assert RequestBodyRewind(upload_chunks).body is upload_chunks
+
+
+def test_upload_chunks_generator_not_rewindable():
+    upload_chunks = UploadChunks(_pieces(DATA, 100))
+
+    assert not upload_chunks.rewindable
+    assert RequestBodyRewind(upload_chunks).body is not upload_chunks
+
+
+def test_stream_compressor_gzip_single_stream():
+    compressor = StreamCompressor('gzip', level=1)
+    compressed = b''.join(compressor.compress(piece) for piece in _pieces(DATA, 1000)) + compressor.flush()
+
+    assert zlib.decompress(compressed, 16 + zlib.MAX_WBITS) == DATA
+    assert compressor.bytes_in == len(DATA)
+    assert compressor.bytes_out == len(compressed)